@@ -22,7 +22,10 @@ from sqlmodel import SQLModel  # noqa
 from app.core.config.config import settings  # noqa
 from app.domain.entities.db.user import User  # noqa 
 from app.domain.entities.db.yc_company import YCCompany  # noqa
+from app.domain.entities.db.yc_company_change import YCCompanyChange  # noqa
+from app.domain.entities.db.yc_company_founder import YCCompanyFounder  # noqa
 from app.domain.entities.db.yc_founder import YCFounder  # noqa
+from app.domain.entities.db.yc_sync_run import YCSyncRun  # noqa
 from app.domain.entities.db.yc_sync_state import YCSyncState  # noqa
 
 target_metadata = SQLModel.metadata
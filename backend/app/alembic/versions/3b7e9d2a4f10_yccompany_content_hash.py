@@ -0,0 +1,35 @@
+"""YC company content hash + sync diff counters
+
+Revision ID: 3b7e9d2a4f10
+Revises: c1f2a3b4c5d6
+Create Date: 2026-02-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "3b7e9d2a4f10"
+down_revision = "c1f2a3b4c5d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "yccompany",
+        sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+    )
+    op.add_column("ycsyncstate", sa.Column("last_inserted_count", sa.Integer(), nullable=True))
+    op.add_column("ycsyncstate", sa.Column("last_changed_count", sa.Integer(), nullable=True))
+    op.add_column("ycsyncstate", sa.Column("last_unchanged_count", sa.Integer(), nullable=True))
+    op.add_column("ycsyncstate", sa.Column("last_disappeared_count", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("ycsyncstate", "last_disappeared_count")
+    op.drop_column("ycsyncstate", "last_unchanged_count")
+    op.drop_column("ycsyncstate", "last_changed_count")
+    op.drop_column("ycsyncstate", "last_inserted_count")
+    op.drop_column("yccompany", "content_hash")
@@ -0,0 +1,45 @@
+"""YC founder stable key for per-company reconciliation
+
+Revision ID: 5d1c8e7f2a93
+Revises: 3b7e9d2a4f10
+Create Date: 2026-02-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "5d1c8e7f2a93"
+down_revision = "3b7e9d2a4f10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "ycfounder",
+        sa.Column("founder_key", sqlmodel.sql.sqltypes.AutoString(length=32), nullable=True),
+    )
+    # Same formula as app.infrastructure.yc.rows.founder_key
+    op.execute(
+        "UPDATE ycfounder SET founder_key = "
+        "md5(lower(btrim(name)) || '|' || coalesce(yc_profile_url, ''))"
+    )
+    op.execute(
+        "DELETE FROM ycfounder a USING ycfounder b "
+        "WHERE a.company_id = b.company_id AND a.founder_key = b.founder_key "
+        "AND (a.sort_order, a.id) > (b.sort_order, b.id)"
+    )
+    op.alter_column("ycfounder", "founder_key", nullable=False)
+    op.create_index(
+        "ix_ycfounder_company_id_founder_key",
+        "ycfounder",
+        ["company_id", "founder_key"],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_ycfounder_company_id_founder_key", table_name="ycfounder")
+    op.drop_column("ycfounder", "founder_key")
@@ -0,0 +1,31 @@
+"""YC sync state: worker status and founders crawl progress
+
+Revision ID: 7e4a2c9b1d05
+Revises: 5d1c8e7f2a93
+Create Date: 2026-02-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "7e4a2c9b1d05"
+down_revision = "5d1c8e7f2a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "ycsyncstate",
+        sa.Column("status", sqlmodel.sql.sqltypes.AutoString(length=16), nullable=True),
+    )
+    op.add_column("ycsyncstate", sa.Column("progress_done", sa.Integer(), nullable=True))
+    op.add_column("ycsyncstate", sa.Column("progress_total", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("ycsyncstate", "progress_total")
+    op.drop_column("ycsyncstate", "progress_done")
+    op.drop_column("ycsyncstate", "status")
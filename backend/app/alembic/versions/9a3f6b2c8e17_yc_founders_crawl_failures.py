@@ -0,0 +1,36 @@
+"""YC founders crawl failures per company
+
+Revision ID: 9a3f6b2c8e17
+Revises: 7e4a2c9b1d05
+Create Date: 2026-02-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "9a3f6b2c8e17"
+down_revision = "7e4a2c9b1d05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "yccompany",
+        sa.Column("founders_failures", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("yccompany", sa.Column("founders_failed_at", sa.DateTime(), nullable=True))
+    op.add_column(
+        "yccompany",
+        sa.Column("founders_error", sqlmodel.sql.sqltypes.AutoString(length=512), nullable=True),
+    )
+    op.add_column("ycsyncstate", sa.Column("last_founders_failed_count", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("ycsyncstate", "last_founders_failed_count")
+    op.drop_column("yccompany", "founders_error")
+    op.drop_column("yccompany", "founders_failed_at")
+    op.drop_column("yccompany", "founders_failures")
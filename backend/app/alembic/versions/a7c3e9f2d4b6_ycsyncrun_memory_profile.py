@@ -0,0 +1,24 @@
+"""YC sync run: memory profile
+
+Revision ID: a7c3e9f2d4b6
+Revises: f1c6a8e3b5d2
+Create Date: 2026-02-23
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "a7c3e9f2d4b6"
+down_revision = "f1c6a8e3b5d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("ycsyncrun", sa.Column("memory_profile", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade():
+    op.drop_column("ycsyncrun", "memory_profile")
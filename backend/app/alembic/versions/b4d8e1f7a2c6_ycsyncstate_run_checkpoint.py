@@ -0,0 +1,34 @@
+"""YC sync state: resumable run checkpoint
+
+Revision ID: b4d8e1f7a2c6
+Revises: 9a3f6b2c8e17
+Create Date: 2026-02-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "b4d8e1f7a2c6"
+down_revision = "9a3f6b2c8e17"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("ycsyncstate", sa.Column("run_id", sa.Uuid(), nullable=True))
+    op.add_column(
+        "ycsyncstate",
+        sa.Column("run_phase", sqlmodel.sql.sqltypes.AutoString(length=16), nullable=True),
+    )
+    op.add_column(
+        "ycsyncstate",
+        sa.Column("run_cursor", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("ycsyncstate", "run_cursor")
+    op.drop_column("ycsyncstate", "run_phase")
+    op.drop_column("ycsyncstate", "run_id")
@@ -0,0 +1,135 @@
+"""YC founders: one row per person, linked to their companies
+
+Revision ID: b5e1d7a3c8f4
+Revises: a7c3e9f2d4b6
+Create Date: 2026-02-24
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "b5e1d7a3c8f4"
+down_revision = "a7c3e9f2d4b6"
+branch_labels = None
+depends_on = None
+
+
+def _canonical_url(column: str) -> str:
+    return (
+        f"rtrim(regexp_replace(regexp_replace(lower(btrim({column})), "
+        r"'^https?://(www\.)?', ''), '[?#].*$', ''), '/')"
+    )
+
+
+# Same formula as app.infrastructure.yc.rows.founder_identity_key. "\:" keeps
+# text() from reading ":twitter" as a bind parameter.
+SET_IDENTITY_KEY = rf"""
+    UPDATE ycfounder f SET
+        identity_key = md5(CASE
+            WHEN k.profile <> '' THEN 'profile|' || k.profile
+            WHEN k.handle IS NOT NULL THEN 'name|' || lower(btrim(f.name)) || '|' || k.handle
+            ELSE 'company|' || f.company_id::text || '|' || lower(btrim(f.name))
+        END),
+        updated_at = f.created_at
+    FROM (
+        SELECT
+            id,
+            {_canonical_url("yc_profile_url")} AS profile,
+            coalesce(
+                'linkedin:' || substring({_canonical_url("linkedin_url")} from '^(?:[a-z]+\.)?linkedin\.com/in/([^/]+)'),
+                'x:' || substring({_canonical_url("twitter_url")} from '^(?\:twitter|x)\.com/([^/]+)')
+            ) AS handle
+        FROM ycfounder
+    ) k
+    WHERE k.id = f.id
+"""
+
+
+def upgrade():
+    op.create_table(
+        "yccompanyfounder",
+        sa.Column("company_id", sa.Uuid(), nullable=False),
+        sa.Column("founder_key", sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+        sa.Column("founder_id", sa.Uuid(), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.Column("role", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+        sa.ForeignKeyConstraint(["company_id"], ["yccompany.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["founder_id"], ["ycfounder.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "founder_key"),
+    )
+    op.create_index(op.f("ix_yccompanyfounder_founder_id"), "yccompanyfounder", ["founder_id"], unique=False)
+
+    op.add_column("ycfounder", sa.Column("identity_key", sqlmodel.sql.sqltypes.AutoString(length=32), nullable=True))
+    op.add_column("ycfounder", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute(SET_IDENTITY_KEY)
+    # The most recently created row of each person becomes the founder; every
+    # row becomes a link to it.
+    op.execute(
+        """
+        INSERT INTO yccompanyfounder (company_id, founder_key, founder_id, sort_order, role)
+        SELECT f.company_id, f.founder_key, person.id, f.sort_order, f.role
+        FROM ycfounder f
+        JOIN (
+            SELECT DISTINCT ON (identity_key) identity_key, id
+            FROM ycfounder
+            ORDER BY identity_key, created_at DESC, id
+        ) person USING (identity_key)
+        """
+    )
+    op.execute(
+        "DELETE FROM ycfounder f WHERE NOT EXISTS "
+        "(SELECT 1 FROM yccompanyfounder l WHERE l.founder_id = f.id)"
+    )
+
+    op.drop_index("ix_ycfounder_company_id_founder_key", table_name="ycfounder")
+    op.drop_index(op.f("ix_ycfounder_company_id"), table_name="ycfounder")
+    op.drop_index(op.f("ix_ycfounder_sort_order"), table_name="ycfounder")
+    op.drop_column("ycfounder", "company_id")
+    op.drop_column("ycfounder", "founder_key")
+    op.drop_column("ycfounder", "sort_order")
+    op.drop_column("ycfounder", "role")
+    op.alter_column("ycfounder", "identity_key", nullable=False)
+    op.alter_column("ycfounder", "updated_at", nullable=False)
+    op.create_index(op.f("ix_ycfounder_identity_key"), "ycfounder", ["identity_key"], unique=True)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_ycfounder_identity_key"), table_name="ycfounder")
+    op.add_column("ycfounder", sa.Column("company_id", sa.Uuid(), nullable=True))
+    op.add_column("ycfounder", sa.Column("founder_key", sqlmodel.sql.sqltypes.AutoString(length=32), nullable=True))
+    op.add_column("ycfounder", sa.Column("sort_order", sa.Integer(), nullable=True))
+    op.add_column("ycfounder", sa.Column("role", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+    # A row per company again.
+    op.execute(
+        """
+        INSERT INTO ycfounder (
+            id, company_id, founder_key, sort_order, role, identity_key,
+            name, bio, yc_profile_url, twitter_url, linkedin_url, avatar_url, created_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(), l.company_id, l.founder_key, l.sort_order, l.role, f.identity_key,
+            f.name, f.bio, f.yc_profile_url, f.twitter_url, f.linkedin_url, f.avatar_url, f.created_at, f.updated_at
+        FROM yccompanyfounder l
+        JOIN ycfounder f ON f.id = l.founder_id
+        """
+    )
+    op.drop_table("yccompanyfounder")
+    op.execute("DELETE FROM ycfounder WHERE company_id IS NULL")
+    op.drop_column("ycfounder", "identity_key")
+    op.drop_column("ycfounder", "updated_at")
+    op.alter_column("ycfounder", "company_id", nullable=False)
+    op.alter_column("ycfounder", "founder_key", nullable=False)
+    op.alter_column("ycfounder", "sort_order", nullable=False)
+    op.create_foreign_key(
+        "ycfounder_company_id_fkey", "ycfounder", "yccompany", ["company_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_index(op.f("ix_ycfounder_company_id"), "ycfounder", ["company_id"], unique=False)
+    op.create_index(op.f("ix_ycfounder_sort_order"), "ycfounder", ["sort_order"], unique=False)
+    op.create_index(
+        "ix_ycfounder_company_id_founder_key",
+        "ycfounder",
+        ["company_id", "founder_key"],
+        unique=True,
+    )
@@ -0,0 +1,50 @@
+"""YC sync run history
+
+Revision ID: c7e2f5a9d3b8
+Revises: b4d8e1f7a2c6
+Create Date: 2026-02-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "c7e2f5a9d3b8"
+down_revision = "b4d8e1f7a2c6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "ycsyncrun",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("run_id", sa.Uuid(), nullable=True),
+        sa.Column("resumed", sa.Boolean(), nullable=False),
+        sa.Column("status", sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+        sa.Column("error", sqlmodel.sql.sqltypes.AutoString(length=2048), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=False),
+        sa.Column("download_seconds", sa.Float(), nullable=False),
+        sa.Column("parse_seconds", sa.Float(), nullable=False),
+        sa.Column("company_upsert_seconds", sa.Float(), nullable=False),
+        sa.Column("founder_crawl_seconds", sa.Float(), nullable=False),
+        sa.Column("pages_fetched", sa.Integer(), nullable=False),
+        sa.Column("pages_not_modified", sa.Integer(), nullable=False),
+        sa.Column("pages_failed", sa.Integer(), nullable=False),
+        sa.Column("bytes_downloaded", sa.BigInteger(), nullable=False),
+        sa.Column("companies_parsed", sa.Integer(), nullable=False),
+        sa.Column("founders_parsed", sa.Integer(), nullable=False),
+        sa.Column("company_rows_written", sa.Integer(), nullable=False),
+        sa.Column("founder_rows_written", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_ycsyncrun_run_id"), "ycsyncrun", ["run_id"], unique=False)
+    op.create_index(op.f("ix_ycsyncrun_started_at"), "ycsyncrun", ["started_at"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_ycsyncrun_started_at"), table_name="ycsyncrun")
+    op.drop_index(op.f("ix_ycsyncrun_run_id"), table_name="ycsyncrun")
+    op.drop_table("ycsyncrun")
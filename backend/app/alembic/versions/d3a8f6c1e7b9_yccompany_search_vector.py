@@ -0,0 +1,42 @@
+"""YC company full-text search vector and GIN index
+
+Revision ID: d3a8f6c1e7b9
+Revises: b5e1d7a3c8f4
+Create Date: 2026-02-25
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "d3a8f6c1e7b9"
+down_revision = "b5e1d7a3c8f4"
+branch_labels = None
+depends_on = None
+
+# Copied from app.domain.entities.db.yc_company.SEARCH_VECTOR as of this revision.
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(one_liner, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(long_description, '')), 'C')"
+)
+
+
+def upgrade():
+    op.add_column(
+        "yccompany",
+        sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True),
+    )
+    op.create_index(
+        "ix_yccompany_search_vector",
+        "yccompany",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    op.drop_index("ix_yccompany_search_vector", table_name="yccompany")
+    op.drop_column("yccompany", "search_vector")
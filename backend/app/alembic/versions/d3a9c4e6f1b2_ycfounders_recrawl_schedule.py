@@ -0,0 +1,41 @@
+"""YC founders re-crawl schedule per company
+
+Revision ID: d3a9c4e6f1b2
+Revises: c7e2f5a9d3b8
+Create Date: 2026-02-20
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d3a9c4e6f1b2"
+down_revision = "c7e2f5a9d3b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("yccompany", sa.Column("founders_crawled_at", sa.DateTime(), nullable=True))
+    op.add_column("yccompany", sa.Column("founders_changed_at", sa.DateTime(), nullable=True))
+    op.add_column(
+        "yccompany",
+        sa.Column("founders_unchanged_crawls", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("yccompany", sa.Column("founders_hash", sa.String(length=64), nullable=True))
+    # Until now every successful sync crawled every company, so companies that
+    # did not fail were last crawled by the last successful sync.
+    op.execute(
+        """
+        UPDATE yccompany SET founders_crawled_at = s.last_success_at
+        FROM ycsyncstate s
+        WHERE s.source = 'yc_directory' AND yccompany.founders_failed_at IS NULL
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("yccompany", "founders_hash")
+    op.drop_column("yccompany", "founders_unchanged_crawls")
+    op.drop_column("yccompany", "founders_changed_at")
+    op.drop_column("yccompany", "founders_crawled_at")
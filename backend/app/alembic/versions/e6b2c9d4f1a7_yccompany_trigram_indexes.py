@@ -0,0 +1,33 @@
+"""YC company trigram indexes on name and slug for fuzzy search
+
+Revision ID: e6b2c9d4f1a7
+Revises: d3a8f6c1e7b9
+Create Date: 2026-02-26
+
+"""
+from alembic import op
+
+
+revision = "e6b2c9d4f1a7"
+down_revision = "d3a8f6c1e7b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in ("name", "slug"):
+        op.create_index(
+            f"ix_yccompany_{column}_trgm",
+            "yccompany",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    for column in ("name", "slug"):
+        op.drop_index(f"ix_yccompany_{column}_trgm", table_name="yccompany")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
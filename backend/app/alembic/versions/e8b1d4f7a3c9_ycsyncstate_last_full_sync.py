@@ -0,0 +1,25 @@
+"""YC sync state: last full directory reconciliation
+
+Revision ID: e8b1d4f7a3c9
+Revises: d3a9c4e6f1b2
+Create Date: 2026-02-21
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e8b1d4f7a3c9"
+down_revision = "d3a9c4e6f1b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("ycsyncstate", sa.Column("last_full_sync_at", sa.DateTime(), nullable=True))
+    # Every sync so far ingested the whole of all.json.
+    op.execute("UPDATE ycsyncstate SET last_full_sync_at = last_success_at")
+
+
+def downgrade():
+    op.drop_column("ycsyncstate", "last_full_sync_at")
@@ -0,0 +1,62 @@
+"""YC company change log and removed companies
+
+Revision ID: f1c6a8e3b5d2
+Revises: e8b1d4f7a3c9
+Create Date: 2026-02-22
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+revision = "f1c6a8e3b5d2"
+down_revision = "e8b1d4f7a3c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Standalone rather than owned by the table: shadow-table swaps move the
+    # table between schemas, and would move or drop an owned sequence with it.
+    op.execute("CREATE SEQUENCE yccompanychange_version_seq")
+    op.create_table(
+        "yccompanychange",
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('yccompanychange_version_seq')"),
+            nullable=False,
+        ),
+        sa.Column("yc_id", sa.Integer(), nullable=False),
+        sa.Column("company_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("version"),
+    )
+    op.create_index(op.f("ix_yccompanychange_yc_id"), "yccompanychange", ["yc_id"], unique=False)
+    op.create_index(op.f("ix_yccompanychange_changed_at"), "yccompanychange", ["changed_at"], unique=False)
+    op.add_column("yccompany", sa.Column("removed_at", sa.DateTime(), nullable=True))
+    op.create_index(op.f("ix_yccompany_removed_at"), "yccompany", ["removed_at"], unique=False)
+    op.add_column(
+        "ycsyncstate",
+        sa.Column("change_log_floor", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    # Seed the log with the current directory, so clients can build a local
+    # copy from version 0.
+    op.execute(
+        """
+        INSERT INTO yccompanychange (yc_id, company_id, kind, changed_at)
+        SELECT yc_id, id, 'added', now() AT TIME ZONE 'utc' FROM yccompany ORDER BY yc_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("ycsyncstate", "change_log_floor")
+    op.drop_index(op.f("ix_yccompany_removed_at"), table_name="yccompany")
+    op.drop_column("yccompany", "removed_at")
+    op.drop_index(op.f("ix_yccompanychange_changed_at"), table_name="yccompanychange")
+    op.drop_index(op.f("ix_yccompanychange_yc_id"), table_name="yccompanychange")
+    op.drop_table("yccompanychange")
+    op.execute("DROP SEQUENCE yccompanychange_version_seq")
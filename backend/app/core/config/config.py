@@ -42,6 +42,80 @@ class Settings(BaseSettings):
 
     # YC directory auto‑sync interval in days
     YC_AUTO_SYNC_DAYS: int = 5
+    # On-disk ETag/Last-Modified cache for the YC sync fetcher
+    YC_HTTP_CACHE_DIR: str = ".cache/yc_http"
+    # Decode all.json incrementally instead of loading the whole body
+    YC_SYNC_STREAMING: bool = True
+    # "insert": multi-row INSERT ... ON CONFLICT; "copy": COPY into staging + set-based merge
+    YC_SYNC_LOADER: Literal["insert", "copy"] = "insert"
+    # "all": ingest all.json every run; "batches": fetch the per-batch feeds in
+    # parallel and re-ingest only the batches that changed, falling back to
+    # all.json for a full reconciliation every YC_SYNC_FULL_RECONCILE_HOURS
+    YC_SYNC_FEED_MODE: Literal["all", "batches"] = "all"
+    YC_SYNC_FULL_RECONCILE_HOURS: int = 24
+    YC_SYNC_BATCH_FETCH_CONCURRENCY: int = 8
+    # Load each sync into shadow tables and swap them in when it completes,
+    # keeping the replaced tables for rollback (instead of writing in place)
+    YC_SYNC_SWAP: bool = False
+    # Minimum pg_trgm similarity of a company's name or slug to `q` in fuzzy search
+    YC_SEARCH_FUZZY_THRESHOLD: float = 0.3
+    # Company list counts are cached per filters and directory version for this long
+    YC_COUNT_CACHE_TTL_SECONDS: int = 86400
+    # Searches (`q`) the planner expects to match more companies than this get the
+    # estimate as their count instead of an exact count
+    YC_COUNT_EXACT_LIMIT: int = 10000
+    # Days the per-company change log behind /yc/companies/changes is kept
+    YC_CHANGE_LOG_RETENTION_DAYS: int = 90
+    # Distributed sync lock lifetime; the worker renews it every third of this
+    YC_SYNC_LOCK_TTL_SECONDS: int = 120
+    # Port the sync worker serves its Prometheus metrics on (0: disabled)
+    YC_SYNC_METRICS_PORT: int = 9108
+    # Record RSS and tracemalloc readings at the sync's stage boundaries, with the
+    # top allocation sites, on each YCSyncRun row; tracing slows the sync down
+    YC_SYNC_PROFILE_MEMORY: bool = False
+    YC_SYNC_PROFILE_TOP_SITES: int = 10
+    # Upstream traffic of the YC sync: "live", "record" (live, archived to
+    # YC_SYNC_SOURCE_ARCHIVE) or "replay" (served from that archive, offline)
+    YC_SYNC_SOURCE_MODE: Literal["live", "record", "replay"] = "live"
+    YC_SYNC_SOURCE_ARCHIVE: str = ".cache/yc_source.zip"
+    # Replay only: seconds added to every response, and the share of founders
+    # page requests answered with a 503 or a timeout instead
+    YC_SYNC_REPLAY_LATENCY_SECONDS: float = 0.0
+    YC_SYNC_REPLAY_ERROR_RATE: float = 0.0
+    YC_SYNC_REPLAY_TIMEOUT_RATE: float = 0.0
+    # Founders crawl pipeline: workers per stage, queue bound between stages,
+    # and DB write batching (companies per transaction / max seconds a result waits)
+    YC_FOUNDERS_FETCH_CONCURRENCY: int = 15
+    YC_FOUNDERS_PARSE_CONCURRENCY: int = 1
+    YC_FOUNDERS_QUEUE_SIZE: int = 100
+    YC_FOUNDERS_WRITE_BATCH_SIZE: int = 50
+    YC_FOUNDERS_WRITE_INTERVAL_SECONDS: float = 2.0
+    # Parse founders pages in this many worker processes (0: on the event loop),
+    # submitting pages to the pool in chunks of YC_FOUNDERS_PARSE_CHUNK_SIZE
+    YC_FOUNDERS_PARSE_PROCESSES: int = 0
+    YC_FOUNDERS_PARSE_CHUNK_SIZE: int = 8
+    # Founders page requests per host adapt (AIMD) between the minimum and
+    # YC_FOUNDERS_FETCH_CONCURRENCY, backing off when smoothed latency exceeds
+    # the target or the smoothed error rate exceeds the maximum
+    YC_FOUNDERS_FETCH_MIN_CONCURRENCY: int = 1
+    YC_FOUNDERS_FETCH_INITIAL_CONCURRENCY: int = 4
+    YC_FOUNDERS_TARGET_LATENCY_SECONDS: float = 2.0
+    YC_FOUNDERS_MAX_ERROR_RATE: float = 0.05
+    # Per-request timeout, attempts per page, longest backoff / Retry-After
+    # honoured, and failed requests per run before the founders crawl stops
+    YC_FOUNDERS_TIMEOUT_SECONDS: float = 30.0
+    YC_FOUNDERS_MAX_ATTEMPTS: int = 4
+    YC_FOUNDERS_MAX_RETRY_DELAY_SECONDS: float = 60.0
+    YC_FOUNDERS_ERROR_BUDGET: int = 200
+    # Founders re-crawl scheduling: pages per run (0: every due company), the
+    # longest founders may go without a re-crawl, and the re-crawl interval of
+    # active / recent-batch companies, doubled per crawl that found no change up
+    # to the long-tail interval every other company gets
+    YC_FOUNDERS_CRAWL_BUDGET: int = 1500
+    YC_FOUNDERS_SLA_DAYS: int = 30
+    YC_FOUNDERS_ACTIVE_INTERVAL_DAYS: int = 3
+    YC_FOUNDERS_LONG_TAIL_INTERVAL_DAYS: int = 21
+    YC_FOUNDERS_RECENT_YEARS: int = 3
 
     RATE_LIMIT_PER_ROUTE: str = "3/second"
     RATE_LIMIT_GLOBAL: str = "10/second"
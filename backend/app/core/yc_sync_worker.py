@@ -0,0 +1,131 @@
+"""YC directory sync worker.
+
+Runs outside the API processes: takes jobs queued by the API (admin "sync now"
+and the stale-data auto sync), holds the cluster-wide sync lock while a sync
+runs and records progress on YCSyncState. Sync metrics are served for
+Prometheus on YC_SYNC_METRICS_PORT.
+
+    python app/core/yc_sync_worker.py
+"""
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+from typing import Any
+
+from prometheus_client import start_http_server
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError, RedisError
+
+from app.core.config.config import settings
+from app.infrastructure.persistence.postgres.session import AsyncSessionLocal
+from app.infrastructure.redis.yc_sync_queue import (
+    RedisYCSyncQueue,
+    YCSyncJob,
+    yc_sync_queue,
+)
+from app.infrastructure.yc.sync import sync_yc_directory
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEQUEUE_TIMEOUT_SECONDS = 5
+HEARTBEAT_SECONDS = 10
+ERROR_BACKOFF_SECONDS = 5
+
+
+async def run_job(queue: RedisYCSyncQueue, job: YCSyncJob) -> None:
+    """Run one sync under the distributed lock, renewing it while the sync runs."""
+    lock = queue.lock()
+    await lock.acquire()
+    try:
+        await queue.mark_started(job)
+        logger.info("YC sync job %s (%s) started", job.id, job.reason)
+        sync_task = asyncio.create_task(_sync())
+        renew_task = asyncio.create_task(_renew_lock(lock, sync_task))
+        try:
+            count = await sync_task
+            logger.info("YC sync job %s finished: %d companies", job.id, count)
+        except asyncio.CancelledError:
+            if not renew_task.done():
+                raise
+            logger.error("YC sync job %s aborted: sync lock lost", job.id)
+        except Exception:
+            logger.exception("YC sync job %s failed", job.id)
+        finally:
+            renew_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renew_task
+    finally:
+        with contextlib.suppress(LockError):
+            await lock.release()
+
+
+async def _sync() -> int:
+    async with AsyncSessionLocal() as session:
+        return await sync_yc_directory(session)
+
+
+async def _renew_lock(lock: Lock, sync_task: asyncio.Task[Any]) -> None:
+    interval = settings.YC_SYNC_LOCK_TTL_SECONDS / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await lock.reacquire()
+        except (LockError, RedisError) as e:
+            logger.error("Could not renew YC sync lock: %s", e)
+            sync_task.cancel()
+            return
+
+
+async def _heartbeat(queue: RedisYCSyncQueue, worker_id: str) -> None:
+    while True:
+        try:
+            await queue.heartbeat(worker_id, ttl_seconds=HEARTBEAT_SECONDS * 3)
+        except RedisError as e:
+            logger.warning("YC sync worker heartbeat failed: %s", e)
+        await asyncio.sleep(HEARTBEAT_SECONDS)
+
+
+async def serve(queue: RedisYCSyncQueue, stop: asyncio.Event) -> None:
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    await queue.heartbeat(worker_id, ttl_seconds=HEARTBEAT_SECONDS * 3)
+    heartbeat_task = asyncio.create_task(_heartbeat(queue, worker_id))
+    logger.info("YC sync worker %s waiting for jobs", worker_id)
+    try:
+        while not stop.is_set():
+            try:
+                job = await queue.dequeue(worker_id, timeout=DEQUEUE_TIMEOUT_SECONDS)
+                if job is None:
+                    await queue.requeue_orphans()
+                    continue
+                await run_job(queue, job)
+                await queue.ack(worker_id, job)
+            except RedisError as e:
+                logger.warning("YC sync worker Redis error: %s", e)
+                await asyncio.sleep(ERROR_BACKOFF_SECONDS)
+    finally:
+        heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await heartbeat_task
+
+
+async def main_async() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    if settings.YC_SYNC_METRICS_PORT:
+        # Same default registry the API exposes at /metrics; scraped separately.
+        start_http_server(settings.YC_SYNC_METRICS_PORT)
+    await serve(yc_sync_queue, stop)
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlmodel import Field, SQLModel
 
+# Full-text search document: name outranks one_liner, which outranks long_description
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(one_liner, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(long_description, '')), 'C')"
+)
+
 
 class YCCompany(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
@@ -39,7 +47,28 @@ class YCCompany(SQLModel, table=True):
     regions: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
     tags: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
 
+    # Generated by Postgres (GIN-indexed as ix_yccompany_search_vector); never written
+    search_vector: str | None = Field(
+        default=None, sa_column=Column(TSVECTOR, Computed(SEARCH_VECTOR, persisted=True))
+    )
+
     launched_at: int | None = Field(default=None, index=True)
+    content_hash: str | None = Field(default=None, max_length=64)
+    # Founders page crawl failures since the last successful crawl; such
+    # companies keep their stored founders and are crawled first next run
+    founders_failures: int = Field(default=0)
+    founders_failed_at: datetime | None = Field(default=None)
+    founders_error: str | None = Field(default=None, max_length=512)
+    # Re-crawl scheduling: last successful crawl, last crawl that changed the
+    # founders, and successful crawls since then (see yc/recrawl.py)
+    founders_crawled_at: datetime | None = Field(default=None)
+    founders_changed_at: datetime | None = Field(default=None)
+    founders_unchanged_crawls: int = Field(default=0)
+    # Hash of the founders the last crawl found, to tell whether the next one changed them
+    founders_hash: str | None = Field(default=None, max_length=64)
+    # Set while the company is missing from the feed; such companies are hidden
+    # and no longer crawled, and come back if the feed lists them again
+    removed_at: datetime | None = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
     updated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
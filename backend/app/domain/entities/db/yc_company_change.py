@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, Sequence
+from sqlmodel import Field, SQLModel
+
+# Not owned by the table, so shadow-table swaps neither move nor drop it.
+VERSION_SEQ = Sequence("yccompanychange_version_seq", metadata=SQLModel.metadata)
+
+
+# One entry of the YC directory change log (see yc/changes.py).
+class YCCompanyChange(SQLModel, table=True):
+    # Position in the log; the highest one is the directory version
+    version: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, VERSION_SEQ, server_default=VERSION_SEQ.next_value(), primary_key=True),
+    )
+    yc_id: int = Field(index=True)
+    company_id: uuid.UUID
+    # "added" | "updated" | "removed"
+    kind: str = Field(max_length=16)
+    changed_at: datetime = Field(index=True)
@@ -0,0 +1,22 @@
+import uuid
+
+from sqlmodel import Field, SQLModel
+
+
+# A founder's place on a company's page.
+class YCCompanyFounder(SQLModel, table=True):
+    company_id: uuid.UUID = Field(
+        foreign_key="yccompany.id",
+        primary_key=True,
+        ondelete="CASCADE",
+    )
+    # md5(lower(name) | yc_profile_url): stable identity of a founder within a company
+    founder_key: str = Field(max_length=32, primary_key=True)
+    founder_id: uuid.UUID = Field(
+        foreign_key="ycfounder.id",
+        nullable=False,
+        index=True,
+        ondelete="CASCADE",
+    )
+    sort_order: int = Field(default=0)
+    role: str | None = Field(default=None, max_length=64)
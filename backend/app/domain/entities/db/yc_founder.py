@@ -4,19 +4,15 @@ from datetime import datetime
 from sqlmodel import Field, SQLModel
 
 
+# A person, deduplicated across the companies they founded (see YCCompanyFounder).
 class YCFounder(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
-    company_id: uuid.UUID = Field(
-        foreign_key="yccompany.id",
-        nullable=False,
-        index=True,
-        ondelete="CASCADE",
-    )
-    sort_order: int = Field(default=0, index=True)
+    # md5 of the canonical YC profile URL, else of lower(name) and a LinkedIn / X
+    # handle, else of the company and lower(name) (see rows.founder_identity_key)
+    identity_key: str = Field(max_length=32, unique=True, index=True)
 
     name: str = Field(max_length=255, index=True)
-    role: str | None = Field(default=None, max_length=64)
     bio: str | None = Field(default=None)
 
     yc_profile_url: str | None = Field(default=None, max_length=2048)
@@ -26,4 +22,4 @@ class YCFounder(SQLModel, table=True):
     avatar_url: str | None = Field(default=None, max_length=2048)
 
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+# Telemetry of one sync attempt; a resumed run gets a row per attempt.
+class YCSyncRun(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # YCSyncState.run_id of the run this attempt belongs to
+    run_id: uuid.UUID | None = Field(default=None, index=True)
+    resumed: bool = Field(default=False)
+    status: str = Field(max_length=16)
+    error: str | None = Field(default=None, max_length=2048)
+    started_at: datetime = Field(index=True)
+    finished_at: datetime
+
+    download_seconds: float = Field(default=0.0)
+    parse_seconds: float = Field(default=0.0)
+    company_upsert_seconds: float = Field(default=0.0)
+    founder_crawl_seconds: float = Field(default=0.0)
+
+    pages_fetched: int = Field(default=0)
+    pages_not_modified: int = Field(default=0)
+    pages_failed: int = Field(default=0)
+    bytes_downloaded: int = Field(default=0, sa_type=BigInteger)
+    companies_parsed: int = Field(default=0)
+    founders_parsed: int = Field(default=0)
+    company_rows_written: int = Field(default=0)
+    founder_rows_written: int = Field(default=0)
+
+    # Per-stage RSS / tracemalloc readings and top allocation sites, when the
+    # run was memory-profiled (see app.infrastructure.yc.memory_profile)
+    memory_profile: dict[str, Any] | None = Field(default=None, sa_column=Column(JSONB))
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 
+from sqlalchemy import BigInteger
 from sqlmodel import Field, SQLModel
 
 
@@ -12,4 +13,28 @@ class YCSyncState(SQLModel, table=True):
     last_success_at: datetime | None = Field(default=None)
     last_error: str | None = Field(default=None, max_length=2048)
     last_item_count: int | None = Field(default=None)
+    last_inserted_count: int | None = Field(default=None)
+    last_changed_count: int | None = Field(default=None)
+    last_unchanged_count: int | None = Field(default=None)
+    last_disappeared_count: int | None = Field(default=None)
+    # Last feed phase that ingested the whole directory (all.json) rather than
+    # only the YC batches whose feeds changed
+    last_full_sync_at: datetime | None = Field(default=None)
+    # Lowest directory version the change log can still serve changes after
+    # (see yc/changes.py)
+    change_log_floor: int = Field(default=0, sa_type=BigInteger)
 
+    # "running" | "succeeded" | "failed" | "abandoned", written by the sync worker
+    status: str | None = Field(default=None, max_length=16)
+    # Checkpoint of the current or interrupted run: phase "feed" | "founders"
+    # and the crawl-order cursor up to which every company's founders are
+    # written. The phase is cleared once the run finishes or is abandoned;
+    # until then the next sync resumes the run instead of starting over.
+    run_id: uuid.UUID | None = Field(default=None)
+    run_phase: str | None = Field(default=None, max_length=16)
+    run_cursor: str | None = Field(default=None, max_length=64)
+    # Companies whose founders page has been crawled in the current/last run
+    progress_done: int | None = Field(default=None)
+    progress_total: int | None = Field(default=None)
+    # Companies whose founders page could not be fetched or parsed in the last run
+    last_founders_failed_count: int | None = Field(default=None)
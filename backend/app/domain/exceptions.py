@@ -35,3 +35,39 @@ class AdminCannotBeDeletedError(DomainException):
     """Admin is not allowed to delete their own account."""
 
     pass
+
+
+class YCSyncRunNotFoundError(DomainException):
+    """No unfinished YC sync run to resume or abandon."""
+
+    pass
+
+
+class YCSyncInProgressError(DomainException):
+    """A YC sync is running right now."""
+
+    pass
+
+
+class YCDirectorySnapshotNotFoundError(DomainException):
+    """No previous YC directory snapshot to roll back to."""
+
+    pass
+
+
+class YCChangeLogExpiredError(DomainException):
+    """The YC change log no longer covers the requested directory version."""
+
+    pass
+
+
+class YCFounderNotFoundError(DomainException):
+    """YC founder not found."""
+
+    pass
+
+
+class YCInvalidCursorError(DomainException):
+    """The company list cursor is malformed or belongs to a different search."""
+
+    pass
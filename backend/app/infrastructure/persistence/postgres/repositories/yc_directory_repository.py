@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import json
+import re
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import ColumnElement, and_, select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import defer
+from sqlalchemy.orm import aliased, defer
 
-from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company import SEARCH_CONFIG, YCCompany
+from app.domain.entities.db.yc_company_change import YCCompanyChange
+from app.domain.entities.db.yc_company_founder import YCCompanyFounder
 from app.domain.entities.db.yc_founder import YCFounder
+from app.domain.entities.db.yc_sync_run import YCSyncRun
 from app.domain.entities.db.yc_sync_state import YCSyncState
-from app.infrastructure.yc.sync import sync_yc_directory
-from app.use_cases.ports.yc_directory_repository import IYCDirectoryRepository, YCSearchFilters
+from app.infrastructure.yc.changes import REMOVED, directory_version, reset_change_log
+from app.infrastructure.yc.shadow import rollback_swap
+from app.use_cases.ports.yc_directory_repository import (
+    IYCDirectoryRepository,
+    YCCompanyChanges,
+    YCCompanyPage,
+    YCSearchFilters,
+)
 
 
 class YCDirectoryRepository(IYCDirectoryRepository):
@@ -24,44 +38,169 @@ class YCDirectoryRepository(IYCDirectoryRepository):
         result = await self._session.execute(stmt)
         return result.scalars().first()
 
-    async def sync_from_source(self) -> int:
-        return await sync_yc_directory(self._session)
+    async def abandon_sync_run(self) -> YCSyncState | None:
+        state = await self.get_sync_state()
+        if state is None or state.run_phase is None:
+            return None
+        state.run_phase = None
+        state.run_cursor = None
+        state.status = "abandoned"
+        state.last_finished_at = datetime.utcnow()
+        self._session.add(state)
+        await self._session.commit()
+        return state
+
+    async def rollback_directory_snapshot(self) -> bool:
+        if not await rollback_swap(self._session):
+            return False
+        # The restored directory is not what the change log leads to.
+        await reset_change_log(self._session)
+        await self._session.commit()
+        return True
+
+    async def list_sync_runs(self, limit: int) -> list[YCSyncRun]:
+        stmt = select(YCSyncRun).order_by(YCSyncRun.started_at.desc()).limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
 
     async def list_companies(
         self,
         filters: YCSearchFilters,
         skip: int,
         limit: int,
-    ) -> tuple[list[YCCompany], int]:
-        stmt = select(YCCompany, func.count().over().label("_total")).options(
-            defer(YCCompany.long_description)
+    ) -> list[YCCompany]:
+        stmt = (
+            select(YCCompany)
+            .where(YCCompany.removed_at.is_(None))
+            .options(defer(YCCompany.long_description), defer(YCCompany.search_vector))
         )
-        stmt, _ = _apply_filters(stmt, None, filters)
-        stmt = stmt.order_by(YCCompany.batch_code.desc(), YCCompany.name.asc()).offset(skip).limit(limit)
+        stmt = _apply_filters(stmt, filters)
+        await self._set_fuzzy_threshold(filters)
+        stmt = stmt.order_by(*_order_by(_sort_keys(filters))).offset(skip).limit(limit)
         result = await self._session.execute(stmt)
-        rows = result.all()
-        items = [row[0] for row in rows]
-        total = int(rows[0][1]) if rows else 0
-        return items, total
+        return list(result.scalars().all())
+
+    async def list_companies_page(
+        self,
+        filters: YCSearchFilters,
+        cursor: str | None,
+        limit: int,
+    ) -> YCCompanyPage | None:
+        keys = _sort_keys(filters)
+        after = None
+        if cursor:
+            after = _decode_cursor(cursor, keys)
+            if after is None:
+                return None
+        stmt = (
+            select(YCCompany, *(key for key, _ in keys))
+            .where(YCCompany.removed_at.is_(None))
+            .options(defer(YCCompany.long_description), defer(YCCompany.search_vector))
+        )
+        stmt = _apply_filters(stmt, filters)
+        if after is not None:
+            stmt = stmt.where(_after(keys, after))
+        await self._set_fuzzy_threshold(filters)
+        stmt = stmt.order_by(*_order_by(keys)).limit(limit + 1)
+        rows = (await self._session.execute(stmt)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return YCCompanyPage(
+            items=[row[0] for row in rows],
+            next_cursor=_encode_cursor(rows[-1][1:]) if has_more else None,
+        )
+
+    async def count_companies(self, filters: YCSearchFilters) -> int:
+        listed = select(func.count()).select_from(YCCompany).where(YCCompany.removed_at.is_(None))
+        stmt = _apply_filters(listed, filters)
+        await self._set_fuzzy_threshold(filters)
+        return int(await self._session.scalar(stmt) or 0)
+
+    async def estimate_company_count(self, filters: YCSearchFilters) -> int:
+        stmt = _apply_filters(select(YCCompany.id).where(YCCompany.removed_at.is_(None)), filters)
+        # The planner estimates `%` at the threshold the listing runs with.
+        await self._set_fuzzy_threshold(filters)
+        conn = await self._session.connection()
+        compiled = stmt.compile(dialect=conn.dialect)
+        plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)).scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def get_directory_version(self) -> int:
+        return await directory_version(self._session)
+
+    async def _set_fuzzy_threshold(self, filters: YCSearchFilters) -> None:
+        # `%` matches at pg_trgm.similarity_threshold, which lets it use the trigram indexes.
+        if filters.fuzzy_threshold is not None and filters.q:
+            await self._session.execute(
+                text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+                {"threshold": str(filters.fuzzy_threshold)},
+            )
+
+    async def list_company_changes(self, since: int | None, limit: int) -> YCCompanyChanges | None:
+        state = await self.get_sync_state()
+        if since is not None and state is not None and since < state.change_log_floor:
+            return None
+        latest = await directory_version(self._session)
+        if since is None:
+            return YCCompanyChanges(changes=[], version=latest, has_more=False)
+        newest = (
+            select(YCCompanyChange)
+            .where(YCCompanyChange.version > since, YCCompanyChange.version <= latest)
+            .distinct(YCCompanyChange.yc_id)
+            .order_by(YCCompanyChange.yc_id, YCCompanyChange.version.desc())
+            .subquery()
+        )
+        change = aliased(YCCompanyChange, newest)
+        stmt = (
+            select(change, YCCompany)
+            .outerjoin(YCCompany, (YCCompany.yc_id == change.yc_id) & (change.kind != REMOVED))
+            .options(defer(YCCompany.long_description), defer(YCCompany.search_vector))
+            .order_by(change.version)
+            .limit(limit + 1)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return YCCompanyChanges(
+            changes=[(row[0], row[1]) for row in rows],
+            version=rows[-1][0].version if has_more else latest,
+            has_more=has_more,
+        )
 
     async def get_founders_for_company_ids(
         self, company_ids: list[UUID]
-    ) -> list[YCFounder]:
+    ) -> list[tuple[UUID, YCFounder]]:
         if not company_ids:
             return []
         stmt = (
-            select(YCFounder)
-            .where(YCFounder.company_id.in_(company_ids))
-            .order_by(YCFounder.company_id, YCFounder.sort_order)
+            select(YCCompanyFounder.company_id, YCFounder)
+            .join(YCFounder, YCFounder.id == YCCompanyFounder.founder_id)
+            .where(YCCompanyFounder.company_id.in_(company_ids))
+            .order_by(YCCompanyFounder.company_id, YCCompanyFounder.sort_order)
+        )
+        result = await self._session.execute(stmt)
+        return [(company_id, founder) for company_id, founder in result.all()]
+
+    async def list_founder_companies(self, founder_id: UUID) -> list[YCCompany] | None:
+        if await self._session.get(YCFounder, founder_id) is None:
+            return None
+        stmt = (
+            select(YCCompany)
+            .join(YCCompanyFounder, YCCompanyFounder.company_id == YCCompany.id)
+            .where(YCCompanyFounder.founder_id == founder_id, YCCompany.removed_at.is_(None))
+            .options(defer(YCCompany.long_description), defer(YCCompany.search_vector))
+            .order_by(YCCompany.batch_code.desc(), YCCompany.name.asc())
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
     async def get_meta(self) -> dict[str, Any]:
-        years_stmt = select(func.distinct(YCCompany.year)).order_by(YCCompany.year)
-        batches_stmt = select(func.distinct(YCCompany.batch)).order_by(YCCompany.batch)
-        statuses_stmt = select(func.distinct(YCCompany.status)).order_by(YCCompany.status)
+        listed = YCCompany.removed_at.is_(None)
+        years_stmt = select(func.distinct(YCCompany.year)).where(listed).order_by(YCCompany.year)
+        batches_stmt = select(func.distinct(YCCompany.batch)).where(listed).order_by(YCCompany.batch)
+        statuses_stmt = select(func.distinct(YCCompany.status)).where(listed).order_by(YCCompany.status)
         industries_stmt = select(func.distinct(YCCompany.industry)).where(
+            listed,
             YCCompany.industry.is_not(None),
         )
         r_years, r_batches, r_statuses, r_industries = await asyncio.gather(
@@ -81,44 +220,139 @@ class YCDirectoryRepository(IYCDirectoryRepository):
             "industries": industries,
         }
 
-
-def _apply_filters(stmt, count_stmt, filters: YCSearchFilters):
-    if filters.q:
-        pattern = f"%{filters.q.lower()}%"
-        cond = (
-            func.lower(YCCompany.name).like(pattern)
-            | func.lower(YCCompany.one_liner).like(pattern)
-            | func.lower(YCCompany.long_description).like(pattern)
+    async def get_facets(self, filters: YCSearchFilters) -> dict[str, list[tuple[Any, int]]]:
+        # One row per value of each facet column (GROUPING SETS), in a single
+        # scan of the companies matching `q`. Each facet's count leaves out its
+        # own filter, so it is what choosing that value instead would return.
+        conds = _filter_conditions(filters)
+        search = conds.pop("q", None)
+        columns = [column for _, column in _FACETS.values()]
+        counts = []
+        for field, _ in _FACETS.values():
+            others = [cond for name, cond in conds.items() if name != field]
+            counts.append(func.count().filter(and_(*others)) if others else func.count())
+        stmt = (
+            select(func.grouping(*columns), *columns, *counts)
+            .where(YCCompany.removed_at.is_(None))
+            .group_by(func.grouping_sets(*columns))
         )
-        stmt = stmt.where(cond)
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(cond)
+        if search is not None:
+            stmt = stmt.where(search)
+        await self._set_fuzzy_threshold(filters)
+        rows = (await self._session.execute(stmt)).all()
+
+        facets: dict[str, list[tuple[Any, int]]] = {name: [] for name in _FACETS}
+        names = list(_FACETS)
+        for grouping, *row in rows:
+            # grouping() sets the bit of each column the row is not grouped by,
+            # the first column's bit highest.
+            i = next(i for i in range(len(names)) if not grouping >> (len(names) - 1 - i) & 1)
+            value = row[i]
+            # Like get_meta, no empty values (year 0 is a company without a batch); False is a flag value.
+            if value or isinstance(value, bool):
+                facets[names[i]].append((value, row[len(names) + i]))
+        return {name: sorted(values) for name, values in facets.items()}
+
+
+# Facet name -> (the YCSearchFilters field that filters on it, its column)
+_FACETS: dict[str, tuple[str, Any]] = {
+    "statuses": ("status", YCCompany.status),
+    "industries": ("industry", YCCompany.industry),
+    "years": ("year", YCCompany.year),
+    "batches": ("batch", YCCompany.batch),
+    "is_hiring": ("is_hiring", YCCompany.is_hiring),
+    "nonprofit": ("nonprofit", YCCompany.nonprofit),
+    "top_company": ("top_company", YCCompany.top_company),
+}
+
+
+def _search_query(q: str | None) -> ColumnElement[Any] | None:
+    """`q` as a tsquery matching companies whose search vector has every word of it as a prefix.
+
+    None if `q` has no words.
+    """
+    words = re.findall(r"\w+", q or "")
+    if not words:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"'{word}':*" for word in words))
+
+
+def _sort_keys(filters: YCSearchFilters) -> list[tuple[Any, bool]]:
+    """(expression, descending) pairs the company list is ordered by, ending in a unique key.
+
+    Most relevant first when searching; ties keep the directory order, which
+    ix_yccompany_batch_code_name serves.
+    """
+    keys: list[tuple[Any, bool]] = []
+    if filters.fuzzy_threshold is not None and filters.q:
+        similarity = func.greatest(func.similarity(YCCompany.name, filters.q), func.similarity(YCCompany.slug, filters.q))
+        keys.append((similarity, True))
+    elif (query := _search_query(filters.q)) is not None:
+        keys.append((func.ts_rank_cd(YCCompany.search_vector, query), True))
+    keys += [(YCCompany.batch_code, True), (YCCompany.name, False), (YCCompany.id, False)]
+    return keys
+
+
+def _order_by(keys: list[tuple[Any, bool]]) -> list[Any]:
+    return [key.desc() if descending else key.asc() for key, descending in keys]
+
+
+def _after(keys: list[tuple[Any, bool]], values: list[Any]) -> ColumnElement[bool]:
+    """Rows that sort after `values` in the order of `keys`."""
+    cond = None
+    for (key, descending), value in reversed(list(zip(keys, values, strict=True))):
+        beyond = key < value if descending else key > value
+        cond = beyond if cond is None else beyond | ((key == value) & cond)
+    # A range on the leading key, so that an index on it can seek.
+    (first, descending), value = keys[0], values[0]
+    after: ColumnElement[bool] = ((first <= value) if descending else (first >= value)) & cond
+    return after
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([str(v) if isinstance(v, UUID) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, keys: list[tuple[Any, bool]]) -> list[Any] | None:
+    """The key values in `cursor`; None if it is malformed or was made for a differently ordered list."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            return None
+        *rank, batch_code, name, company_id = values
+        if any(isinstance(r, bool) or not isinstance(r, (int, float)) for r in rank):
+            return None
+        if not isinstance(batch_code, str) or not isinstance(name, str):
+            return None
+        return [*rank, batch_code, name, UUID(company_id)]
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _filter_conditions(filters: YCSearchFilters) -> dict[str, Any]:
+    """The condition of each filter that is set, by its `YCSearchFilters` field."""
+    conds: dict[str, Any] = {}
+    if filters.fuzzy_threshold is not None and filters.q:
+        conds["q"] = YCCompany.name.bool_op("%")(filters.q) | YCCompany.slug.bool_op("%")(filters.q)
+    elif (query := _search_query(filters.q)) is not None:
+        conds["q"] = YCCompany.search_vector.bool_op("@@")(query)
     if filters.batch:
-        stmt = stmt.where(YCCompany.batch == filters.batch)
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.batch == filters.batch)
+        conds["batch"] = YCCompany.batch == filters.batch
     if filters.year:
-        stmt = stmt.where(YCCompany.year == filters.year)
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.year == filters.year)
+        conds["year"] = YCCompany.year == filters.year
     if filters.status:
-        stmt = stmt.where(YCCompany.status == filters.status)
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.status == filters.status)
+        conds["status"] = YCCompany.status == filters.status
     if filters.industry:
-        stmt = stmt.where(YCCompany.industry == filters.industry)
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.industry == filters.industry)
+        conds["industry"] = YCCompany.industry == filters.industry
     if filters.is_hiring is not None:
-        stmt = stmt.where(YCCompany.is_hiring.is_(filters.is_hiring))
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.is_hiring.is_(filters.is_hiring))
+        conds["is_hiring"] = YCCompany.is_hiring.is_(filters.is_hiring)
     if filters.nonprofit is not None:
-        stmt = stmt.where(YCCompany.nonprofit.is_(filters.nonprofit))
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.nonprofit.is_(filters.nonprofit))
+        conds["nonprofit"] = YCCompany.nonprofit.is_(filters.nonprofit)
     if filters.top_company is not None:
-        stmt = stmt.where(YCCompany.top_company.is_(filters.top_company))
-        if count_stmt is not None:
-            count_stmt = count_stmt.where(YCCompany.top_company.is_(filters.top_company))
-    return stmt, count_stmt
+        conds["top_company"] = YCCompany.top_company.is_(filters.top_company)
+    return conds
+
+
+def _apply_filters(stmt, filters: YCSearchFilters):
+    return stmt.where(*_filter_conditions(filters).values())
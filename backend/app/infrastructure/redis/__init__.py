@@ -1,3 +1,4 @@
 from app.infrastructure.redis.redis_repo import RedisRepository, get_redis_repo
+from app.infrastructure.redis.yc_sync_queue import RedisYCSyncQueue, get_yc_sync_queue
 
-__all__ = ["RedisRepository", "get_redis_repo"]
+__all__ = ["RedisRepository", "RedisYCSyncQueue", "get_redis_repo", "get_yc_sync_queue"]
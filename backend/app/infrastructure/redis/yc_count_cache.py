@@ -0,0 +1,75 @@
+"""Redis cache of YC company list counts (`yc_count:<key>` = "<count>:<1 if exact else 0>")
+and facets (`yc_facets:<key>` = JSON of the facets' [value, count] pairs).
+
+The cache only saves work: when Redis is unavailable, counts are computed again.
+"""
+import json
+import logging
+from typing import Any
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config.config import settings
+from app.use_cases.ports.yc_count_cache import IYCCountCache, YCCompanyCount
+
+logger = logging.getLogger(__name__)
+
+
+class RedisYCCountCache(IYCCountCache):
+    KEY_PREFIX = "yc_count:"
+    FACETS_KEY_PREFIX = "yc_facets:"
+
+    def __init__(self, redis_client: aioredis.Redis, ttl_seconds: int) -> None:
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> YCCompanyCount | None:
+        try:
+            raw = await self.redis_client.get(self.KEY_PREFIX + key)
+        except RedisError as e:
+            logger.warning("YC count cache read failed: %s", e)
+            return None
+        if raw is None:
+            return None
+        count, _, exact = raw.partition(":")
+        return YCCompanyCount(count=int(count), exact=exact == "1")
+
+    async def set(self, key: str, count: YCCompanyCount) -> None:
+        try:
+            await self.redis_client.set(
+                self.KEY_PREFIX + key, f"{count.count}:{int(count.exact)}", ex=self.ttl_seconds
+            )
+        except RedisError as e:
+            logger.warning("YC count cache write failed: %s", e)
+
+    async def get_facets(self, key: str) -> dict[str, list[tuple[Any, int]]] | None:
+        try:
+            raw = await self.redis_client.get(self.FACETS_KEY_PREFIX + key)
+        except RedisError as e:
+            logger.warning("YC facets cache read failed: %s", e)
+            return None
+        if raw is None:
+            return None
+        return {name: [(value, count) for value, count in pairs] for name, pairs in json.loads(raw).items()}
+
+    async def set_facets(self, key: str, facets: dict[str, list[tuple[Any, int]]]) -> None:
+        try:
+            await self.redis_client.set(self.FACETS_KEY_PREFIX + key, json.dumps(facets), ex=self.ttl_seconds)
+        except RedisError as e:
+            logger.warning("YC facets cache write failed: %s", e)
+
+
+yc_count_cache = RedisYCCountCache(
+    aioredis.from_url(
+        settings.REDIS_URI,
+        decode_responses=True,
+        max_connections=50,
+        retry_on_timeout=True,
+    ),
+    ttl_seconds=settings.YC_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+def get_yc_count_cache() -> RedisYCCountCache:
+    return yc_count_cache
@@ -0,0 +1,158 @@
+"""Redis-backed job queue and cluster-wide lock for the YC sync worker.
+
+Jobs are LPUSHed onto `yc_sync:queue` and moved atomically (BLMOVE) onto a
+per-worker processing list when a worker takes them, so a job held by a worker
+that dies is not lost: other workers requeue processing lists whose worker
+heartbeat key has expired. At most one job waits in the queue at a time
+(`yc_sync:pending`), and only the holder of `yc_sync:lock` runs a sync.
+"""
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import cast
+
+from fastapi import HTTPException, status
+from redis import asyncio as aioredis
+from redis.asyncio.lock import Lock
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
+from app.core.config.config import settings
+from app.use_cases.ports.yc_sync_queue import IYCSyncQueue
+
+logger = logging.getLogger(__name__)
+
+# Push the job only if no other job is waiting (and, if asked, no sync holds the lock).
+_ENQUEUE_SCRIPT = """
+if ARGV[3] == '1' and redis.call('EXISTS', KEYS[3]) == 1 then
+    return 0
+end
+if redis.call('SET', KEYS[1], ARGV[1], 'NX') then
+    redis.call('LPUSH', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Delete a key only while it still holds the given value.
+_COMPARE_DELETE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class YCSyncJob:
+    id: str
+    reason: str
+    enqueued_at: str
+    raw: str
+
+    @classmethod
+    def from_raw(cls, raw: str) -> "YCSyncJob":
+        data = json.loads(raw)
+        return cls(id=data["id"], reason=data["reason"], enqueued_at=data["enqueued_at"], raw=raw)
+
+
+class RedisYCSyncQueue(IYCSyncQueue):
+    QUEUE_KEY = "yc_sync:queue"
+    PENDING_KEY = "yc_sync:pending"
+    LOCK_KEY = "yc_sync:lock"
+    PROCESSING_PREFIX = "yc_sync:processing:"
+    WORKER_PREFIX = "yc_sync:worker:"
+
+    def __init__(self, redis_client: aioredis.Redis) -> None:
+        self.redis_client = redis_client
+        self._enqueue_script = redis_client.register_script(_ENQUEUE_SCRIPT)
+        self._compare_delete_script = redis_client.register_script(_COMPARE_DELETE_SCRIPT)
+
+    async def enqueue(self, reason: str, *, skip_if_running: bool = False) -> bool:
+        job_id = uuid.uuid4().hex
+        raw = json.dumps(
+            {"id": job_id, "reason": reason, "enqueued_at": datetime.utcnow().isoformat()}
+        )
+        try:
+            queued = await self._enqueue_script(
+                keys=[self.PENDING_KEY, self.QUEUE_KEY, self.LOCK_KEY],
+                args=[job_id, raw, "1" if skip_if_running else "0"],
+            )
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            logger.warning("Redis error: %s", type(e).__name__)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service unavailable. Please try again later.",
+            ) from e
+        if queued:
+            logger.info("Queued YC sync job %s (%s)", job_id, reason)
+        return bool(queued)
+
+    async def is_running(self) -> bool:
+        try:
+            return bool(await self.redis_client.exists(self.LOCK_KEY))
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            logger.warning("Redis error: %s", type(e).__name__)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service unavailable. Please try again later.",
+            ) from e
+
+    # Worker side. Errors propagate: the worker loop logs them and retries.
+
+    async def dequeue(self, worker_id: str, timeout: int) -> YCSyncJob | None:
+        """Block up to `timeout` seconds for a job, parking it on this worker's processing list."""
+        raw = await self.redis_client.blmove(
+            self.QUEUE_KEY, self.PROCESSING_PREFIX + worker_id, timeout, "RIGHT", "LEFT"
+        )
+        if raw is None:
+            return None
+        # decode_responses=True: replies are str.
+        return YCSyncJob.from_raw(cast(str, raw))
+
+    async def mark_started(self, job: YCSyncJob) -> None:
+        """Let new jobs be queued behind the one that is now running."""
+        await self._compare_delete_script(keys=[self.PENDING_KEY], args=[job.id])
+
+    async def ack(self, worker_id: str, job: YCSyncJob) -> None:
+        await self.redis_client.lrem(self.PROCESSING_PREFIX + worker_id, 1, job.raw)
+
+    async def heartbeat(self, worker_id: str, ttl_seconds: int) -> None:
+        await self.redis_client.set(self.WORKER_PREFIX + worker_id, "1", ex=ttl_seconds)
+
+    async def requeue_orphans(self) -> int:
+        """Return jobs held by workers whose heartbeat expired to the head of the queue."""
+        requeued = 0
+        async for key in self.redis_client.scan_iter(match=self.PROCESSING_PREFIX + "*"):
+            worker_id = key[len(self.PROCESSING_PREFIX) :]
+            if await self.redis_client.exists(self.WORKER_PREFIX + worker_id):
+                continue
+            while await self.redis_client.lmove(key, self.QUEUE_KEY, "RIGHT", "RIGHT") is not None:
+                requeued += 1
+        if requeued:
+            logger.warning("Requeued %d YC sync job(s) from dead workers", requeued)
+        return requeued
+
+    def lock(self) -> Lock:
+        """The cluster-wide sync lock; holders must `reacquire()` it before it expires."""
+        return self.redis_client.lock(
+            self.LOCK_KEY,
+            timeout=settings.YC_SYNC_LOCK_TTL_SECONDS,
+            sleep=1.0,
+            thread_local=False,
+        )
+
+
+yc_sync_queue = RedisYCSyncQueue(
+    aioredis.from_url(
+        settings.REDIS_URI,
+        decode_responses=True,
+        max_connections=50,
+        retry_on_timeout=True,
+    )
+)
+
+
+def get_yc_sync_queue() -> RedisYCSyncQueue:
+    return yc_sync_queue
@@ -0,0 +1,215 @@
+"""COPY-based bulk loading for the YC directory tables.
+
+Rows are streamed with PostgreSQL `COPY ... FROM STDIN` into unlogged staging
+tables and merged into `yccompany`, and into `ycfounder` / `yccompanyfounder`,
+with set-based statements. The diff semantics match the INSERT-based loaders in `sync.py`: unchanged
+companies (same content_hash) and unchanged founders are not rewritten.
+
+Staging tables are recreated from the live column list at the start of each run,
+so they follow schema migrations; only one sync runs at a time.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
+
+from psycopg import AsyncCopy
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.yc.changes import ADDED, UPDATED, mark_removed
+from app.infrastructure.yc.rows import (
+    COMPANY_FIELDS,
+    COMPANY_FOUNDER_FIELDS,
+    FOUNDER_FIELDS,
+    CompanyDiff,
+    FounderWrites,
+    company_row,
+)
+
+COMPANY_STAGE = "yccompany_stage"
+FOUNDER_STAGE = "ycfounder_stage"
+
+_JSONB_COLUMNS = frozenset({"industries", "regions", "tags"})
+_FOUNDER_COLUMNS = ("company_id", "founder_key", "identity_key", "sort_order", "role", *FOUNDER_FIELDS)
+
+
+async def copy_companies(
+    session: AsyncSession,
+    batches: AsyncIterable[list[dict[str, Any]]],
+    scope: Sequence[str] | None = None,
+) -> CompanyDiff:
+    """Stage every feed entry via COPY, then merge changed rows in one statement.
+
+    Merged rows are logged to the change log, and stored companies the feed no
+    longer lists are marked removed. With `scope`, the feed only covers those
+    YC batches, and only their stored companies can disappear.
+    """
+    await _recreate_stage(session, COMPANY_STAGE, "yccompany", COMPANY_FIELDS)
+    await session.execute(text(f"ALTER TABLE {COMPANY_STAGE} ADD COLUMN feed_ord bigint"))
+
+    feed_ord = 0
+    async with _copy(session, COMPANY_STAGE, (*COMPANY_FIELDS, "feed_ord")) as copy:
+        async for raw_batch in batches:
+            for raw in raw_batch:
+                row = company_row(raw)
+                await copy.write_row([_copy_value(c, row[c]) for c in COMPANY_FIELDS] + [feed_ord])
+                feed_ord += 1
+
+    cols = ", ".join(COMPANY_FIELDS)
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in COMPANY_FIELDS if c != "yc_id")
+    covered = "c.removed_at IS NULL" + (" AND c.batch = ANY(:scope)" if scope is not None else "")
+    merge = text(f"""
+        WITH src AS (
+            SELECT DISTINCT ON (yc_id) {cols}
+            FROM {COMPANY_STAGE}
+            ORDER BY yc_id, feed_ord
+        ), merged AS (
+            INSERT INTO yccompany (id, {cols}, created_at, updated_at)
+            SELECT gen_random_uuid(), {cols}, :now, :now FROM src
+            ON CONFLICT (yc_id) DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at, removed_at = NULL
+            WHERE yccompany.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+               OR yccompany.removed_at IS NOT NULL
+            RETURNING yc_id, id, (xmax = 0) AS inserted
+        ), logged AS (
+            INSERT INTO yccompanychange (yc_id, company_id, kind, changed_at)
+            SELECT yc_id, id, CASE WHEN inserted THEN :added ELSE :updated END, :now FROM merged
+        )
+        SELECT
+            (SELECT count(*) FROM merged WHERE inserted) AS inserted,
+            (SELECT count(*) FROM merged WHERE NOT inserted) AS changed,
+            (SELECT count(*) FROM src) AS total,
+            (SELECT count(*) FROM yccompany c WHERE {covered}) AS covered
+    """)
+    now = datetime.utcnow()
+    params: dict[str, Any] = {"now": now, "added": ADDED, "updated": UPDATED}
+    if scope is not None:
+        params["scope"] = list(scope)
+    counts = (await session.execute(merge, params)).one()
+    missing = await session.execute(
+        text(
+            f"SELECT c.yc_id FROM yccompany c WHERE {covered} "
+            f"AND NOT EXISTS (SELECT 1 FROM {COMPANY_STAGE} s WHERE s.yc_id = c.yc_id)"
+        ),
+        params,
+    )
+    disappeared = list(missing.scalars().all())
+    await mark_removed(session, disappeared, counts.covered, now)
+    await session.execute(text(f"TRUNCATE {COMPANY_STAGE}"))
+    await session.commit()
+    return CompanyDiff(
+        inserted=counts.inserted,
+        changed=counts.changed,
+        unchanged=counts.total - counts.inserted - counts.changed,
+        disappeared=len(disappeared),
+    )
+
+
+async def prepare_founder_stage(session: AsyncSession) -> None:
+    await _recreate_stage(session, FOUNDER_STAGE, "yccompanyfounder, ycfounder", _FOUNDER_COLUMNS)
+
+
+async def copy_founders(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> FounderWrites:
+    """Reconcile the founders of every company present in `rows`.
+
+    `rows` are `founder_rows()` output. One statement upserts the founders by
+    identity; a second deletes the companies' links whose key is absent,
+    inserts new ones and updates changed ones. Requires
+    `prepare_founder_stage()` earlier in the run; does not commit.
+    """
+    await session.execute(text(f"TRUNCATE {FOUNDER_STAGE}"))
+    async with _copy(session, FOUNDER_STAGE, _FOUNDER_COLUMNS) as copy:
+        for row in rows:
+            await copy.write_row([row[c] for c in _FOUNDER_COLUMNS])
+
+    now = datetime.utcnow()
+    cols = ", ".join(FOUNDER_FIELDS)
+    excluded = ", ".join(f"EXCLUDED.{f}" for f in FOUNDER_FIELDS)
+    updates = ", ".join(f"{f} = EXCLUDED.{f}" for f in FOUNDER_FIELDS)
+    founders = text(f"""
+        WITH merged AS (
+            INSERT INTO ycfounder (id, identity_key, {cols}, created_at, updated_at)
+            SELECT DISTINCT ON (identity_key) gen_random_uuid(), identity_key, {cols}, :now, :now
+            FROM {FOUNDER_STAGE}
+            ORDER BY identity_key
+            ON CONFLICT (identity_key) DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at
+            WHERE ({", ".join(f"ycfounder.{f}" for f in FOUNDER_FIELDS)}) IS DISTINCT FROM ({excluded})
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT
+            (SELECT count(*) FROM merged WHERE inserted) AS inserted,
+            (SELECT count(*) FROM merged WHERE NOT inserted) AS updated
+    """)
+    founder_counts = (await session.execute(founders, {"now": now})).one()
+
+    link_cols = ", ".join(COMPANY_FOUNDER_FIELDS)
+    link_excluded = ", ".join(f"EXCLUDED.{f}" for f in COMPANY_FOUNDER_FIELDS)
+    link_updates = ", ".join(f"{f} = EXCLUDED.{f}" for f in COMPANY_FOUNDER_FIELDS)
+    links = text(f"""
+        WITH companies AS (
+            SELECT DISTINCT company_id FROM {FOUNDER_STAGE}
+        ), deleted AS (
+            DELETE FROM yccompanyfounder l
+            USING companies c
+            WHERE l.company_id = c.company_id
+              AND NOT EXISTS (
+                  SELECT 1 FROM {FOUNDER_STAGE} s
+                  WHERE s.company_id = l.company_id AND s.founder_key = l.founder_key
+              )
+            RETURNING 1
+        ), merged AS (
+            INSERT INTO yccompanyfounder (company_id, founder_key, {link_cols})
+            SELECT s.company_id, s.founder_key, f.id, s.sort_order, s.role
+            FROM {FOUNDER_STAGE} s
+            JOIN ycfounder f ON f.identity_key = s.identity_key
+            ON CONFLICT (company_id, founder_key) DO UPDATE SET {link_updates}
+            WHERE ({", ".join(f"yccompanyfounder.{f}" for f in COMPANY_FOUNDER_FIELDS)}) IS DISTINCT FROM ({link_excluded})
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT
+            (SELECT count(*) FROM merged WHERE inserted) AS inserted,
+            (SELECT count(*) FROM merged WHERE NOT inserted) AS updated,
+            (SELECT count(*) FROM deleted) AS deleted
+    """)
+    link_counts = (await session.execute(links)).one()
+    return FounderWrites(
+        inserted=founder_counts.inserted + link_counts.inserted,
+        updated=founder_counts.updated + link_counts.updated,
+        deleted=link_counts.deleted,
+    )
+
+
+async def _recreate_stage(
+    session: AsyncSession,
+    stage: str,
+    source: str,
+    columns: Sequence[str],
+) -> None:
+    await session.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+    await session.execute(
+        text(f"CREATE UNLOGGED TABLE {stage} AS SELECT {', '.join(columns)} FROM {source} WITH NO DATA")
+    )
+
+
+@asynccontextmanager
+async def _copy(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+) -> AsyncIterator[AsyncCopy]:
+    """Open a COPY FROM STDIN on the session's own connection (same transaction)."""
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    async with driver.cursor() as cur:
+        async with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            yield copy
+
+
+def _copy_value(column: str, value: Any) -> Any:
+    if column in _JSONB_COLUMNS:
+        return json.dumps(value)
+    return value
@@ -0,0 +1,98 @@
+"""Per-company change log of the YC directory.
+
+The sync appends an entry to `yccompanychange` whenever it adds a company,
+changes its feed entry or founders, or marks it removed because the feed no
+longer lists it. Entries are numbered by a sequence, and the highest number is
+the directory version. Clients that keep a local copy ask for the latest entry
+per company after the version they have (`GET /yc/companies/changes?since=`).
+
+The log cannot serve changes after versions below `YCSyncState.change_log_floor`.
+This happens when entries up to the floor were pruned, or when a rollback
+replaced the directory with one the log does not lead to. Clients that are
+behind the floor reload the directory.
+"""
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Collection, Iterable
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_change import VERSION_SEQ, YCCompanyChange
+from app.domain.entities.db.yc_sync_state import YCSyncState
+
+logger = logging.getLogger(__name__)
+
+ADDED, UPDATED, REMOVED = "added", "updated", "removed"
+# A feed missing more than this share (and more than MIN_REMOVED_GUARD) of the
+# companies it covers is taken to be incomplete, and removes none of them.
+MAX_REMOVED_SHARE = 0.2
+MIN_REMOVED_GUARD = 10
+
+
+async def log_changes(
+    session: AsyncSession,
+    changes: Iterable[tuple[int, uuid.UUID, str]],
+    now: datetime,
+) -> None:
+    """Append (yc_id, company id, kind) entries; does not commit."""
+    rows = [{"yc_id": yc_id, "company_id": company_id, "kind": kind, "changed_at": now} for yc_id, company_id, kind in changes]
+    if rows:
+        await session.execute(insert(YCCompanyChange.__table__), rows)
+
+
+async def mark_removed(session: AsyncSession, yc_ids: Collection[int], covered: int, now: datetime) -> int:
+    """Mark the companies `yc_ids`, missing from a feed that covers `covered` companies, as removed.
+
+    Returns how many were marked. Does not commit.
+    """
+    if not yc_ids:
+        return 0
+    if len(yc_ids) > max(MAX_REMOVED_SHARE * covered, MIN_REMOVED_GUARD):
+        logger.warning(
+            "YC feed is missing %d of %d companies; treating it as incomplete and removing none",
+            len(yc_ids),
+            covered,
+        )
+        return 0
+    table = YCCompany.__table__
+    result = await session.execute(
+        update(table)
+        .where(table.c.yc_id.in_(list(yc_ids)), table.c.removed_at.is_(None))
+        .values(removed_at=now)
+        .returning(table.c.yc_id, table.c.id)
+    )
+    removed = result.all()
+    await log_changes(session, ((yc_id, company_id, REMOVED) for yc_id, company_id in removed), now)
+    return len(removed)
+
+
+async def directory_version(session: AsyncSession) -> int:
+    floor = await session.scalar(select(YCSyncState.change_log_floor).where(YCSyncState.source == "yc_directory"))
+    latest = await session.scalar(select(func.max(YCCompanyChange.version)))
+    return max(latest or 0, floor or 0)
+
+
+async def prune_change_log(session: AsyncSession, sync_state: YCSyncState, retention: timedelta) -> None:
+    """Delete entries older than `retention`, raising the floor past them; does not commit."""
+    table = YCCompanyChange.__table__
+    pruned = await session.scalar(
+        select(func.max(table.c.version)).where(table.c.changed_at < datetime.utcnow() - retention)
+    )
+    if pruned is None:
+        return
+    await session.execute(delete(table).where(table.c.version <= pruned))
+    sync_state.change_log_floor = max(sync_state.change_log_floor, pruned)
+    session.add(sync_state)
+
+
+async def reset_change_log(session: AsyncSession) -> None:
+    """Raise the floor past every logged version, so every client reloads the directory; does not commit."""
+    version = await session.scalar(select(VERSION_SEQ.next_value()))
+    await session.execute(
+        update(YCSyncState).where(YCSyncState.source == "yc_directory").values(change_log_floor=version)
+    )
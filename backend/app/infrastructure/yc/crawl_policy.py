@@ -0,0 +1,255 @@
+"""Adaptive concurrency, retries and an error budget for the founders crawl.
+
+Requests to each host go through an `AIMDLimiter`. The limiter raises its
+in-flight limit by about one request per window of successful, fast responses.
+It cuts the limit in half when smoothed latency rises above the target, when
+the smoothed error rate passes its threshold, or when the host throttles. A
+429 or 503 with `Retry-After` also pauses every request to that host until the
+given time.
+
+`CrawlPolicy.get()` retries timeouts, transport errors and 429/5xx responses
+with jittered exponential backoff, or with the server's `Retry-After` when one
+is sent. Every failed attempt is charged to a per-run error budget. Once the
+budget is spent, `ErrorBudgetExhausted` ends the crawl.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from app.infrastructure.yc.founders_pipeline import StopCrawl
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class ErrorBudgetExhausted(StopCrawl):
+    pass
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait per a `Retry-After` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+@dataclass(frozen=True)
+class AIMDConfig:
+    initial: int = 4
+    minimum: int = 1
+    maximum: int = 15
+    target_latency: float = 2.0
+    max_error_rate: float = 0.05
+    decrease_factor: float = 0.5
+    # Weight of the newest sample in the latency / error-rate moving averages
+    smoothing: float = 0.2
+    # Minimum seconds between two decreases, so one burst of failures from
+    # requests that were already in flight only counts once
+    decrease_cooldown: float = 2.0
+
+
+class AIMDLimiter:
+    """In-flight request limit for one host, adjusted additively up and multiplicatively down."""
+
+    def __init__(self, config: AIMDConfig = AIMDConfig()) -> None:
+        self.config = config
+        self.limit = float(max(config.minimum, min(config.initial, config.maximum)))
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.increases = 0
+        self.decreases = 0
+        self.peak_limit = int(self.limit)
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        while (pause := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(pause)
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        self._observe(latency=latency, error=False)
+        if self.latency is not None and self.latency > self.config.target_latency:
+            self._decrease(f"latency {self.latency:.2f}s")
+        elif self.error_rate <= self.config.max_error_rate:
+            self._increase()
+
+    def on_error(self) -> None:
+        self._observe(latency=None, error=True)
+        if self.error_rate > self.config.max_error_rate:
+            self._decrease(f"error rate {self.error_rate:.2f}")
+
+    def on_throttle(self, retry_after: float | None) -> None:
+        self._observe(latency=None, error=True)
+        self._decrease("throttled")
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def _observe(self, *, latency: float | None, error: bool) -> None:
+        alpha = self.config.smoothing
+        self.error_rate += alpha * (float(error) - self.error_rate)
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + alpha * (latency - self.latency)
+
+    def _increase(self) -> None:
+        before = int(self.limit)
+        self.limit = min(float(self.config.maximum), self.limit + 1 / self.limit)
+        if int(self.limit) > before:
+            self.increases += 1
+            self.peak_limit = max(self.peak_limit, int(self.limit))
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.config.decrease_cooldown:
+            return
+        self._last_decrease = now
+        limit = max(float(self.config.minimum), self.limit * self.config.decrease_factor)
+        if int(limit) < int(self.limit):
+            self.decreases += 1
+            logger.info("YC founders crawl: concurrency %d -> %d (%s)", int(self.limit), int(limit), reason)
+        self.limit = limit
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "peak_limit": self.peak_limit,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+        }
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 60.0
+
+    def backoff(self, attempt: int, retry_after: float | None) -> float | None:
+        """Seconds before retry number `attempt` (1-based), or None to give up.
+
+        A `Retry-After` longer than `max_delay` is not worth waiting for within
+        this run, so the request fails and the company is retried next run.
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CrawlPolicy:
+    """Per-host adaptive limiters, retries and a shared error budget for one crawl run."""
+
+    def __init__(
+        self,
+        limiter: AIMDConfig = AIMDConfig(),
+        retry: RetryPolicy = RetryPolicy(),
+        error_budget: int = 200,
+    ) -> None:
+        self.limiter_config = limiter
+        self.retry = retry
+        self.error_budget = error_budget
+        self.errors = 0
+        self.retries = 0
+        self._limiters: dict[str, AIMDLimiter] = {}
+
+    def limiter(self, url: str) -> AIMDLimiter:
+        host = httpx.URL(url).host
+        if host not in self._limiters:
+            self._limiters[host] = AIMDLimiter(self.limiter_config)
+        return self._limiters[host]
+
+    async def get(self, client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        """`client.get()` under the host's limiter, with retries.
+
+        Returns the last response even if its status is an error, so the caller's
+        `raise_for_status()` decides; raises the last transport error if no
+        response was received at all.
+        """
+        limiter = self.limiter(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            resp: httpx.Response | None = None
+            error: httpx.TransportError | None = None
+            retry_after: float | None = None
+            # Outcomes are recorded before the slot is released, so waiters
+            # re-check against the adjusted limit.
+            async with limiter.slot():
+                start = time.monotonic()
+                try:
+                    resp = await client.get(url, **kwargs)
+                except httpx.TransportError as exc:
+                    error = exc
+                if resp is not None and resp.status_code not in RETRYABLE_STATUSES:
+                    limiter.on_success(time.monotonic() - start)
+                    return resp
+                if resp is not None and resp.status_code in THROTTLE_STATUSES:
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                    limiter.on_throttle(retry_after)
+                else:
+                    limiter.on_error()
+            self._charge(url, resp, error)
+
+            delay = self.retry.backoff(attempt, retry_after) if attempt < self.retry.max_attempts else None
+            if delay is None:
+                if resp is not None:
+                    return resp
+                assert error is not None
+                raise error
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    def _charge(self, url: str, resp: httpx.Response | None, error: Exception | None) -> None:
+        self.errors += 1
+        if self.errors > self.error_budget:
+            cause = f"HTTP {resp.status_code}" if resp is not None else repr(error)
+            raise ErrorBudgetExhausted(
+                f"YC founders crawl stopped: {self.errors} failed requests exceed the error budget of "
+                f"{self.error_budget} (last: {cause} for {url})"
+            )
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "errors": self.errors,
+            "retries": self.retries,
+            "error_budget": self.error_budget,
+            "hosts": {host: limiter.summary() for host, limiter in self._limiters.items()},
+        }
@@ -0,0 +1,196 @@
+"""Extraction of founder records from YC company HTML pages.
+
+Founders live in a small "Active Founders" region of a large page. The fast path
+finds that region with plain string search and tokenises only that slice; when
+it finds nothing, the whole page is parsed instead, stopping as soon as the
+section has ended.
+
+Kept free of app imports so that process-pool workers (see `parse_pool`) can
+import it cheaply.
+"""
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import Any
+
+# Text nodes that open / close the founders section, as FoundersHTMLParser sees them.
+_SECTION_START = re.compile(r"Active Founders\s*<")
+_SECTION_END = re.compile(r"(?:Company Launches|Jobs at)\s*<")
+_FEED_CHUNK = 16 * 1024
+
+
+class FoundersHTMLParser(HTMLParser):
+    """Parse YC founder blocks from company HTML pages."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._in_active_founders = False
+        self._in_done = False
+        self._current: dict[str, Any] | None = None
+        self._founders: list[dict[str, Any]] = []
+        self._bio_parts: list[str] = []
+        self._capture_bio = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._in_done:
+            return
+        if not self._in_active_founders:
+            return
+
+        attrs_dict = dict(attrs)
+        if tag == "img":
+            alt = (attrs_dict.get("alt") or "").strip()
+            src = (attrs_dict.get("src") or "").strip()
+            if not alt or not src:
+                return
+            if alt.lower() in {"twitter account", "x (twitter) logo"}:
+                return
+            if "/avatars/" not in src and "avatars" not in src:
+                return
+
+            self._flush_current()
+            self._current = {
+                "name": alt,
+                "avatar_url": src,
+                "twitter_url": None,
+                "linkedin_url": None,
+                "yc_profile_url": None,
+                "role": None,
+                "bio": None,
+            }
+            self._bio_parts = []
+            self._capture_bio = False
+            return
+
+        if tag == "a" and self._current:
+            href = (attrs_dict.get("href") or "").strip()
+            if not href:
+                return
+            if "twitter.com/" in href or "x.com/" in href:
+                self._current["twitter_url"] = self._current["twitter_url"] or href
+            elif "linkedin.com/" in href:
+                self._current["linkedin_url"] = self._current["linkedin_url"] or href
+            elif "/people/" in href or "ycombinator.com/people/" in href:
+                self._current["yc_profile_url"] = self._current["yc_profile_url"] or href
+
+    def handle_data(self, data: str) -> None:
+        if self._in_done:
+            return
+        text = data.strip()
+        if not text:
+            return
+
+        if text == "Active Founders":
+            self._in_active_founders = True
+            return
+        if text in {"Company Launches", "Jobs at", "Jobs at "} and self._in_active_founders:
+            self._in_active_founders = False
+            self._in_done = True
+            self._flush_current()
+            return
+
+        if not self._in_active_founders or not self._current:
+            return
+
+        if text in {"Founder", "Co-Founder", "Cofounder", "Co-founder"}:
+            self._current["role"] = self._current["role"] or text
+            self._capture_bio = True
+            return
+
+        if self._capture_bio:
+            self._bio_parts.append(text)
+
+    def close(self) -> None:
+        self._flush_current()
+        super().close()
+
+    @property
+    def done(self) -> bool:
+        """True once the founders section has ended; further input is ignored."""
+        return self._in_done
+
+    def founders(self) -> list[dict[str, Any]]:
+        return self._dedupe(self._founders)
+
+    def _flush_current(self) -> None:
+        if not self._current:
+            return
+        if self._bio_parts and not self._current.get("bio"):
+            self._current["bio"] = " ".join(self._bio_parts).strip()[:4000]
+        self._founders.append(self._current)
+        self._current = None
+        self._bio_parts = []
+        self._capture_bio = False
+
+    def _dedupe(self, founders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        seen: set[tuple[str, str, str]] = set()
+        out: list[dict[str, Any]] = []
+        for f in founders:
+            name = (f.get("name") or "").strip()
+            if not name:
+                continue
+            tw = (f.get("twitter_url") or "").strip()
+            li = (f.get("linkedin_url") or "").strip()
+            key = (name.lower(), tw, li)
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append(f)
+        return out
+
+
+def parse_founders_html(html: str) -> list[dict[str, Any]]:
+    section = founders_section(html)
+    if section is not None:
+        founders = _parse(section)
+        if founders:
+            return founders
+    return _parse(html, stop_early=True)
+
+
+def parse_founders_html_full(html: str) -> list[dict[str, Any]]:
+    """Tokenise the whole page; the reference the fast path must agree with."""
+    return _parse(html)
+
+
+def founders_section(html: str) -> str | None:
+    """The slice from the "Active Founders" text node up to the tag before the section end."""
+    start = _find_text_node(html, _SECTION_START, 0)
+    if start is None:
+        return None
+    end = _find_text_node(html, _SECTION_END, start)
+    return html[start : end if end is not None else len(html)]
+
+
+def _find_text_node(html: str, pattern: re.Pattern[str], pos: int) -> int | None:
+    """Index of the first match of `pattern` that is a whole text node outside <script>."""
+    for match in pattern.finditer(html, pos):
+        i = match.start()
+        j = i - 1
+        while j >= 0 and html[j] in " \t\r\n":
+            j -= 1
+        if j < 0 or html[j] != ">":
+            continue
+        if html.rfind("<script", 0, i) > html.rfind("</script", 0, i):
+            continue
+        return i
+    return None
+
+
+def _parse(html: str, *, stop_early: bool = False) -> list[dict[str, Any]]:
+    parser = FoundersHTMLParser()
+    if stop_early:
+        for offset in range(0, len(html), _FEED_CHUNK):
+            parser.feed(html[offset : offset + _FEED_CHUNK])
+            if parser.done:
+                break
+    else:
+        parser.feed(html)
+    parser.close()
+    return parser.founders()
+
+
+def parse_founders_html_many(pages: list[str]) -> list[list[dict[str, Any]]]:
+    """Parse a chunk of pages in one call (one process-pool round trip)."""
+    return [parse_founders_html(html) for html in pages]
@@ -0,0 +1,238 @@
+"""Streaming fetch → parse → write pipeline for the founders crawl.
+
+Each stage runs its own pool of worker tasks and hands items to the next one
+through a bounded queue, so one slow page only occupies a single fetch slot and
+fetching continues while the writer commits. The writer batches results by
+count or by age, whichever comes first. Per-stage throughput, busy time and
+queue depth are collected in `PipelineStats`.
+
+A fetch may raise `StopCrawl` to end the run early: fetch workers stop taking
+new companies, everything already fetched is parsed and written, and the
+exception is re-raised from `run_founders_pipeline`.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DONE = object()
+
+FounderResult = list[dict[str, Any]] | Exception
+
+
+class StopCrawl(Exception):
+    """Raised by a fetch to stop crawling further companies."""
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    items: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    _depth_total: int = 0
+    _depth_samples: int = 0
+
+    def observe_depth(self, depth: int) -> None:
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+
+    @property
+    def mean_queue_depth(self) -> float:
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        return {
+            "items": self.items,
+            "errors": self.errors,
+            "items_per_sec": round(self.items / elapsed, 2) if elapsed else None,
+            # Share of the stage's worker capacity spent working; ~1.0 marks the bottleneck.
+            "utilization": round(self.busy_seconds / (elapsed * self.workers), 3) if elapsed else None,
+            "mean_queue_depth": round(self.mean_queue_depth, 2),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+@dataclass
+class PipelineStats:
+    fetch: StageStats
+    parse: StageStats
+    write: StageStats
+    batches: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = self.elapsed
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "write_batches": self.batches,
+            **{s.name: s.summary(elapsed) for s in (self.fetch, self.parse, self.write)},
+        }
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    fetch_concurrency: int = 15
+    parse_concurrency: int = 1
+    queue_size: int = 100
+    write_batch_size: int = 50
+    write_interval: float = 2.0
+    report_interval: float = 30.0
+
+
+@dataclass
+class _Item(Generic[T]):
+    company_id: uuid.UUID
+    value: T | Exception
+
+
+async def run_founders_pipeline(
+    companies: Iterable[tuple[uuid.UUID, str]],
+    *,
+    fetch: Callable[[uuid.UUID, str], Awaitable[T]],
+    parse: Callable[[uuid.UUID, T], Awaitable[list[dict[str, Any]]]],
+    write: Callable[[dict[uuid.UUID, FounderResult]], Awaitable[None]],
+    config: PipelineConfig = PipelineConfig(),
+) -> PipelineStats:
+    """Crawl `(company_id, url)` pairs through fetch, parse and write stages.
+
+    A company whose fetch or parse raises is still passed to `write`, with the
+    exception in place of its founders list, so callers can count it as
+    processed and record the failure. An exception from `write` cancels the
+    whole pipeline and propagates.
+    """
+    stats = PipelineStats(
+        fetch=StageStats("fetch", config.fetch_concurrency),
+        parse=StageStats("parse", config.parse_concurrency),
+        write=StageStats("write", 1),
+    )
+    source = iter(companies)
+    parse_queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=config.queue_size)
+    write_queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=config.queue_size)
+    stopped: StopCrawl | None = None
+
+    async def fetch_worker() -> None:
+        nonlocal stopped
+        for company_id, url in source:
+            if stopped is not None:
+                return
+            start = time.perf_counter()
+            value: Any
+            try:
+                value = await fetch(company_id, url)
+            except StopCrawl as exc:
+                stopped = stopped or exc
+                stats.fetch.errors += 1
+                value = exc
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Founders fetch failed for %s: %s", url, exc)
+                stats.fetch.errors += 1
+                value = exc
+            stats.fetch.busy_seconds += time.perf_counter() - start
+            stats.fetch.items += 1
+            await parse_queue.put(_Item(company_id, value))
+
+    async def parse_worker() -> None:
+        while True:
+            stats.parse.observe_depth(parse_queue.qsize())
+            item = await parse_queue.get()
+            if item is _DONE:
+                return
+            start = time.perf_counter()
+            founders: FounderResult = item.value
+            if not isinstance(item.value, Exception):
+                try:
+                    founders = await parse(item.company_id, item.value)
+                except Exception as exc:  # noqa: BLE001
+                    logger.debug("Founders parse failed for %s: %s", item.company_id, exc)
+                    stats.parse.errors += 1
+                    founders = exc
+            stats.parse.busy_seconds += time.perf_counter() - start
+            stats.parse.items += 1
+            await write_queue.put(_Item(company_id=item.company_id, value=founders))
+
+    async def flush(batch: dict[uuid.UUID, FounderResult]) -> None:
+        start = time.perf_counter()
+        await write(batch)
+        stats.write.busy_seconds += time.perf_counter() - start
+        stats.write.items += len(batch)
+        stats.batches += 1
+
+    async def write_worker() -> None:
+        batch: dict[uuid.UUID, FounderResult] = {}
+        deadline = 0.0
+        while True:
+            stats.write.observe_depth(write_queue.qsize())
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = await asyncio.wait_for(write_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await flush(batch)
+                batch = {}
+                continue
+            if item is _DONE:
+                if batch:
+                    await flush(batch)
+                return
+            if not batch:
+                deadline = time.monotonic() + config.write_interval
+            batch[item.company_id] = item.value
+            if len(batch) >= config.write_batch_size:
+                await flush(batch)
+                batch = {}
+
+    async def stage(workers: list[Awaitable[None]], downstream: asyncio.Queue[Any], consumers: int) -> None:
+        await asyncio.gather(*workers)
+        for _ in range(consumers):
+            await downstream.put(_DONE)
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(config.report_interval)
+            logger.info(
+                "YC founders pipeline: fetched=%d parsed=%d written=%d parse_queue=%d write_queue=%d",
+                stats.fetch.items,
+                stats.parse.items,
+                stats.write.items,
+                parse_queue.qsize(),
+                write_queue.qsize(),
+            )
+
+    runners = [
+        asyncio.create_task(
+            stage([fetch_worker() for _ in range(config.fetch_concurrency)], parse_queue, config.parse_concurrency)
+        ),
+        asyncio.create_task(stage([parse_worker() for _ in range(config.parse_concurrency)], write_queue, 1)),
+        asyncio.create_task(write_worker()),
+    ]
+    reporter = asyncio.create_task(report())
+    try:
+        await asyncio.gather(*runners)
+    except BaseException:
+        for task in runners:
+            task.cancel()
+        await asyncio.gather(*runners, return_exceptions=True)
+        raise
+    finally:
+        reporter.cancel()
+        stats.finished_at = time.perf_counter()
+    if stopped is not None:
+        raise stopped
+    return stats
@@ -0,0 +1,110 @@
+"""On-disk HTTP conditional-request cache for the YC sync fetcher.
+
+Stores ETag / Last-Modified validators per URL (plus an optional parsed payload)
+as one JSON file per URL. Requests are sent with If-None-Match / If-Modified-Since;
+a 304 answer is served from the stored payload without reading or parsing a body.
+
+Callers read a URL's entry once per request (`get`), derive the request headers
+and the 304 check from it, and `store` full responses. Entry files are read and
+written in a worker thread, so disk latency does not stall the crawl's other
+requests.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    payload: Any = None
+
+
+class HTTPConditionalCache:
+    """Per-URL validator store with hit/miss counters.
+
+    A hit is a 304 answered from a stored entry; a miss is any full (200) response.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, url: str) -> CacheEntry | None:
+        return await asyncio.to_thread(self._read, url)
+
+    def request_headers(self, entry: CacheEntry | None) -> dict[str, str]:
+        """Conditional request headers for the stored `entry` of a URL."""
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified_entry(self, entry: CacheEntry | None, resp: httpx.Response) -> CacheEntry | None:
+        """Return the stored `entry` when `resp` is a 304 for it, counting a hit."""
+        if resp.status_code != httpx.codes.NOT_MODIFIED or entry is None:
+            return None
+        self.hits += 1
+        return entry
+
+    async def store(self, url: str, resp: httpx.Response, payload: Any = None) -> None:
+        """Remember validators from a full response, counting a miss."""
+        self.misses += 1
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = CacheEntry(url=url, etag=etag, last_modified=last_modified, payload=payload)
+        await asyncio.to_thread(self._write, url, entry)
+
+    def _read(self, url: str) -> CacheEntry | None:
+        path = self._path(url)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable HTTP cache entry %s: %s", path, exc)
+            return None
+        if raw.get("url") != url:
+            return None
+        return CacheEntry(**raw)
+
+    def _path(self, url: str) -> Path:
+        return self._directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _write(self, url: str, entry: CacheEntry) -> None:
+        path = self._path(url)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(asdict(entry), fh)
+                os.replace(tmp, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except OSError as exc:
+            logger.warning("Failed to write HTTP cache entry for %s: %s", url, exc)
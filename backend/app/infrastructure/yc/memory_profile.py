@@ -0,0 +1,125 @@
+"""Opt-in memory profiling of a YC sync run (YC_SYNC_PROFILE_MEMORY).
+
+The sync takes a checkpoint at its stage boundaries: when the feed download
+ends, after each decoded feed batch, after building and after writing each
+batch of company rows, once the founders crawl is planned, after each founders
+write batch, and at the end of the run. A checkpoint reads the process RSS,
+the memory `tracemalloc` traces, and the traced peak since the previous
+checkpoint. The run record keeps the maximum of each per stage, in the order
+the stages were first reached.
+
+Whenever a checkpoint traces more memory than every one before it, a snapshot
+is taken and its top allocation sites (by line) replace the kept ones. The
+record therefore shows where the memory was at the run's traced high point,
+and which stage that was. Snapshots are rare, but tracing slows every
+allocation, so this is for diagnosing a worker rather than for every run.
+
+Only this process is traced; founders parse worker processes
+(YC_FOUNDERS_PARSE_PROCESSES) are not.
+"""
+from __future__ import annotations
+
+import os
+import resource
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+_MB = 1024 * 1024
+_IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass
+class StageMemory:
+    stage: str
+    checkpoints: int = 0
+    rss_mb: float = 0.0
+    traced_mb: float = 0.0
+    # Traced high-water mark over the intervals that end at this stage's checkpoints
+    peak_traced_mb: float = 0.0
+
+
+@dataclass
+class MemoryProfiler:
+    """Checkpoints of one sync attempt; `start()` begins tracing, `stop()` ends it."""
+
+    top: int = 10
+    stages: dict[str, StageMemory] = field(default_factory=dict)
+    top_sites_stage: str | None = None
+    top_sites: list[dict[str, Any]] = field(default_factory=list)
+    _high: int = field(default=0, repr=False)
+    _owns_tracing: bool = field(default=False, repr=False)
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        tracemalloc.reset_peak()
+        self.checkpoint("start")
+
+    def stop(self) -> None:
+        """Stop tracing if `start()` started it. Idempotent."""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def checkpoint(self, stage: str) -> None:
+        if not tracemalloc.is_tracing():
+            return
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        entry = self.stages.setdefault(stage, StageMemory(stage))
+        entry.checkpoints += 1
+        entry.rss_mb = max(entry.rss_mb, round(rss_bytes() / _MB, 1))
+        entry.traced_mb = max(entry.traced_mb, round(traced / _MB, 1))
+        entry.peak_traced_mb = max(entry.peak_traced_mb, round(peak / _MB, 1))
+        if traced > self._high:
+            self._high = traced
+            self.top_sites = top_allocation_sites(tracemalloc.take_snapshot(), self.top)
+            self.top_sites_stage = stage
+
+    def summary(self) -> dict[str, Any]:
+        """The profile as stored on `YCSyncRun.memory_profile`."""
+        return {
+            "stages": [asdict(entry) for entry in self.stages.values()],
+            "top_sites_stage": self.top_sites_stage,
+            "top_sites": self.top_sites,
+        }
+
+
+def rss_bytes() -> int:
+    """The process's current resident set size; its peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is bytes on macOS and KiB elsewhere.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def top_allocation_sites(snapshot: tracemalloc.Snapshot, limit: int) -> list[dict[str, Any]]:
+    stats = snapshot.filter_traces(_IGNORED_FRAMES).statistics("lineno")[:limit]
+    return [
+        {
+            "site": f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in stats
+    ]
+
+
+def _short_path(filename: str) -> str:
+    """`filename` relative to the longest sys.path entry containing it."""
+    for prefix in sorted((p for p in sys.path if p), key=len, reverse=True):
+        if filename.startswith(prefix.rstrip(os.sep) + os.sep):
+            return filename[len(prefix.rstrip(os.sep)) + 1 :]
+    return filename
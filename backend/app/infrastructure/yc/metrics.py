@@ -0,0 +1,162 @@
+"""Prometheus metrics and per-run totals for the YC directory sync.
+
+Metrics live in the default `prometheus_client` registry, the one
+`prometheus_fastapi_instrumentator` exposes at `/metrics`. The sync runs in the
+sync worker, which serves the same registry on `YC_SYNC_METRICS_PORT`.
+
+Counters move while a run is in progress. Phase durations are observed once,
+when the run ends, together with the `YCSyncRun` history row. They come from
+the run's `SyncRunMetrics`.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.infrastructure.yc.memory_profile import MemoryProfiler
+from app.infrastructure.yc.recrawl import TIER_NAMES, RecrawlPlan
+
+T = TypeVar("T")
+
+PHASES = ("download", "parse", "company_upsert", "founder_crawl")
+
+PHASE_SECONDS = Histogram(
+    "yc_sync_phase_duration_seconds",
+    "Time spent per YC sync run in each phase",
+    ["phase"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+RUNS = Counter("yc_sync_runs_total", "YC sync runs by outcome", ["status"])
+PAGES = Counter(
+    "yc_sync_founders_pages_total",
+    "Founders pages requested, by result (fetched, not_modified, failed)",
+    ["result"],
+)
+BYTES = Counter("yc_sync_downloaded_bytes_total", "Response bytes downloaded by the YC sync", ["source"])
+FOUNDERS_PER_COMPANY = Histogram(
+    "yc_sync_founders_per_company",
+    "Founders parsed from each crawled company page",
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 12),
+)
+FOUNDERS_DUE = Gauge(
+    "yc_sync_founders_due_companies",
+    "Companies due for a founders re-crawl at the start of the last crawl, by tier",
+    ["tier"],
+)
+FOUNDERS_DEFERRED = Gauge(
+    "yc_sync_founders_deferred_companies",
+    "Due companies the last crawl left for later runs because of its page budget",
+)
+FEED_BATCHES = Counter(
+    "yc_sync_feed_batches_total",
+    "Per-batch feeds fetched by batch-sharded syncs, by result (ingested, unchanged)",
+    ["result"],
+)
+ROWS_WRITTEN = Counter("yc_sync_rows_written_total", "Rows inserted, updated or deleted by the YC sync", ["table"])
+
+
+@dataclass
+class SyncRunMetrics:
+    """Totals for one sync run, mirrored into the Prometheus metrics as they change."""
+
+    phase_seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    pages_fetched: int = 0
+    pages_not_modified: int = 0
+    pages_failed: int = 0
+    bytes_downloaded: int = 0
+    companies_parsed: int = 0
+    founders_parsed: int = 0
+    company_rows_written: int = 0
+    founder_rows_written: int = 0
+    # Set when the run is memory-profiled (YC_SYNC_PROFILE_MEMORY)
+    memory: MemoryProfiler | None = None
+
+    @contextmanager
+    def phase(self, name: str, *, exclude: tuple[str, ...] = ()) -> Iterator[None]:
+        """Add the block's wall time to `name`, minus what `exclude` phases gained meanwhile."""
+        before = sum(self.phase_seconds[p] for p in exclude)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            nested = sum(self.phase_seconds[p] for p in exclude) - before
+            self.phase_seconds[name] += time.perf_counter() - start - nested
+
+    async def metered_download(self, chunks: AsyncIterable[bytes], source: str) -> AsyncIterator[bytes]:
+        """Pass body chunks through, counting bytes and the time spent waiting for them."""
+        iterator = chunks.__aiter__()
+        while True:
+            with self.phase("download"):
+                try:
+                    chunk = await iterator.__anext__()
+                except StopAsyncIteration:
+                    self.checkpoint("download")
+                    return
+            self.record_bytes(len(chunk), source)
+            yield chunk
+
+    async def parsed_batches(self, batches: AsyncIterable[T]) -> AsyncIterator[T]:
+        """Pass decoded batches through, counting the time spent decoding them as parse time."""
+        iterator = batches.__aiter__()
+        while True:
+            with self.phase("parse", exclude=("download",)):
+                try:
+                    batch = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            self.checkpoint("parse")
+            yield batch
+
+    def checkpoint(self, stage: str) -> None:
+        """Record memory at a stage boundary if the run is memory-profiled."""
+        if self.memory is not None:
+            self.memory.checkpoint(stage)
+
+    def record_bytes(self, count: int, source: str) -> None:
+        self.bytes_downloaded += count
+        BYTES.labels(source=source).inc(count)
+
+    def record_page(self, *, not_modified: bool) -> None:
+        if not_modified:
+            self.pages_not_modified += 1
+        else:
+            self.pages_fetched += 1
+        PAGES.labels(result="not_modified" if not_modified else "fetched").inc()
+
+    def record_failed_pages(self, count: int) -> None:
+        self.pages_failed += count
+        PAGES.labels(result="failed").inc(count)
+
+    def record_feed_batches(self, *, ingested: int, unchanged: int) -> None:
+        FEED_BATCHES.labels(result="ingested").inc(ingested)
+        FEED_BATCHES.labels(result="unchanged").inc(unchanged)
+
+    def record_founders(self, count: int) -> None:
+        self.companies_parsed += 1
+        self.founders_parsed += count
+        FOUNDERS_PER_COMPANY.observe(count)
+
+    def record_recrawl_plan(self, plan: RecrawlPlan) -> None:
+        for tier in TIER_NAMES:
+            FOUNDERS_DUE.labels(tier=tier).set(plan.due_by_tier[tier])
+        FOUNDERS_DEFERRED.set(plan.deferred)
+
+    def record_rows(self, table: str, count: int) -> None:
+        if table == "yccompany":
+            self.company_rows_written += count
+        else:
+            self.founder_rows_written += count
+        ROWS_WRITTEN.labels(table=table).inc(count)
+
+    def finish(self, status: str) -> None:
+        """Observe this run's phase durations and outcome, and stop memory tracing."""
+        if self.memory is not None:
+            self.memory.stop()
+        for name, seconds in self.phase_seconds.items():
+            PHASE_SECONDS.labels(phase=name).observe(seconds)
+        RUNS.labels(status=status).inc()
@@ -0,0 +1,94 @@
+"""Founders page parsing in a process pool, off the event loop.
+
+`FoundersParsePool.parse()` is awaited per page, like inline parsing, but pages
+are collected into chunks of up to `chunk_size` and each chunk is parsed by a
+single pool task to amortise pickling and IPC per submission. A partial chunk
+is submitted on the next event-loop iteration, so nothing waits for a chunk to
+fill up.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from app.infrastructure.yc.founders_parser import (
+    parse_founders_html,
+    parse_founders_html_many,
+)
+
+
+class FoundersParsePool:
+    def __init__(self, processes: int, chunk_size: int = 8) -> None:
+        self.processes = processes
+        self.chunk_size = max(1, chunk_size)
+        self.submitted_chunks = 0
+        # "spawn" keeps workers free of the parent's sockets, threads and event loop.
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._pending: list[tuple[str, asyncio.Future[list[dict[str, Any]]]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+
+    @property
+    def concurrency(self) -> int:
+        """Parse stage workers needed to keep every process busy with full chunks."""
+        return self.processes * self.chunk_size
+
+    async def parse(self, html: str) -> list[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        result: asyncio.Future[list[dict[str, Any]]] = loop.create_future()
+        self._pending.append((html, result))
+        if len(self._pending) >= self.chunk_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush)
+        return await result
+
+    def close(self) -> None:
+        self._flush()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> FoundersParsePool:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        chunk, self._pending = self._pending, []
+        pages = [html for html, _ in chunk]
+        futures = [f for _, f in chunk]
+        self.submitted_chunks += 1
+        submitted = self._executor.submit(parse_founders_html_many, pages)
+        loop = asyncio.get_running_loop()
+        submitted.add_done_callback(lambda done: loop.call_soon_threadsafe(_resolve, done, futures))
+
+
+def _resolve(done: Future[list[list[dict[str, Any]]]], futures: list[asyncio.Future[Any]]) -> None:
+    if done.cancelled():
+        for f in futures:
+            if not f.done():
+                f.cancel()
+        return
+    exc = done.exception()
+    if exc is not None:
+        for f in futures:
+            if not f.done():
+                f.set_exception(exc)
+        return
+    for f, founders in zip(futures, done.result(), strict=True):
+        if not f.done():
+            f.set_result(founders)
+
+
+async def parse_inline(html: str) -> list[dict[str, Any]]:
+    """Parse on the event loop; the behaviour without a pool."""
+    return parse_founders_html(html)
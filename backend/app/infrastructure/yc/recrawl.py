@@ -0,0 +1,139 @@
+"""Which company pages a founders crawl visits, and in what order.
+
+Each company has a re-crawl interval. Active companies and companies from
+recent batches start at `active_interval`; the interval doubles with every
+crawl that found their founders unchanged, up to `long_tail_interval`, which
+every other company gets. A company is due once its interval has passed since
+its last successful crawl.
+
+Due companies are ranked in tiers, oldest crawl first within a tier, and a run
+crawls at most `budget` of them:
+
+0. new companies and companies whose last crawl failed
+1. companies whose founders are older than the `sla`
+2. active / recent companies
+3. the long tail
+"""
+from __future__ import annotations
+
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+NEW, PAST_SLA, ACTIVE, LONG_TAIL = range(4)
+TIER_NAMES = ("new", "past_sla", "active", "long_tail")
+# Doublings of the active interval; far beyond any sensible long-tail interval.
+_MAX_BACKOFF = 16
+
+# (tier, last crawl as a Unix timestamp, yc_id); also the crawl's checkpoint cursor
+CrawlKey = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class RecrawlPolicy:
+    # Pages per run; 0 crawls every due company
+    budget: int = 1500
+    sla: timedelta = timedelta(days=30)
+    active_interval: timedelta = timedelta(days=3)
+    long_tail_interval: timedelta = timedelta(days=21)
+    # Batches from this many years back count as recent
+    recent_years: int = 3
+
+
+@dataclass(frozen=True)
+class CrawlCandidate:
+    company_id: uuid.UUID
+    url: str
+    yc_id: int
+    status: str
+    year: int
+    crawled_at: datetime | None
+    failed_at: datetime | None
+    unchanged_crawls: int = 0
+
+
+@dataclass
+class RecrawlPlan:
+    companies: list[tuple[CrawlCandidate, CrawlKey]]
+    due: int
+    candidates: int
+    # Due companies per tier, including those left out by the budget
+    due_by_tier: Counter[str]
+
+    @property
+    def past_sla(self) -> int:
+        return self.due_by_tier["past_sla"]
+
+    @property
+    def deferred(self) -> int:
+        return self.due - len(self.companies)
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "candidates": self.candidates,
+            "due": self.due,
+            "planned": len(self.companies),
+            "deferred": self.deferred,
+            **{f"due_{name}": self.due_by_tier[name] for name in TIER_NAMES},
+        }
+
+
+def is_active(policy: RecrawlPolicy, company: CrawlCandidate, now: datetime) -> bool:
+    return company.status == "Active" or company.year >= now.year - policy.recent_years
+
+
+def recrawl_interval(policy: RecrawlPolicy, company: CrawlCandidate, now: datetime) -> timedelta:
+    if not is_active(policy, company, now):
+        return policy.long_tail_interval
+    factor: int = 2 ** min(company.unchanged_crawls, _MAX_BACKOFF)
+    backoff = policy.active_interval * factor
+    return min(backoff, policy.long_tail_interval)
+
+
+def crawl_key(policy: RecrawlPolicy, company: CrawlCandidate, now: datetime) -> CrawlKey | None:
+    """The company's place in the crawl order, or None if it is not due."""
+    crawled_at = company.crawled_at
+    if crawled_at is None or company.failed_at is not None:
+        tier = NEW
+    else:
+        age = now - crawled_at
+        if age >= policy.sla:
+            tier = PAST_SLA
+        elif age < recrawl_interval(policy, company, now):
+            return None
+        else:
+            tier = ACTIVE if is_active(policy, company, now) else LONG_TAIL
+    timestamp = int(crawled_at.replace(tzinfo=timezone.utc).timestamp()) if crawled_at is not None else 0
+    return tier, timestamp, company.yc_id
+
+
+def plan_recrawl(
+    policy: RecrawlPolicy,
+    companies: Iterable[CrawlCandidate],
+    now: datetime,
+    *,
+    after: CrawlKey | None = None,
+    spent: int = 0,
+) -> RecrawlPlan:
+    """Due companies in crawl order, after the `after` cursor, within what is left of the budget.
+
+    `spent` is the part of the budget a resumed run already used.
+    """
+    keyed: list[tuple[CrawlCandidate, CrawlKey]] = []
+    due_by_tier: Counter[str] = Counter()
+    candidates = 0
+    for company in companies:
+        candidates += 1
+        key = crawl_key(policy, company, now)
+        if key is None:
+            continue
+        due_by_tier[TIER_NAMES[key[0]]] += 1
+        if after is None or key > after:
+            keyed.append((company, key))
+    keyed.sort(key=lambda item: item[1])
+    due = len(keyed)
+    if policy.budget:
+        keyed = keyed[: max(0, policy.budget - spent)]
+    return RecrawlPlan(companies=keyed, due=due, candidates=candidates, due_by_tier=due_by_tier)
@@ -0,0 +1,187 @@
+"""Record and replay the YC sync's upstream HTTP traffic.
+
+`RecordingTransport` forwards requests to the network and writes every response
+(status, headers, decoded body) to a zip archive. Conditional request headers
+are dropped while recording, so the archive holds full bodies even when the
+HTTP cache has validators for a URL.
+
+`ReplayTransport` answers requests from such an archive without network access.
+It honours If-None-Match / If-Modified-Since against the recorded validators,
+answers 404 for URLs that were not recorded, and can inject latency, error
+statuses and timeouts (`ReplayFaults`) from a seeded RNG, so a replayed run is
+repeatable.
+
+Archive layout: `index.json` maps a key per method + URL to the recorded
+status, headers and the archive member holding the body.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import zipfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+INDEX_MEMBER = "index.json"
+CHUNK_SIZE = 64 * 1024
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+# The recorded body is already decoded and re-framed on replay.
+_FRAMING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _key(method: str, url: httpx.URL | str) -> str:
+    return hashlib.sha256(f"{method.upper()} {httpx.URL(url)}".encode()).hexdigest()
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forwards to `transport` and archives every response to `path`.
+
+    Bodies are written as they arrive; the index is written and the archive
+    moved into place when the client closes the transport.
+    """
+
+    def __init__(self, path: str | Path, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._path = Path(path)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._tmp_path = self._path.with_name(self._path.name + ".partial")
+        self._zip: zipfile.ZipFile | None = None
+        self._index: dict[str, dict[str, Any]] = {}
+        self._bodies = 0
+
+    @property
+    def recorded(self) -> int:
+        return len(self._index)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for name in CONDITIONAL_HEADERS:
+            request.headers.pop(name, None)
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _FRAMING_HEADERS]
+        key = _key(request.method, request.url)
+        if self._zip is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._zip = zipfile.ZipFile(self._tmp_path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._bodies += 1
+        member = f"bodies/{self._bodies}"
+        self._zip.writestr(member, body)
+        # A URL requested again (e.g. a retry) keeps its latest answer.
+        self._index[key] = {
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "body": member,
+        }
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+        if self._zip is None:
+            return
+        self._zip.writestr(INDEX_MEMBER, json.dumps(self._index))
+        self._zip.close()
+        self._zip = None
+        os.replace(self._tmp_path, self._path)
+        logger.info("Recorded %d YC source responses to %s", len(self._index), self._path)
+
+
+@dataclass(frozen=True)
+class ReplayFaults:
+    # Added to every replayed response: `latency` plus up to `jitter` seconds
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability of answering with one of `error_statuses` instead of the recording
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (503,)
+    # Sent as Retry-After on injected errors, if set
+    retry_after: float | None = None
+    # Probability of raising a read timeout instead of answering
+    timeout_rate: float = 0.0
+    # Hosts that are never faulted (latency still applies)
+    exempt_hosts: frozenset[str] = frozenset()
+    seed: int = 0
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves recorded responses from the archive at `path`, with optional faults."""
+
+    def __init__(self, path: str | Path, faults: ReplayFaults = ReplayFaults()) -> None:
+        self._zip = zipfile.ZipFile(path)
+        self._index: dict[str, dict[str, Any]] = json.loads(self._zip.read(INDEX_MEMBER))
+        self.faults = faults
+        self._rng = random.Random(faults.seed)
+        self.served = 0
+        self.missing = 0
+        self.injected_errors = 0
+        self.injected_timeouts = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        faults = self.faults
+        if faults.latency or faults.jitter:
+            await asyncio.sleep(faults.latency + self._rng.uniform(0, faults.jitter))
+        if request.url.host not in faults.exempt_hosts:
+            if faults.timeout_rate and self._rng.random() < faults.timeout_rate:
+                self.injected_timeouts += 1
+                raise httpx.ReadTimeout("Injected replay timeout", request=request)
+            if faults.error_rate and self._rng.random() < faults.error_rate:
+                self.injected_errors += 1
+                headers = httpx.Headers()
+                if faults.retry_after is not None:
+                    headers["Retry-After"] = str(int(faults.retry_after))
+                return httpx.Response(
+                    self._rng.choice(faults.error_statuses), headers=headers, request=request
+                )
+
+        key = _key(request.method, request.url)
+        entry = self._index.get(key)
+        if entry is None:
+            self.missing += 1
+            logger.warning("No recorded response for %s %s", request.method, request.url)
+            return httpx.Response(404, text="Not in the replay archive", request=request)
+
+        self.served += 1
+        headers = httpx.Headers(entry["headers"])
+        if _not_modified(request.headers, headers):
+            validators = httpx.Headers({k: headers[k] for k in ("etag", "last-modified") if k in headers})
+            return httpx.Response(304, headers=validators, request=request)
+        return httpx.Response(
+            entry["status"], headers=headers, content=self._body(entry["body"]), request=request
+        )
+
+    async def _body(self, member: str) -> AsyncIterator[bytes]:
+        with self._zip.open(member) as fh:
+            while chunk := fh.read(CHUNK_SIZE):
+                yield chunk
+
+    async def aclose(self) -> None:
+        self._zip.close()
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "served": self.served,
+            "missing": self.missing,
+            "injected_errors": self.injected_errors,
+            "injected_timeouts": self.injected_timeouts,
+        }
+
+
+def _not_modified(request_headers: httpx.Headers, recorded: httpx.Headers) -> bool:
+    etag = recorded.get("etag")
+    if etag and request_headers.get("if-none-match") == etag:
+        return True
+    last_modified = recorded.get("last-modified")
+    return bool(last_modified and request_headers.get("if-modified-since") == last_modified)
@@ -0,0 +1,303 @@
+"""Row mapping and diffing primitives shared by the YC sync loaders."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import uuid
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CompanyDiff:
+    """Counts from comparing a feed snapshot against the stored companies."""
+
+    inserted: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    disappeared: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.changed + self.unchanged
+
+
+class CompanyDiffer:
+    """Incrementally split feed rows into inserted/changed/unchanged.
+
+    `existing` maps stored yc_id -> content_hash; rows stored before hashing was
+    introduced have a NULL hash and are treated as changed so they get backfilled.
+    Duplicate yc_ids in the feed keep the first occurrence.
+    """
+
+    def __init__(self, existing: dict[int, str | None]) -> None:
+        self._existing = existing
+        self._seen: set[int] = set()
+        self._diff = CompanyDiff()
+
+    def writes(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the rows from `rows` that are new or whose content changed."""
+        out: list[dict[str, Any]] = []
+        for row in rows:
+            yc_id = row["yc_id"]
+            if yc_id in self._seen:
+                continue
+            self._seen.add(yc_id)
+            if yc_id not in self._existing:
+                self._diff.inserted += 1
+                out.append(row)
+            elif self._existing[yc_id] != row["content_hash"]:
+                self._diff.changed += 1
+                out.append(row)
+            else:
+                self._diff.unchanged += 1
+        return out
+
+    def missing(self, within: Collection[int] | None = None) -> list[int]:
+        """Stored yc_ids (of those in `within`, if given) the feed did not list."""
+        stored = self._existing if within is None else within
+        return [yc_id for yc_id in stored if yc_id not in self._seen]
+
+    def finish(self, within: Collection[int] | None = None) -> CompanyDiff:
+        """The final counts; only stored yc_ids in `within`, if given, can count as disappeared."""
+        self._diff.disappeared = len(self.missing(within))
+        return self._diff
+
+
+def company_row(raw: dict[str, Any]) -> dict[str, Any]:
+    """Map one all.json entry to YCCompany column values plus its content hash."""
+    row: dict[str, Any] = {
+        "yc_id": raw["id"],
+        "name": raw["name"],
+        "slug": raw["slug"],
+        "batch": raw.get("batch") or "",
+        "batch_code": batch_code(raw.get("batch")),
+        "year": batch_year(raw.get("batch")),
+        "status": raw.get("status") or "",
+        "industry": raw.get("industry"),
+        "subindustry": raw.get("subindustry"),
+        "website": raw.get("website"),
+        "all_locations": raw.get("all_locations"),
+        "one_liner": raw.get("one_liner"),
+        "long_description": raw.get("long_description"),
+        "team_size": raw.get("team_size"),
+        "small_logo_thumb_url": raw.get("small_logo_thumb_url"),
+        "url": raw.get("url") or "",
+        "is_hiring": bool(raw.get("isHiring")),
+        "nonprofit": bool(raw.get("nonprofit")),
+        "top_company": bool(raw.get("top_company")),
+        "industries": list(raw.get("industries") or []),
+        "regions": list(raw.get("regions") or []),
+        "tags": list(raw.get("tags") or []),
+        "launched_at": raw.get("launched_at"),
+    }
+    row["content_hash"] = content_hash(row)
+    return row
+
+
+COMPANY_FIELDS = (
+    "yc_id",
+    "name",
+    "slug",
+    "batch",
+    "batch_code",
+    "year",
+    "status",
+    "industry",
+    "subindustry",
+    "website",
+    "all_locations",
+    "one_liner",
+    "long_description",
+    "team_size",
+    "small_logo_thumb_url",
+    "url",
+    "is_hiring",
+    "nonprofit",
+    "top_company",
+    "industries",
+    "regions",
+    "tags",
+    "launched_at",
+    "content_hash",
+)
+
+
+def content_hash(row: dict[str, Any]) -> str:
+    payload = json.dumps(row, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class FounderWrites:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+    def __iadd__(self, other: FounderWrites) -> FounderWrites:
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.deleted += other.deleted
+        return self
+
+
+# Stored on the founder (YCFounder), shared by all of their companies
+FOUNDER_FIELDS = (
+    "name",
+    "bio",
+    "yc_profile_url",
+    "twitter_url",
+    "linkedin_url",
+    "avatar_url",
+)
+# Stored on the company's link to the founder (YCCompanyFounder)
+COMPANY_FOUNDER_FIELDS = (
+    "founder_id",
+    "sort_order",
+    "role",
+)
+_LINKEDIN_HANDLE = re.compile(r"^(?:[a-z]+\.)?linkedin\.com/in/([^/]+)")
+_X_HANDLE = re.compile(r"^(?:twitter|x)\.com/([^/]+)")
+
+
+def founder_key(name: str, yc_profile_url: str | None) -> str:
+    """Stable per-company founder identity; mirrored in SQL by the founder_key migration."""
+    raw = f"{name.strip().lower()}|{yc_profile_url or ''}"
+    return hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def founder_identity_key(
+    company_id: uuid.UUID,
+    name: str,
+    yc_profile_url: str | None,
+    twitter_url: str | None,
+    linkedin_url: str | None,
+) -> str:
+    """Identity of a founder across companies; mirrored in SQL by the founder identity migration.
+
+    The canonical YC profile URL if there is one, else the name together with a
+    LinkedIn or X handle. Founders with neither are not matched across companies.
+    """
+    profile = _canonical_url(yc_profile_url)
+    if profile:
+        raw = f"profile|{profile}"
+    else:
+        handle = _social_handle(twitter_url, linkedin_url)
+        name_key = name.strip().lower()
+        raw = f"name|{name_key}|{handle}" if handle else f"company|{company_id}|{name_key}"
+    return hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _canonical_url(url: str | None) -> str:
+    """Lower-cased, without scheme, "www.", query, fragment and trailing slashes."""
+    if not url:
+        return ""
+    url = re.sub(r"^https?://(www\.)?", "", url.strip().lower())
+    return re.split(r"[?#]", url, maxsplit=1)[0].rstrip("/")
+
+
+def _social_handle(twitter_url: str | None, linkedin_url: str | None) -> str:
+    linkedin = _LINKEDIN_HANDLE.match(_canonical_url(linkedin_url))
+    if linkedin:
+        return f"linkedin:{linkedin.group(1)}"
+    x = _X_HANDLE.match(_canonical_url(twitter_url))
+    if x:
+        return f"x:{x.group(1)}"
+    return ""
+
+
+def founders_hash(rows: list[dict[str, Any]]) -> str:
+    """Digest of a company's founder rows, to tell whether a crawl changed them."""
+    return content_hash(
+        {"founders": [{k: v for k, v in row.items() if k not in ("company_id", "identity_key")} for row in rows]}
+    )
+
+
+def founder_rows(company_id: uuid.UUID, founders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Map parsed founders to YCFounder and YCCompanyFounder column values, keeping the first row per key.
+
+    Rows carry the per-company `founder_key` and the cross-company
+    `identity_key`; the sync resolves the latter to a `founder_id`.
+    """
+    rows: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for f in founders:
+        name = f.get("name") or ""
+        key = founder_key(name, f.get("yc_profile_url"))
+        if key in seen:
+            continue
+        seen.add(key)
+        rows.append({
+            "company_id": company_id,
+            "founder_key": key,
+            "identity_key": founder_identity_key(
+                company_id, name, f.get("yc_profile_url"), f.get("twitter_url"), f.get("linkedin_url")
+            ),
+            "sort_order": len(rows),
+            "name": name,
+            "role": f.get("role"),
+            "bio": f.get("bio"),
+            "yc_profile_url": f.get("yc_profile_url"),
+            "twitter_url": f.get("twitter_url"),
+            "linkedin_url": f.get("linkedin_url"),
+            "avatar_url": (f.get("avatar_url") or "").split("?", 1)[0] or None,
+        })
+    return rows
+
+
+def diff_founders(
+    existing: dict[str, dict[str, Any]],
+    desired: list[dict[str, Any]],
+    *,
+    key: str = "founder_key",
+    fields: tuple[str, ...] = FOUNDER_FIELDS,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]:
+    """Compare stored founder rows (by `key`) with freshly parsed ones on `fields`.
+
+    Returns (new rows, changed rows, keys to delete).
+    """
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    for row in desired:
+        current = existing.get(row[key])
+        if current is None:
+            inserts.append(row)
+        elif any(current.get(f) != row[f] for f in fields):
+            updates.append(row)
+    desired_keys = {row[key] for row in desired}
+    deletes = [key for key in existing if key not in desired_keys]
+    return inserts, updates, deletes
+
+
+def batch_code(batch: str | None) -> str:
+    if not batch:
+        return ""
+    parts = batch.split()
+    if len(parts) != 2:
+        return ""
+    season, year_str = parts
+    short = "W" if season.lower().startswith("winter") else "S"
+    try:
+        year = int(year_str)
+    except ValueError:
+        return ""
+    return f"{short}{year}"
+
+
+def batch_year(batch: str | None) -> int:
+    if not batch:
+        return 0
+    parts = batch.split()
+    if len(parts) != 2:
+        return 0
+    try:
+        return int(parts[1])
+    except ValueError:
+        return 0
+
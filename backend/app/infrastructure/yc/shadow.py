@@ -0,0 +1,187 @@
+"""Shadow-table refreshes of the YC directory tables.
+
+With YC_SYNC_SWAP the sync never writes to the live directory tables.
+A new run copies them into the `yc_shadow` schema with only the primary, unique
+and foreign keys the loaders need, then does all of its writes there through
+`ShadowSessionLocal` sessions, whose search_path puts `yc_shadow` first. Once
+the run is complete, the remaining indexes are built and the shadow tables are
+moved into `public` in one transaction. The tables they replace move to
+`yc_previous`, where `rollback_swap()` can swap them back.
+
+Readers only ever see a complete snapshot, and the sync's write transactions
+never touch the tables they read.
+"""
+from __future__ import annotations
+
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config.config import settings
+
+logger = logging.getLogger(__name__)
+
+LIVE_SCHEMA = "public"
+SHADOW_SCHEMA = "yc_shadow"
+PREVIOUS_SCHEMA = "yc_previous"
+# Parents before children. The change log is swapped with the directory it describes.
+TABLES = ("yccompany", "ycfounder", "yccompanyfounder", "yccompanychange")
+# How long the swap waits for readers' locks before failing the run.
+SWAP_LOCK_TIMEOUT = "5s"
+
+shadow_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=2,
+    max_overflow=2,
+    pool_pre_ping=True,
+    connect_args={"options": f"-c search_path={SHADOW_SCHEMA},{LIVE_SCHEMA}"},
+)
+
+ShadowSessionLocal = async_sessionmaker(shadow_engine, expire_on_commit=False)
+
+
+async def shadow_ready(session: AsyncSession) -> bool:
+    """Whether a previous `prepare_shadow()` left shadow tables to resume into."""
+    return await _has_tables(session, SHADOW_SCHEMA)
+
+
+async def prepare_shadow(session: AsyncSession) -> None:
+    """Recreate the shadow tables as a copy of the live ones, keys only."""
+    await session.execute(text(f"DROP SCHEMA IF EXISTS {SHADOW_SCHEMA} CASCADE"))
+    await session.execute(text(f"CREATE SCHEMA {SHADOW_SCHEMA}"))
+    for table in TABLES:
+        await session.execute(
+            text(
+                f"CREATE TABLE {SHADOW_SCHEMA}.{table} (LIKE {LIVE_SCHEMA}.{table} "
+                "INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS)"
+            )
+        )
+        constraints = await session.execute(
+            text(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = CAST(:table AS regclass) AND contype IN ('p', 'u', 'f') "
+                "ORDER BY contype DESC"
+            ),
+            {"table": f"{LIVE_SCHEMA}.{table}"},
+        )
+        for name, definition in constraints.all():
+            await session.execute(
+                text(
+                    f'ALTER TABLE {SHADOW_SCHEMA}.{table} ADD CONSTRAINT "{name}" '
+                    f"{_retarget_references(definition, SHADOW_SCHEMA)}"
+                )
+            )
+        for definition in await _index_defs(session, table, unique=True):
+            await session.execute(text(_retarget_index(definition, table, SHADOW_SCHEMA)))
+        columns = ", ".join(await _stored_columns(session, table))
+        await session.execute(
+            text(
+                f"INSERT INTO {SHADOW_SCHEMA}.{table} ({columns}) "
+                f"SELECT {columns} FROM {LIVE_SCHEMA}.{table}"
+            )
+        )
+    await session.commit()
+
+
+async def build_shadow_indexes(session: AsyncSession) -> None:
+    """Create the live tables' remaining indexes on the loaded shadow tables."""
+    for table in TABLES:
+        for definition in await _index_defs(session, table, unique=False):
+            await session.execute(text(_retarget_index(definition, table, SHADOW_SCHEMA)))
+        await session.execute(text(f"ANALYZE {SHADOW_SCHEMA}.{table}"))
+    await session.commit()
+
+
+async def swap_in_shadow(session: AsyncSession) -> None:
+    """Make the shadow tables live and keep the replaced ones as the previous snapshot."""
+    await session.execute(text(f"SET LOCAL lock_timeout = '{SWAP_LOCK_TIMEOUT}'"))
+    await session.execute(text(f"DROP SCHEMA IF EXISTS {PREVIOUS_SCHEMA} CASCADE"))
+    await session.execute(text(f"CREATE SCHEMA {PREVIOUS_SCHEMA}"))
+    await _move_tables(session, LIVE_SCHEMA, PREVIOUS_SCHEMA)
+    await _move_tables(session, SHADOW_SCHEMA, LIVE_SCHEMA)
+    # Also drops the loaders' staging tables.
+    await session.execute(text(f"DROP SCHEMA {SHADOW_SCHEMA} CASCADE"))
+    await session.commit()
+
+
+async def rollback_swap(session: AsyncSession) -> bool:
+    """Swap the previous snapshot back in; the current one becomes the previous.
+
+    False if there is no previous snapshot, or if a migration changed the live
+    tables' columns since it was taken. Does not commit.
+    """
+    if not await _has_tables(session, PREVIOUS_SCHEMA):
+        return False
+    for table in TABLES:
+        if await _column_types(session, PREVIOUS_SCHEMA, table) != await _column_types(session, LIVE_SCHEMA, table):
+            logger.warning("Not rolling back YC directory: %s.%s has different columns", PREVIOUS_SCHEMA, table)
+            return False
+    await session.execute(text(f"SET LOCAL lock_timeout = '{SWAP_LOCK_TIMEOUT}'"))
+    await session.execute(text("CREATE SCHEMA yc_rollback"))
+    await _move_tables(session, LIVE_SCHEMA, "yc_rollback")
+    await _move_tables(session, PREVIOUS_SCHEMA, LIVE_SCHEMA)
+    await _move_tables(session, "yc_rollback", PREVIOUS_SCHEMA)
+    await session.execute(text("DROP SCHEMA yc_rollback"))
+    return True
+
+
+async def _move_tables(session: AsyncSession, source: str, target: str) -> None:
+    for table in TABLES:
+        await session.execute(text(f"ALTER TABLE {source}.{table} SET SCHEMA {target}"))
+
+
+async def _has_tables(session: AsyncSession, schema: str) -> bool:
+    count = await session.scalar(
+        text("SELECT count(*) FROM pg_tables WHERE schemaname = :schema AND tablename = ANY(:tables)"),
+        {"schema": schema, "tables": list(TABLES)},
+    )
+    return bool(count == len(TABLES))
+
+
+async def _index_defs(session: AsyncSession, table: str, *, unique: bool) -> list[str]:
+    """CREATE INDEX statements of the live table's indexes that do not back a constraint."""
+    result = await session.execute(
+        text(
+            "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "WHERE i.indrelid = CAST(:table AS regclass) AND i.indisunique = :unique "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint c "
+            "WHERE c.conindid = i.indexrelid AND c.contype IN ('p', 'u', 'x'))"
+        ),
+        {"table": f"{LIVE_SCHEMA}.{table}", "unique": unique},
+    )
+    return list(result.scalars().all())
+
+
+async def _stored_columns(session: AsyncSession, table: str) -> list[str]:
+    result = await session.execute(
+        text(
+            "SELECT quote_ident(column_name) FROM information_schema.columns "
+            "WHERE table_schema = :schema AND table_name = :table AND is_generated = 'NEVER' "
+            "ORDER BY ordinal_position"
+        ),
+        {"schema": LIVE_SCHEMA, "table": table},
+    )
+    return list(result.scalars().all())
+
+
+async def _column_types(session: AsyncSession, schema: str, table: str) -> list[tuple[str, str]]:
+    result = await session.execute(
+        text(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = :schema AND table_name = :table ORDER BY column_name"
+        ),
+        {"schema": schema, "table": table},
+    )
+    return [tuple(row) for row in result.all()]
+
+
+def _retarget_index(definition: str, table: str, schema: str) -> str:
+    definition = re.sub(rf" ON (ONLY )?(\w+\.)?{table} ", rf" ON \g<1>{schema}.{table} ", definition, count=1)
+    return re.sub(r"^CREATE (UNIQUE )?INDEX ", r"CREATE \g<1>INDEX IF NOT EXISTS ", definition)
+
+
+def _retarget_references(definition: str, schema: str) -> str:
+    tables = "|".join(TABLES)
+    return re.sub(rf"REFERENCES (\w+\.)?({tables})\(", rf"REFERENCES {schema}.\g<2>(", definition)
@@ -1,274 +1,868 @@
 from __future__ import annotations
 
+import logging
+import time
 import uuid
-from datetime import datetime
-from html.parser import HTMLParser
+from collections.abc import AsyncIterable, Awaitable, Callable, Collection, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import (
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
+from app.core.config.config import settings
 from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_founder import YCCompanyFounder
 from app.domain.entities.db.yc_founder import YCFounder
+from app.domain.entities.db.yc_sync_run import YCSyncRun
 from app.domain.entities.db.yc_sync_state import YCSyncState
-
+from app.infrastructure.yc.bulk_load import (
+    copy_companies,
+    copy_founders,
+    prepare_founder_stage,
+)
+from app.infrastructure.yc.changes import (
+    ADDED,
+    UPDATED,
+    log_changes,
+    mark_removed,
+    prune_change_log,
+)
+from app.infrastructure.yc.crawl_policy import AIMDConfig, CrawlPolicy, RetryPolicy
+from app.infrastructure.yc.feed import (
+    batch_feed_entries,
+    feed_batches,
+    fetch_batch_feeds,
+)
+from app.infrastructure.yc.founders_pipeline import (
+    FounderResult,
+    PipelineConfig,
+    run_founders_pipeline,
+)
+from app.infrastructure.yc.http_cache import HTTPConditionalCache
+from app.infrastructure.yc.memory_profile import MemoryProfiler
+from app.infrastructure.yc.metrics import SyncRunMetrics
+from app.infrastructure.yc.parse_pool import FoundersParsePool, parse_inline
+from app.infrastructure.yc.recrawl import (
+    CrawlCandidate,
+    CrawlKey,
+    RecrawlPolicy,
+    plan_recrawl,
+)
+from app.infrastructure.yc.replay import (
+    RecordingTransport,
+    ReplayFaults,
+    ReplayTransport,
+)
+from app.infrastructure.yc.rows import (
+    COMPANY_FIELDS,
+    COMPANY_FOUNDER_FIELDS,
+    FOUNDER_FIELDS,
+    CompanyDiff,
+    CompanyDiffer,
+    FounderWrites,
+    company_row,
+    diff_founders,
+    founder_rows,
+    founders_hash,
+)
+from app.infrastructure.yc.shadow import (
+    ShadowSessionLocal,
+    build_shadow_indexes,
+    prepare_shadow,
+    shadow_ready,
+    swap_in_shadow,
+)
+
+logger = logging.getLogger(__name__)
 
 YC_ALL_URL = "https://yc-oss.github.io/api/companies/all.json"
+YC_BATCH_URL = "https://yc-oss.github.io/api/batches/{slug}.json"
 BATCH_SIZE = 500
-
-
-class FoundersHTMLParser(HTMLParser):
-    """Parse YC founder blocks from company HTML pages."""
-
-    def __init__(self) -> None:
-        super().__init__(convert_charrefs=True)
-        self._in_active_founders = False
-        self._in_done = False
-        self._current: dict[str, Any] | None = None
-        self._founders: list[dict[str, Any]] = []
-        self._bio_parts: list[str] = []
-        self._capture_bio = False
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # type: ignore[override]
-        if self._in_done:
-            return
-        if not self._in_active_founders:
-            return
-
-        attrs_dict = dict(attrs)
-        if tag == "img":
-            alt = (attrs_dict.get("alt") or "").strip()
-            src = (attrs_dict.get("src") or "").strip()
-            if not alt or not src:
-                return
-            if alt.lower() in {"twitter account", "x (twitter) logo"}:
-                return
-            if "/avatars/" not in src and "avatars" not in src:
-                return
-
-            self._flush_current()
-            self._current = {
-                "name": alt,
-                "avatar_url": src,
-                "twitter_url": None,
-                "linkedin_url": None,
-                "yc_profile_url": None,
-                "role": None,
-                "bio": None,
-            }
-            self._bio_parts = []
-            self._capture_bio = False
-            return
-
-        if tag == "a" and self._current:
-            href = (attrs_dict.get("href") or "").strip()
-            if not href:
-                return
-            if "twitter.com/" in href or "x.com/" in href:
-                self._current["twitter_url"] = self._current["twitter_url"] or href
-            elif "linkedin.com/" in href:
-                self._current["linkedin_url"] = self._current["linkedin_url"] or href
-            elif "/people/" in href or "ycombinator.com/people/" in href:
-                self._current["yc_profile_url"] = self._current["yc_profile_url"] or href
-
-    def handle_data(self, data: str) -> None:  # type: ignore[override]
-        if self._in_done:
-            return
-        text = data.strip()
-        if not text:
-            return
-
-        if text == "Active Founders":
-            self._in_active_founders = True
-            return
-        if text in {"Company Launches", "Jobs at", "Jobs at "} and self._in_active_founders:
-            self._in_active_founders = False
-            self._in_done = True
-            self._flush_current()
-            return
-
-        if not self._in_active_founders or not self._current:
-            return
-
-        if text in {"Founder", "Co-Founder", "Cofounder", "Co-founder"}:
-            self._current["role"] = self._current["role"] or text
-            self._capture_bio = True
-            return
-
-        if self._capture_bio:
-            self._bio_parts.append(text)
-
-    def close(self) -> None:  # type: ignore[override]
-        self._flush_current()
-        super().close()
-
-    def founders(self) -> list[dict[str, Any]]:
-        return self._dedupe(self._founders)
-
-    def _flush_current(self) -> None:
-        if not self._current:
-            return
-        if self._bio_parts and not self._current.get("bio"):
-            self._current["bio"] = " ".join(self._bio_parts).strip()[:4000]
-        self._founders.append(self._current)
-        self._current = None
-        self._bio_parts = []
-        self._capture_bio = False
-
-    def _dedupe(self, founders: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        seen: set[tuple[str, str, str]] = set()
-        out: list[dict[str, Any]] = []
-        for f in founders:
-            name = (f.get("name") or "").strip()
-            if not name:
-                continue
-            tw = (f.get("twitter_url") or "").strip()
-            li = (f.get("linkedin_url") or "").strip()
-            key = (name.lower(), tw, li)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(f)
-        return out
-
-
-async def sync_yc_directory(session: AsyncSession) -> int:
-    """Sync YC directory data from the public YC JSON + founders HTML pages."""
-    now = datetime.utcnow()
+FOUNDERS_REQUEST_HEADERS = {
+    "User-Agent": "FeatureBoardAppYCsync/1.0",
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+
+@dataclass
+class FetchedPage:
+    """A company page as handed from the fetch to the parse stage.
+
+    Either `founders` from the HTTP cache (304) or the `html` of a full response
+    still to be parsed and stored in the cache.
+    """
+
+    url: str
+    founders: list[dict[str, Any]] | None = None
+    html: str | None = None
+    response: httpx.Response | None = None
+
+
+async def sync_yc_directory(
+    session: AsyncSession,
+    cache: HTTPConditionalCache | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> int:
+    """Sync YC directory data from the public YC JSON + founders HTML pages.
+
+    The run is checkpointed on YCSyncState (run id, phase, founders cursor).
+    Only one sync runs at a time, so a checkpoint left behind by a run that
+    died or failed is resumed: the feed phase is redone, the founders crawl
+    continues after the stored cursor.
+
+    Upstream requests go through `transport`, by default the one selected by
+    YC_SYNC_SOURCE_MODE (see `app.infrastructure.yc.replay`).
+
+    With YC_SYNC_SWAP the run loads shadow tables on its own session instead of
+    `session` and swaps them in at the end (see `app.infrastructure.yc.shadow`).
+    """
+    if settings.YC_SYNC_SWAP:
+        async with ShadowSessionLocal() as shadow_session:
+            return await _run_sync(shadow_session, cache, transport, swap=True)
+    return await _run_sync(session, cache, transport, swap=False)
+
+
+async def _run_sync(
+    session: AsyncSession,
+    cache: HTTPConditionalCache | None,
+    transport: httpx.AsyncBaseTransport | None,
+    *,
+    swap: bool,
+) -> int:
+    cache = cache or HTTPConditionalCache(settings.YC_HTTP_CACHE_DIR)
+    transport = transport or _source_transport()
+    run_metrics = SyncRunMetrics()
+    if settings.YC_SYNC_PROFILE_MEMORY:
+        run_metrics.memory = MemoryProfiler(top=settings.YC_SYNC_PROFILE_TOP_SITES)
+        run_metrics.memory.start()
+    attempt_started_at = datetime.utcnow()
     sync_state = await _get_or_create_sync_state(session)
-    sync_state.last_started_at = now
+    resumed = sync_state.run_phase is not None
+    if resumed:
+        logger.info(
+            "Resuming YC sync run %s in phase %s after cursor %s",
+            sync_state.run_id,
+            sync_state.run_phase,
+            sync_state.run_cursor,
+        )
+    else:
+        sync_state.run_id = uuid.uuid4()
+        sync_state.run_phase = "feed"
+        sync_state.run_cursor = None
+        sync_state.last_started_at = datetime.utcnow()
+        sync_state.progress_done = 0
+        sync_state.progress_total = None
     sync_state.last_error = None
+    sync_state.status = "running"
+    session.add(sync_state)
+    await session.commit()
 
-    try:
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.get(YC_ALL_URL)
-            resp.raise_for_status()
-            data: list[dict[str, Any]] = resp.json()
-    except Exception as exc:  # noqa: BLE001
-        sync_state.last_finished_at = datetime.utcnow()
-        sync_state.last_error = str(exc)
-        session.add(sync_state)
-        await session.commit()
-        raise
-
-    await session.execute(YCFounder.__table__.delete())  # type: ignore[arg-type]
-
-    now = datetime.utcnow()
-    rows: list[dict[str, Any]] = []
-    for raw in data:
-        rows.append({
-            "id": uuid.uuid4(),
-            "yc_id": raw["id"],
-            "name": raw["name"],
-            "slug": raw["slug"],
-            "batch": raw.get("batch") or "",
-            "batch_code": _batch_code(raw.get("batch")),
-            "year": _batch_year(raw.get("batch")),
-            "status": raw.get("status") or "",
-            "industry": raw.get("industry"),
-            "subindustry": raw.get("subindustry"),
-            "website": raw.get("website"),
-            "all_locations": raw.get("all_locations"),
-            "one_liner": raw.get("one_liner"),
-            "long_description": raw.get("long_description"),
-            "team_size": raw.get("team_size"),
-            "small_logo_thumb_url": raw.get("small_logo_thumb_url"),
-            "url": raw.get("url") or "",
-            "is_hiring": bool(raw.get("isHiring")),
-            "nonprofit": bool(raw.get("nonprofit")),
-            "top_company": bool(raw.get("top_company")),
-            "industries": list(raw.get("industries") or []),
-            "regions": list(raw.get("regions") or []),
-            "tags": list(raw.get("tags") or []),
-            "launched_at": raw.get("launched_at"),
-            "created_at": now,
-            "updated_at": now,
-        })
+    async with httpx.AsyncClient(timeout=30, follow_redirects=True, transport=transport) as client:
+        try:
+            if swap and (not resumed or not await shadow_ready(session)):
+                # A resumed run whose shadow tables are gone starts loading again.
+                sync_state.run_phase = "feed"
+                sync_state.run_cursor = None
+                session.add(sync_state)
+                await session.commit()
+                await prepare_shadow(session)
+            if sync_state.run_phase == "feed":
+                diff = await _ingest_source(session, client, cache, sync_state, run_metrics)
+                sync_state.last_item_count = diff.total
+                sync_state.last_inserted_count = diff.inserted
+                sync_state.last_changed_count = diff.changed
+                sync_state.last_unchanged_count = diff.unchanged
+                sync_state.last_disappeared_count = diff.disappeared
+                sync_state.run_phase = "founders"
+                sync_state.last_founders_failed_count = 0
+                session.add(sync_state)
+                await session.commit()
+            with run_metrics.phase("founder_crawl"):
+                await _sync_founders(session, client, cache, sync_state, run_metrics)
+            if swap:
+                started = time.perf_counter()
+                await build_shadow_indexes(session)
+                await swap_in_shadow(session)
+                run_metrics.checkpoint("swap")
+                logger.info(
+                    "YC sync run %s: shadow tables indexed and swapped in (%.1fs)",
+                    sync_state.run_id,
+                    time.perf_counter() - started,
+                )
+        except BaseException as exc:
+            # The checkpoint is kept, so the next sync resumes this run.
+            await session.rollback()
+            # The rollback expired the state; reload it here rather than
+            # lazily (and synchronously) on first attribute access.
+            await session.refresh(sync_state)
+            sync_state.last_finished_at = datetime.utcnow()
+            sync_state.last_error = str(exc) or type(exc).__name__
+            sync_state.status = "failed"
+            session.add(sync_state)
+            session.add(_sync_run_record(sync_state, run_metrics, attempt_started_at, resumed=resumed))
+            await session.commit()
+            run_metrics.finish("failed")
+            raise
+
+    logger.info("YC sync HTTP cache: %d hits, %d misses", cache.hits, cache.misses)
+
+    await prune_change_log(session, sync_state, timedelta(days=settings.YC_CHANGE_LOG_RETENTION_DAYS))
+    sync_state.last_finished_at = datetime.utcnow()
+    sync_state.last_success_at = sync_state.last_finished_at
+    sync_state.status = "succeeded"
+    sync_state.run_phase = None
+    sync_state.run_cursor = None
+    session.add(sync_state)
+    session.add(_sync_run_record(sync_state, run_metrics, attempt_started_at, resumed=resumed))
+    await session.commit()
+    run_metrics.finish("succeeded")
+    logger.info("YC sync run %s telemetry: %s", sync_state.run_id, asdict(run_metrics))
+
+    return sync_state.last_item_count or 0
+
+
+def _source_transport() -> httpx.AsyncBaseTransport | None:
+    if settings.YC_SYNC_SOURCE_MODE == "record":
+        return RecordingTransport(settings.YC_SYNC_SOURCE_ARCHIVE)
+    if settings.YC_SYNC_SOURCE_MODE == "replay":
+        faults = ReplayFaults(
+            latency=settings.YC_SYNC_REPLAY_LATENCY_SECONDS,
+            error_rate=settings.YC_SYNC_REPLAY_ERROR_RATE,
+            timeout_rate=settings.YC_SYNC_REPLAY_TIMEOUT_RATE,
+            # The feed has no retries; faults are for the founders crawl.
+            exempt_hosts=frozenset({httpx.URL(YC_ALL_URL).host}),
+        )
+        return ReplayTransport(settings.YC_SYNC_SOURCE_ARCHIVE, faults)
+    return None
+
+
+def _sync_run_record(
+    sync_state: YCSyncState,
+    run_metrics: SyncRunMetrics,
+    started_at: datetime,
+    *,
+    resumed: bool,
+) -> YCSyncRun:
+    phases = run_metrics.phase_seconds
+    memory_profile = None
+    if run_metrics.memory is not None:
+        run_metrics.checkpoint("finished")
+        memory_profile = run_metrics.memory.summary()
+    return YCSyncRun(
+        run_id=sync_state.run_id,
+        resumed=resumed,
+        status=sync_state.status or "",
+        error=sync_state.last_error,
+        started_at=started_at,
+        finished_at=sync_state.last_finished_at or datetime.utcnow(),
+        download_seconds=phases["download"],
+        parse_seconds=phases["parse"],
+        company_upsert_seconds=phases["company_upsert"],
+        founder_crawl_seconds=phases["founder_crawl"],
+        pages_fetched=run_metrics.pages_fetched,
+        pages_not_modified=run_metrics.pages_not_modified,
+        pages_failed=run_metrics.pages_failed,
+        bytes_downloaded=run_metrics.bytes_downloaded,
+        companies_parsed=run_metrics.companies_parsed,
+        founders_parsed=run_metrics.founders_parsed,
+        company_rows_written=run_metrics.company_rows_written,
+        founder_rows_written=run_metrics.founder_rows_written,
+        memory_profile=memory_profile,
+    )
+
+
+def batch_feed_url(batch: str) -> str:
+    """The per-batch feed of a stored `batch` name, e.g. "Winter 2024" -> batches/winter-2024.json."""
+    return YC_BATCH_URL.format(slug="-".join(batch.lower().split()))
+
+
+def _full_reconciliation_due(sync_state: YCSyncState, now: datetime) -> bool:
+    if settings.YC_SYNC_FEED_MODE != "batches" or sync_state.last_full_sync_at is None:
+        return True
+    return now - sync_state.last_full_sync_at >= timedelta(hours=settings.YC_SYNC_FULL_RECONCILE_HOURS)
+
+
+async def _ingest_source(
+    session: AsyncSession,
+    client: httpx.AsyncClient,
+    cache: HTTPConditionalCache,
+    sync_state: YCSyncState,
+    run_metrics: SyncRunMetrics,
+) -> CompanyDiff:
+    """Ingest the changed per-batch feeds, or all.json when a full reconciliation is due.
+
+    A batch feed that cannot be fetched turns the run into a full reconciliation.
+    """
+    if not _full_reconciliation_due(sync_state, datetime.utcnow()):
+        try:
+            return await _ingest_batch_feeds(session, client, cache, run_metrics)
+        except httpx.HTTPError as exc:
+            logger.warning("YC batch feeds unavailable (%s); reconciling from all.json", exc)
+    diff = await _ingest_feed(session, client, cache, sync_state, run_metrics)
+    sync_state.last_full_sync_at = datetime.utcnow()
+    return diff
+
+
+async def _ingest_batch_feeds(
+    session: AsyncSession,
+    client: httpx.AsyncClient,
+    cache: HTTPConditionalCache,
+    run_metrics: SyncRunMetrics,
+) -> CompanyDiff:
+    """Fetch the feed of every stored YC batch in parallel and upsert the batches that changed.
+
+    The batches come from the stored companies, so a new batch, and companies
+    without one, are picked up by the next full reconciliation. Companies of
+    unchanged batches count as unchanged, and only companies missing from a
+    re-ingested batch count as disappeared. As with all.json, validators are
+    only stored once the writes are committed.
+    """
+    stmt = (
+        select(col(YCCompany.batch), func.count())
+        .where(col(YCCompany.batch) != "", col(YCCompany.removed_at).is_(None))
+        .group_by(YCCompany.batch)
+    )
+    stored: dict[str, int] = dict((await session.execute(stmt)).tuples().all())
+    with run_metrics.phase("download"):
+        feeds = await fetch_batch_feeds(
+            client,
+            cache,
+            {batch: batch_feed_url(batch) for batch in stored},
+            concurrency=settings.YC_SYNC_BATCH_FETCH_CONCURRENCY,
+        )
+    for feed in feeds:
+        run_metrics.record_bytes(feed.downloaded, "feed")
+    run_metrics.checkpoint("download")
+    changed = [feed for feed in feeds if feed.body is not None]
+    run_metrics.record_feed_batches(ingested=len(changed), unchanged=len(feeds) - len(changed))
+    unchanged = sum(stored[feed.batch] for feed in feeds if feed.body is None)
+    logger.info("YC batch feeds: %d of %d changed", len(changed), len(feeds))
+
+    diff = CompanyDiff()
+    if changed:
+        scope = [feed.batch for feed in changed]
+        batches = run_metrics.parsed_batches(batch_feed_entries(changed, BATCH_SIZE))
+        with run_metrics.phase("company_upsert", exclude=("parse",)):
+            if settings.YC_SYNC_LOADER == "copy":
+                diff = await copy_companies(session, batches, scope=scope)
+                run_metrics.checkpoint("company_upsert")
+            else:
+                diff = await _upsert_companies(session, batches, run_metrics, scope=scope)
+    for feed in feeds:
+        if feed.response is not None:
+            await cache.store(feed.url, feed.response, feed.digest)
+    diff.unchanged += unchanged
+    run_metrics.record_rows("yccompany", diff.inserted + diff.changed)
+    return diff
+
+
+async def _ingest_feed(
+    session: AsyncSession,
+    client: httpx.AsyncClient,
+    cache: HTTPConditionalCache,
+    sync_state: YCSyncState,
+    run_metrics: SyncRunMetrics,
+) -> CompanyDiff:
+    """Download all.json and upsert it batch by batch while the body streams in.
+
+    Validators are only stored once every batch is committed, so a failed run
+    never turns into a 304 that would skip the unfinished ingestion next time.
+    Time waiting for the body, decoding it and writing companies is recorded
+    as the download, parse and company_upsert phases of `run_metrics`.
+    """
+    entry = await cache.get(YC_ALL_URL)
+    requested_at = time.perf_counter()
+    async with client.stream(
+        "GET",
+        YC_ALL_URL,
+        headers=cache.request_headers(entry),
+        timeout=60,
+    ) as resp:
+        run_metrics.phase_seconds["download"] += time.perf_counter() - requested_at
+        if cache.not_modified_entry(entry, resp) is not None:
+            return CompanyDiff(unchanged=sync_state.last_item_count or 0)
+        resp.raise_for_status()
+        batches = run_metrics.parsed_batches(
+            feed_batches(
+                resp,
+                streaming=settings.YC_SYNC_STREAMING,
+                batch_size=BATCH_SIZE,
+                chunks=run_metrics.metered_download(resp.aiter_bytes(), "feed"),
+            )
+        )
+        with run_metrics.phase("company_upsert", exclude=("download", "parse")):
+            if settings.YC_SYNC_LOADER == "copy":
+                diff = await copy_companies(session, batches)
+                run_metrics.checkpoint("company_upsert")
+            else:
+                diff = await _upsert_companies(session, batches, run_metrics)
+    await cache.store(YC_ALL_URL, resp)
+    run_metrics.record_rows("yccompany", diff.inserted + diff.changed)
+    return diff
+
+
+async def _upsert_companies(
+    session: AsyncSession,
+    batches: AsyncIterable[list[dict[str, Any]]],
+    run_metrics: SyncRunMetrics,
+    scope: Collection[str] | None = None,
+) -> CompanyDiff:
+    """Upsert new and changed feed entries and mark the companies the feed lost as removed.
+
+    With `scope`, the feed only covers those YC batches. Every write is logged
+    to the change log. Memory is checkpointed after building and after writing
+    each batch of rows.
+    """
+    existing_stmt = select(YCCompany.yc_id, YCCompany.content_hash, YCCompany.batch, YCCompany.removed_at)
+    stored = (await session.execute(existing_stmt)).all()
+    # Removed companies the feed lists again are rewritten, like changed ones.
+    differ = CompanyDiffer({row[0]: row[1] if row[3] is None else None for row in stored})
+    covered = {row[0] for row in stored if row[3] is None and (scope is None or row[2] in scope)}
 
     table = YCCompany.__table__
-    for i in range(0, len(rows), BATCH_SIZE):
-        batch = rows[i : i + BATCH_SIZE]
-        batch_stmt = pg_insert(YCCompany).values(batch)
+    async for raw_batch in batches:
+        writes = differ.writes(company_row(raw) for raw in raw_batch)
+        run_metrics.checkpoint("company_rows")
+        if not writes:
+            continue
+        now = datetime.utcnow()
+        for row in writes:
+            row["id"] = uuid.uuid4()
+            row["created_at"] = now
+            row["updated_at"] = now
+        batch_stmt = pg_insert(YCCompany).values(writes)
+        set_ = {table.c[n]: batch_stmt.excluded[n] for n in (*COMPANY_FIELDS, "updated_at") if n != "yc_id"}
         batch_stmt = batch_stmt.on_conflict_do_update(
             index_elements=["yc_id"],
-            set_={table.c[n]: batch_stmt.excluded[n] for n in table.c.keys() if n not in ("id", "created_at", "yc_id")},
+            set_={**set_, table.c.removed_at: None},
+            where=or_(
+                table.c.content_hash.is_distinct_from(batch_stmt.excluded.content_hash),
+                table.c.removed_at.is_not(None),
+            ),
+        ).returning(table.c.yc_id, table.c.id, literal_column("xmax = 0"))
+        written = (await session.execute(batch_stmt)).all()
+        await log_changes(
+            session,
+            ((yc_id, company_id, ADDED if inserted else UPDATED) for yc_id, company_id, inserted in written),
+            now,
         )
-        await session.execute(batch_stmt)
+        run_metrics.checkpoint("company_upsert")
+    await mark_removed(session, differ.missing(covered), len(covered), datetime.utcnow())
+    await session.commit()
+    return differ.finish(within=covered)
+
+
+async def _sync_founders(
+    session: AsyncSession,
+    client: httpx.AsyncClient,
+    cache: HTTPConditionalCache,
+    sync_state: YCSyncState,
+    run_metrics: SyncRunMetrics,
+) -> int:
+    """Crawl the company pages that are due and reconcile their founders in place.
+
+    Which companies are due, their order and the page budget per run come from
+    the re-crawl schedule (see `recrawl`). Runs as a fetch → parse → write
+    pipeline (see `founders_pipeline`), with requests paced, retried and
+    budgeted by a `CrawlPolicy`. Companies whose page fails to load or yields
+    no founders keep their stored founders; failed ones are recorded on the
+    company and crawled first next run. Each write batch is reconciled in a
+    single transaction, together with the crawl progress and checkpoint cursor
+    on `sync_state`; a resumed run only crawls the companies after that cursor,
+    within what is left of the budget.
+    Returns the number of founder rows inserted, updated or deleted.
+    """
+    recrawl = RecrawlPolicy(
+        budget=settings.YC_FOUNDERS_CRAWL_BUDGET,
+        sla=timedelta(days=settings.YC_FOUNDERS_SLA_DAYS),
+        active_interval=timedelta(days=settings.YC_FOUNDERS_ACTIVE_INTERVAL_DAYS),
+        long_tail_interval=timedelta(days=settings.YC_FOUNDERS_LONG_TAIL_INTERVAL_DAYS),
+        recent_years=settings.YC_FOUNDERS_RECENT_YEARS,
+    )
+    stmt = select(
+        YCCompany.id,
+        YCCompany.url,
+        YCCompany.yc_id,
+        YCCompany.status,
+        YCCompany.year,
+        YCCompany.founders_crawled_at,
+        YCCompany.founders_failed_at,
+        YCCompany.founders_unchanged_crawls,
+    ).where(YCCompany.url != "", YCCompany.removed_at.is_(None))
+    candidates = (CrawlCandidate(*row) for row in (await session.execute(stmt)).all())
+    # The crawl-order key is also the checkpoint cursor. A company's key only
+    # changes once it is processed.
+    cursor = _decode_cursor(sync_state.run_cursor)
+    spent = (sync_state.progress_done or 0) if cursor is not None else 0
+    plan = plan_recrawl(recrawl, candidates, datetime.utcnow(), after=cursor, spent=spent)
+    watermark = _CrawlWatermark([(c.company_id, key) for c, key in plan.companies], sync_state.run_cursor)
+    run_metrics.record_recrawl_plan(plan)
+    run_metrics.checkpoint("founder_plan")
+    logger.info("YC founders re-crawl plan: %s", plan.summary())
+    if plan.past_sla > len(plan.companies):
+        logger.warning(
+            "YC founders re-crawl: %d companies are past the %d-day SLA but the budget covers %d pages",
+            plan.past_sla,
+            settings.YC_FOUNDERS_SLA_DAYS,
+            recrawl.budget,
+        )
+    sync_state.progress_total = spent + len(plan.companies)
+    sync_state.progress_done = spent
+    session.add(sync_state)
     await session.commit()
 
-    founder_count = await _sync_founders(session)
+    policy = CrawlPolicy(
+        limiter=AIMDConfig(
+            initial=settings.YC_FOUNDERS_FETCH_INITIAL_CONCURRENCY,
+            minimum=settings.YC_FOUNDERS_FETCH_MIN_CONCURRENCY,
+            maximum=settings.YC_FOUNDERS_FETCH_CONCURRENCY,
+            target_latency=settings.YC_FOUNDERS_TARGET_LATENCY_SECONDS,
+            max_error_rate=settings.YC_FOUNDERS_MAX_ERROR_RATE,
+        ),
+        retry=RetryPolicy(
+            max_attempts=settings.YC_FOUNDERS_MAX_ATTEMPTS,
+            max_delay=settings.YC_FOUNDERS_MAX_RETRY_DELAY_SECONDS,
+        ),
+        error_budget=settings.YC_FOUNDERS_ERROR_BUDGET,
+    )
+
+    async def fetch(_company_id: uuid.UUID, url: str) -> FetchedPage:
+        return await _fetch_founders_page(client, cache, policy, url, run_metrics)
+
+    parse_pool = (
+        FoundersParsePool(settings.YC_FOUNDERS_PARSE_PROCESSES, settings.YC_FOUNDERS_PARSE_CHUNK_SIZE)
+        if settings.YC_FOUNDERS_PARSE_PROCESSES > 0
+        else None
+    )
+    parse_html = parse_pool.parse if parse_pool is not None else parse_inline
+
+    async def parse(company_id: uuid.UUID, page: FetchedPage) -> list[dict[str, Any]]:
+        founders = await _parse_founders_page(cache, page, parse_html)
+        run_metrics.record_founders(len(founders))
+        return founder_rows(company_id, founders)
+
+    use_copy = settings.YC_SYNC_LOADER == "copy"
+    if use_copy:
+        await prepare_founder_stage(session)
+
+    writes = FounderWrites()
+
+    async def write(results: dict[uuid.UUID, FounderResult]) -> None:
+        nonlocal writes
+        failed = {company_id: r for company_id, r in results.items() if isinstance(r, Exception)}
+        crawled = {company_id: r for company_id, r in results.items() if not isinstance(r, Exception)}
+        fresh = {company_id: founders for company_id, founders in crawled.items() if founders}
+        batch_writes = FounderWrites()
+        if fresh and use_copy:
+            batch_writes = await copy_founders(session, [f for founders in fresh.values() for f in founders])
+        elif fresh:
+            batch_writes = await _reconcile_founders(session, fresh)
+        hashes = {company_id: founders_hash(founders) if founders else None for company_id, founders in crawled.items()}
+        await _record_crawl_outcomes(session, hashes, failed)
+        sync_state.progress_done = (sync_state.progress_done or 0) + len(results)
+        sync_state.last_founders_failed_count = (sync_state.last_founders_failed_count or 0) + len(failed)
+        sync_state.run_cursor = watermark.advance(results)
+        session.add(sync_state)
+        await session.commit()
+        writes += batch_writes
+        run_metrics.record_rows("ycfounder", batch_writes.total)
+        run_metrics.record_failed_pages(len(failed))
+        run_metrics.checkpoint("founder_crawl")
+
+    parse_concurrency = settings.YC_FOUNDERS_PARSE_CONCURRENCY
+    if parse_pool is not None:
+        parse_concurrency = max(parse_concurrency, parse_pool.concurrency)
+    try:
+        stats = await run_founders_pipeline(
+            ((c.company_id, c.url) for c, _ in plan.companies),
+            fetch=fetch,
+            parse=parse,
+            write=write,
+            config=PipelineConfig(
+                fetch_concurrency=settings.YC_FOUNDERS_FETCH_CONCURRENCY,
+                parse_concurrency=parse_concurrency,
+                queue_size=settings.YC_FOUNDERS_QUEUE_SIZE,
+                write_batch_size=settings.YC_FOUNDERS_WRITE_BATCH_SIZE,
+                write_interval=settings.YC_FOUNDERS_WRITE_INTERVAL_SECONDS,
+            ),
+        )
+    finally:
+        if parse_pool is not None:
+            parse_pool.close()
+        logger.info("YC founders crawl policy: %s", policy.summary())
 
-    sync_state.last_finished_at = datetime.utcnow()
-    sync_state.last_success_at = sync_state.last_finished_at
-    sync_state.last_item_count = len(rows)
-    session.add(sync_state)
+    unlinked = await _delete_unlinked_founders(session)
     await session.commit()
+    writes.deleted += unlinked
+    run_metrics.record_rows("ycfounder", unlinked)
+
+    logger.info("YC founders pipeline: %s", stats.summary())
+    logger.info(
+        "YC founders sync: %d inserted, %d updated, %d deleted, %d companies failed",
+        writes.inserted,
+        writes.updated,
+        writes.deleted,
+        sync_state.last_founders_failed_count,
+    )
+    return writes.total
+
+
+async def _fetch_founders_page(
+    client: httpx.AsyncClient,
+    cache: HTTPConditionalCache,
+    policy: CrawlPolicy,
+    url: str,
+    run_metrics: SyncRunMetrics,
+) -> FetchedPage:
+    """The fetch stage: GET a company page conditionally.
+
+    A 304 hands on the founders stored with the page's validators; a full
+    response goes on to `_parse_founders_page`, which stores them.
+    """
+    entry = await cache.get(url)
+    headers = {**FOUNDERS_REQUEST_HEADERS, **cache.request_headers(entry)}
+    resp = await policy.get(client, url, headers=headers, timeout=settings.YC_FOUNDERS_TIMEOUT_SECONDS)
+    if (hit := cache.not_modified_entry(entry, resp)) is not None:
+        run_metrics.record_page(not_modified=True)
+        return FetchedPage(url=url, founders=hit.payload or [])
+    resp.raise_for_status()
+    run_metrics.record_page(not_modified=False)
+    run_metrics.record_bytes(len(resp.content), "founders")
+    return FetchedPage(url=url, html=resp.text, response=resp)
+
+
+async def _parse_founders_page(
+    cache: HTTPConditionalCache,
+    page: FetchedPage,
+    parse_html: Callable[[str], Awaitable[list[dict[str, Any]]]],
+) -> list[dict[str, Any]]:
+    """The parse stage: the founders of `page`.
+
+    A full response is parsed, and only then are its validators stored with
+    the founders, so a page that fails to parse is fetched in full next time.
+    """
+    if page.response is None:
+        return page.founders or []
+    founders = await parse_html(page.html or "")
+    await cache.store(page.url, page.response, founders)
+    return founders
+
+
+class _CrawlWatermark:
+    """Checkpoint cursor over a crawl whose companies are written out of order.
+
+    The cursor is the key of the last company, in crawl order, up to which every
+    company has been written; resuming after it may re-crawl a few companies
+    that were written ahead of the watermark, but never skips one.
+    """
+
+    def __init__(self, order: list[tuple[uuid.UUID, CrawlKey]], cursor: str | None) -> None:
+        self._keys = [key for _, key in order]
+        self._position = {company_id: i for i, (company_id, _) in enumerate(order)}
+        self._written = [False] * len(order)
+        self._next = 0
+        self.cursor = cursor
+
+    def advance(self, company_ids: Iterable[uuid.UUID]) -> str | None:
+        for company_id in company_ids:
+            self._written[self._position[company_id]] = True
+        start = self._next
+        while self._next < len(self._written) and self._written[self._next]:
+            self._next += 1
+        if self._next > start:
+            self.cursor = _encode_cursor(self._keys[self._next - 1])
+        return self.cursor
+
+
+def _encode_cursor(key: CrawlKey) -> str:
+    return ":".join(str(part) for part in key)
+
+
+def _decode_cursor(cursor: str | None) -> CrawlKey | None:
+    parts = cursor.split(":") if cursor else []
+    if len(parts) != 3:
+        # None, or a checkpoint from before the re-crawl schedule: crawl the plan from the start.
+        return None
+    tier, crawled, yc_id = (int(part) for part in parts)
+    return tier, crawled, yc_id
+
+
+async def _record_crawl_outcomes(
+    session: AsyncSession,
+    crawled: dict[uuid.UUID, str | None],
+    failed: dict[uuid.UUID, Exception],
+) -> None:
+    """Record each crawled company's crawl (clearing its failures) and note each failed one for retry.
+
+    Companies whose founders changed are logged to the change log as updated.
+
+    `crawled` maps each crawled company to the hash of its founders, or None if
+    its page yielded none; those keep their stored founders, so they count as
+    unchanged.
+    """
+    table = YCCompany.__table__
+    now = datetime.utcnow()
+    if crawled:
+        stored = await session.execute(
+            select(table.c.yc_id, table.c.id, table.c.founders_hash).where(table.c.id.in_(list(crawled)))
+        )
+        await log_changes(
+            session,
+            (
+                (yc_id, company_id, UPDATED)
+                for yc_id, company_id, stored_hash in stored.all()
+                if crawled[company_id] is not None and crawled[company_id] != stored_hash
+            ),
+            now,
+        )
+        digest = bindparam("b_hash", type_=table.c.founders_hash.type)
+        unchanged = or_(digest.is_(None), table.c.founders_hash == digest)
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                founders_failures=0,
+                founders_failed_at=None,
+                founders_error=None,
+                founders_crawled_at=now,
+                founders_hash=func.coalesce(digest, table.c.founders_hash),
+                founders_changed_at=case((unchanged, table.c.founders_changed_at), else_=now),
+                founders_unchanged_crawls=case((unchanged, table.c.founders_unchanged_crawls + 1), else_=0),
+            )
+        )
+        await session.execute(stmt, [{"b_id": company_id, "b_hash": digest} for company_id, digest in crawled.items()])
+    if failed:
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                founders_failures=table.c.founders_failures + 1,
+                founders_failed_at=datetime.utcnow(),
+                founders_error=bindparam("b_error"),
+            )
+        )
+        params = [{"b_id": company_id, "b_error": _crawl_error(exc)} for company_id, exc in failed.items()]
+        await session.execute(stmt, params)
+
+
+def _crawl_error(exc: Exception) -> str:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"HTTP {exc.response.status_code}"
+    return f"{type(exc).__name__}: {exc}"[:512]
+
+
+async def _reconcile_founders(
+    session: AsyncSession,
+    fresh: dict[uuid.UUID, list[dict[str, Any]]],
+) -> FounderWrites:
+    """Upsert the founders of the `fresh` companies, then reconcile the companies' links to them.
+
+    Founders left without a company are deleted at the end of the crawl (see
+    `_delete_unlinked_founders`).
+    """
+    founder_ids, writes = await _upsert_founders(session, [row for rows in fresh.values() for row in rows])
+
+    table = YCCompanyFounder.__table__
+    stmt = select(table.c.company_id, table.c.founder_key, *(table.c[f] for f in COMPANY_FOUNDER_FIELDS)).where(
+        table.c.company_id.in_(list(fresh))
+    )
+    existing: dict[uuid.UUID, dict[str, dict[str, Any]]] = {}
+    for row in (await session.execute(stmt)).mappings():
+        existing.setdefault(row["company_id"], {})[row["founder_key"]] = dict(row)
+
+    upserts: list[dict[str, Any]] = []
+    delete_keys: list[tuple[uuid.UUID, str]] = []
+    for company_id, rows in fresh.items():
+        desired = [
+            {
+                "company_id": company_id,
+                "founder_key": row["founder_key"],
+                "founder_id": founder_ids[row["identity_key"]],
+                "sort_order": row["sort_order"],
+                "role": row["role"],
+            }
+            for row in rows
+        ]
+        inserts, updates, deletes = diff_founders(existing.get(company_id, {}), desired, fields=COMPANY_FOUNDER_FIELDS)
+        writes += FounderWrites(inserted=len(inserts), updated=len(updates), deleted=len(deletes))
+        upserts += inserts + updates
+        delete_keys += [(company_id, key) for key in deletes]
+
+    if delete_keys:
+        await session.execute(delete(table).where(tuple_(table.c.company_id, table.c.founder_key).in_(delete_keys)))
+    if upserts:
+        upsert_stmt = pg_insert(table).values(upserts)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=["company_id", "founder_key"],
+            set_={f: upsert_stmt.excluded[f] for f in COMPANY_FOUNDER_FIELDS},
+        )
+        await session.execute(upsert_stmt)
+    return writes
+
+
+async def _upsert_founders(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+) -> tuple[dict[str, uuid.UUID], FounderWrites]:
+    """Insert new and update changed founders by identity; returns their ids by identity key.
+
+    A founder listed by several of the companies keeps the last company's details.
+    """
+    people = {row["identity_key"]: row for row in rows}
+    table = YCFounder.__table__
+    stmt = select(table.c.id, table.c.identity_key, *(table.c[f] for f in FOUNDER_FIELDS)).where(
+        table.c.identity_key.in_(list(people))
+    )
+    existing = {row["identity_key"]: dict(row) for row in (await session.execute(stmt)).mappings()}
+    inserts, updates, _ = diff_founders(existing, list(people.values()), key="identity_key")
+
+    founder_ids = {key: row["id"] for key, row in existing.items()}
+    founder_ids.update((row["identity_key"], uuid.uuid4()) for row in inserts)
+    now = datetime.utcnow()
+    upserts = [
+        {
+            "id": founder_ids[row["identity_key"]],
+            "identity_key": row["identity_key"],
+            **{f: row[f] for f in FOUNDER_FIELDS},
+            "created_at": now,
+            "updated_at": now,
+        }
+        for row in inserts + updates
+    ]
+    if upserts:
+        upsert_stmt = pg_insert(table).values(upserts)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=["identity_key"],
+            set_={f: upsert_stmt.excluded[f] for f in (*FOUNDER_FIELDS, "updated_at")},
+        )
+        await session.execute(upsert_stmt)
+    return founder_ids, FounderWrites(inserted=len(inserts), updated=len(updates))
 
-    return len(rows)
-
-
-async def _sync_founders(session: AsyncSession) -> int:
-    stmt = select(YCCompany.id, YCCompany.url).where(YCCompany.url != "")
-    rows = (await session.execute(stmt)).all()
-
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        import asyncio
-
-        sem = asyncio.Semaphore(15)
-
-        async def fetch_one(company_id, url: str) -> list[YCFounder]:
-            async with sem:
-                try:
-                    resp = await client.get(
-                        url,
-                        headers={
-                            "User-Agent": "FeatureBoardAppYCsync/1.0",
-                            "Accept": "text/html,application/xhtml+xml",
-                        },
-                    )
-                    resp.raise_for_status()
-                except Exception:
-                    return []
-                parser = FoundersHTMLParser()
-                parser.feed(resp.text)
-                parser.close()
-                founders_raw = parser.founders()
-                founders: list[YCFounder] = []
-                for idx, f in enumerate(founders_raw):
-                    founders.append(
-                        YCFounder(
-                            company_id=company_id,
-                            sort_order=idx,
-                            name=f.get("name") or "",
-                            role=f.get("role"),
-                            bio=f.get("bio"),
-                            yc_profile_url=f.get("yc_profile_url"),
-                            twitter_url=f.get("twitter_url"),
-                            linkedin_url=f.get("linkedin_url"),
-                            avatar_url=(f.get("avatar_url") or "").split("?", 1)[0] or None,
-                        )
-                    )
-                return founders
-
-        def chunks(seq, size: int):
-            for i in range(0, len(seq), size):
-                yield seq[i : i + size]
-
-        total = 0
-        for batch in chunks(rows, 50):
-            tasks = [fetch_one(company_id=row[0], url=row[1]) for row in batch]
-            results = await asyncio.gather(*tasks)
-            founders_models: list[YCFounder] = []
-            for founders in results:
-                founders_models.extend(founders)
-            if founders_models:
-                session.add_all(founders_models)
-                await session.commit()
-                total += len(founders_models)
 
-        return total
+async def _delete_unlinked_founders(session: AsyncSession) -> int:
+    """Delete founders no company links to any more; does not commit."""
+    table = YCFounder.__table__
+    links = YCCompanyFounder.__table__
+    result = await session.execute(
+        delete(table).where(~exists().where(links.c.founder_id == table.c.id))
+    )
+    return result.rowcount
 
 
 async def _get_or_create_sync_state(session: AsyncSession) -> YCSyncState:
@@ -282,31 +876,3 @@ async def _get_or_create_sync_state(session: AsyncSession) -> YCSyncState:
     await session.commit()
     await session.refresh(sync_state)
     return sync_state
-
-
-def _batch_code(batch: str | None) -> str:
-    if not batch:
-        return ""
-    parts = batch.split()
-    if len(parts) != 2:
-        return ""
-    season, year_str = parts
-    short = "W" if season.lower().startswith("winter") else "S"
-    try:
-        year = int(year_str)
-    except ValueError:
-        return ""
-    return f"{short}{year}"
-
-
-def _batch_year(batch: str | None) -> int:
-    if not batch:
-        return 0
-    parts = batch.split()
-    if len(parts) != 2:
-        return 0
-    try:
-        return int(parts[1])
-    except ValueError:
-        return 0
-
@@ -27,6 +27,8 @@ from app.infrastructure.persistence.postgres.repositories.yc_directory_repositor
 from app.infrastructure.persistence.postgres.session import get_async_session
 from app.infrastructure.persistence.postgres.unit_of_work import UnitOfWork
 from app.infrastructure.redis.redis_repo import RedisRepository, get_redis_repo
+from app.infrastructure.redis.yc_count_cache import RedisYCCountCache, get_yc_count_cache
+from app.infrastructure.redis.yc_sync_queue import RedisYCSyncQueue, get_yc_sync_queue
 from app.use_cases.use_cases.yc_directory_use_case import YCDirectoryUseCase
 
 logger = logging.getLogger(__name__)
@@ -149,10 +151,15 @@ def get_yc_directory_repo(session: SessionDep) -> YCDirectoryRepository:
 
 def get_yc_use_case(
     repo: Annotated[YCDirectoryRepository, Depends(get_yc_directory_repo)],
+    sync_queue: Annotated[RedisYCSyncQueue, Depends(get_yc_sync_queue)],
+    count_cache: Annotated[RedisYCCountCache, Depends(get_yc_count_cache)],
 ) -> YCDirectoryUseCase:
     return YCDirectoryUseCase(
         repo=repo,
+        sync_queue=sync_queue,
         auto_sync_interval=timedelta(days=settings.YC_AUTO_SYNC_DAYS),
+        count_cache=count_cache,
+        exact_count_limit=settings.YC_COUNT_EXACT_LIMIT,
     )
 
 YCDirectoryUseCaseDep = Annotated[YCDirectoryUseCase, Depends(get_yc_use_case)]
@@ -7,7 +7,11 @@ from app.domain.exceptions import (
     AdminCannotBeDeletedError,
     UserAlreadyExistsError,
     UserNotFoundError,
+    YCDirectorySnapshotNotFoundError,
+    YCSyncInProgressError,
+    YCSyncRunNotFoundError,
 )
+from app.domain.entities.db.yc_sync_state import YCSyncState
 from app.transport.http.deps import AdminUseCaseDep
 from app.transport.http.rate_limit import limiter, PER_ROUTE_LIMIT
 from app.transport.http.routes.admin.deps import AdminDep
@@ -19,6 +23,8 @@ from app.transport.schemas import (
     AdminDashboardStats,
     BalanceUpdate,
     YCSyncStatePublic,
+    YCSyncRunPublic,
+    YCSyncRunsPublic,
 )
 from app.transport.http.routes.yc.deps import YCDirectoryUseCaseDep
 
@@ -83,6 +89,125 @@ async def admin_dashboard(
     )
 
 
+@router.post("/sync", response_model=Message)
+@limiter.limit(PER_ROUTE_LIMIT)
+async def sync_now(
+    request: Request,
+    admin: AdminDep,
+    yc_uc: YCDirectoryUseCaseDep,
+) -> Message:
+    if await yc_uc.request_sync():
+        return Message(message="YC sync queued")
+    return Message(message="YC sync already queued")
+
+
+@router.post("/sync/resume", response_model=Message)
+@limiter.limit(PER_ROUTE_LIMIT)
+async def resume_sync(
+    request: Request,
+    admin: AdminDep,
+    yc_uc: YCDirectoryUseCaseDep,
+) -> Message:
+    """Queue a job that continues the unfinished YC sync run from its checkpoint."""
+    try:
+        queued = await yc_uc.resume_sync()
+    except YCSyncRunNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except YCSyncInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    if queued:
+        return Message(message="YC sync resume queued")
+    return Message(message="YC sync already queued")
+
+
+@router.post("/sync/abandon", response_model=YCSyncStatePublic)
+@limiter.limit(PER_ROUTE_LIMIT)
+async def abandon_sync(
+    request: Request,
+    admin: AdminDep,
+    yc_uc: YCDirectoryUseCaseDep,
+) -> YCSyncStatePublic:
+    """Discard the unfinished YC sync run; the next sync starts from scratch."""
+    try:
+        state = await yc_uc.abandon_sync()
+    except YCSyncRunNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except YCSyncInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    return _sync_state_public(state)
+
+
+@router.post("/sync/rollback", response_model=Message)
+@limiter.limit(PER_ROUTE_LIMIT)
+async def rollback_sync(
+    request: Request,
+    admin: AdminDep,
+    yc_uc: YCDirectoryUseCaseDep,
+) -> Message:
+    """Swap back the YC directory tables replaced by the last shadow-table sync."""
+    try:
+        await yc_uc.rollback_directory()
+    except YCDirectorySnapshotNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except YCSyncInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    return Message(message="YC directory rolled back to the previous snapshot")
+
+
+@router.get("/sync-state", response_model=YCSyncStatePublic)
+@limiter.limit(PER_ROUTE_LIMIT)
+async def get_sync_state(
+    request: Request,
+    admin: AdminDep,
+    yc_uc: YCDirectoryUseCaseDep,
+) -> YCSyncStatePublic:
+    state = await yc_uc.get_sync_state()
+    if not state:
+        return YCSyncStatePublic(
+            last_started_at=None,
+            last_finished_at=None,
+            last_success_at=None,
+            last_error=None,
+            last_item_count=None,
+        )
+    return _sync_state_public(state)
+
+
+@router.get("/sync-runs", response_model=YCSyncRunsPublic)
+@limiter.limit(PER_ROUTE_LIMIT)
+async def get_sync_runs(
+    request: Request,
+    admin: AdminDep,
+    yc_uc: YCDirectoryUseCaseDep,
+    limit: int = 20,
+) -> YCSyncRunsPublic:
+    """Recent YC sync attempts with per-phase timings and counters, newest first."""
+    runs = await yc_uc.get_sync_runs(min(max(1, limit), 200))
+    return YCSyncRunsPublic(data=[YCSyncRunPublic.model_validate(run, from_attributes=True) for run in runs])
+
+
+def _sync_state_public(state: YCSyncState) -> YCSyncStatePublic:
+    return YCSyncStatePublic(
+        last_started_at=state.last_started_at,
+        last_finished_at=state.last_finished_at,
+        last_success_at=state.last_success_at,
+        last_error=state.last_error,
+        last_item_count=state.last_item_count,
+        last_inserted_count=state.last_inserted_count,
+        last_changed_count=state.last_changed_count,
+        last_unchanged_count=state.last_unchanged_count,
+        last_disappeared_count=state.last_disappeared_count,
+        last_full_sync_at=state.last_full_sync_at,
+        status=state.status,
+        progress_done=state.progress_done,
+        progress_total=state.progress_total,
+        last_founders_failed_count=state.last_founders_failed_count,
+        run_id=state.run_id,
+        run_phase=state.run_phase,
+        run_cursor=state.run_cursor,
+    )
+
+
 @router.get("/{user_id}", response_model=UserPublic)
 @limiter.limit(PER_ROUTE_LIMIT)
 async def read_user_by_id(
@@ -138,41 +263,3 @@ async def update_user_balance(
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     return UserPublic.model_validate(user)
-
-
-
-
-@router.post("/sync", response_model=Message)
-@limiter.limit(PER_ROUTE_LIMIT)
-async def sync_now(
-    request: Request,
-    admin: AdminDep,
-    yc_uc: YCDirectoryUseCaseDep,
-) -> Message:
-    count = await yc_uc.sync_from_source()
-    return Message(message=f"Synced {count} YC companies")
-
-
-@router.get("/sync-state", response_model=YCSyncStatePublic)
-@limiter.limit(PER_ROUTE_LIMIT)
-async def get_sync_state(
-    request: Request,
-    admin: AdminDep,
-    yc_uc: YCDirectoryUseCaseDep,
-) -> YCSyncStatePublic:
-    state = await yc_uc.get_sync_state()
-    if not state:
-        return YCSyncStatePublic(
-            last_started_at=None,
-            last_finished_at=None,
-            last_success_at=None,
-            last_error=None,
-            last_item_count=None,
-        )
-    return YCSyncStatePublic(
-        last_started_at=state.last_started_at,
-        last_finished_at=state.last_finished_at,
-        last_success_at=state.last_success_at,
-        last_error=state.last_error,
-        last_item_count=state.last_item_count,
-    )
@@ -1,18 +1,30 @@
-from fastapi import APIRouter, HTTPException, Request, status, BackgroundTasks
+import uuid
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config.config import settings
 from app.domain.entities.db.user import User
+from app.domain.entities.db.yc_company import YCCompany
+from app.domain.exceptions import YCChangeLogExpiredError, YCFounderNotFoundError, YCInvalidCursorError
 from app.transport.http.deps import CurrentUser, SessionDep
 from app.transport.http.rate_limit import limiter
 from app.transport.schemas import (
     YCFounderPublic,
     YCCompanyPublic,
     YCCompaniesPublic,
+    YCCompanyChangePublic,
+    YCCompanyChangesPublic,
     YCSearchMeta,
+    YCFacetCountPublic,
+    YCFacetsPublic,
     YCSyncStatePublic,
     Message,
 )
 from app.use_cases.ports.yc_directory_repository import YCSearchFilters
 from app.transport.http.routes.yc.deps import YCDirectoryUseCaseDep
+from app.use_cases.use_cases.yc_directory_use_case import YCDirectoryUseCase
 
 
 router = APIRouter(prefix="/yc", tags=["yc"])
@@ -20,21 +32,16 @@ router = APIRouter(prefix="/yc", tags=["yc"])
 
 FREE_TIER_LIMIT = 15
 PAID_PAGE_SIZE = 50
+CHANGES_PAGE_SIZE = 1000
 
 
 def _is_paid(user: User) -> bool:
     return user.plan != "free" or user.balance_cents > 0
 
 
-@router.get("/companies", response_model=YCCompaniesPublic)
-@limiter.limit("2/second")
-async def list_companies(
-    request: Request,
-    session: SessionDep,
-    current_user: CurrentUser,
-    background_tasks: BackgroundTasks,
-    yc_uc: YCDirectoryUseCaseDep,
+def _search_filters(
     q: str | None = None,
+    fuzzy: bool = False,
     batch: str | None = None,
     year: int | None = None,
     status_filter: str | None = None,
@@ -42,9 +49,44 @@ async def list_companies(
     is_hiring: bool | None = None,
     nonprofit: bool | None = None,
     top_company: bool | None = None,
+) -> YCSearchFilters:
+    return YCSearchFilters(
+        q=q,
+        fuzzy_threshold=settings.YC_SEARCH_FUZZY_THRESHOLD if fuzzy else None,
+        batch=batch,
+        year=year,
+        status=status_filter,
+        industry=industry,
+        is_hiring=is_hiring,
+        nonprofit=nonprofit,
+        top_company=top_company,
+    )
+
+
+SearchFiltersDep = Annotated[YCSearchFilters, Depends(_search_filters)]
+
+
+@router.get("/companies", response_model=YCCompaniesPublic)
+@limiter.limit("2/second")
+async def list_companies(
+    request: Request,
+    session: SessionDep,
+    current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
+    yc_uc: YCDirectoryUseCaseDep,
+    filters: SearchFiltersDep,
     skip: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
+    include_count: bool = False,
 ) -> YCCompaniesPublic:
+    """Offset pages by default. Passing `cursor` (empty for the first page)
+    switches to keyset pages, which cost the same however deep they go: each
+    carries the `next_cursor` to pass on, and a `count` only with `include_count`.
+
+    Counts are cached until the next sync; large searches get an estimate
+    (`count_estimated`).
+    """
     background_tasks.add_task(yc_uc.ensure_auto_sync)
 
     if _is_paid(current_user):
@@ -54,67 +96,163 @@ async def list_companies(
         skip = 0
         limit = FREE_TIER_LIMIT
 
-    filters = YCSearchFilters(
-        q=q,
-        batch=batch,
-        year=year,
-        status=status_filter,
-        industry=industry,
-        is_hiring=is_hiring,
-        nonprofit=nonprofit,
-        top_company=top_company,
+    next_cursor = None
+    if cursor is None:
+        items = await yc_uc.list_companies(filters=filters, skip=skip, limit=limit)
+    else:
+        try:
+            page = await yc_uc.list_companies_page(
+                filters=filters,
+                cursor=cursor if _is_paid(current_user) else None,
+                limit=limit,
+            )
+        except YCInvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        items = page.items
+        # The free tier only ever sees the first page.
+        if _is_paid(current_user):
+            next_cursor = page.next_cursor
+    count = await yc_uc.count_companies(filters) if cursor is None or include_count else None
+
+    founders_by_company = await _founders_by_company(yc_uc, items)
+    data = [_company_public(item, founders_by_company) for item in items]
+
+    await _charge_page(session, current_user, bool(data))
+
+    return YCCompaniesPublic(
+        data=data,
+        count=count.count if count is not None else None,
+        count_estimated=count is not None and not count.exact,
+        next_cursor=next_cursor,
     )
 
-    items, count = await yc_uc.list_companies(filters=filters, skip=skip, limit=limit)
 
-    company_ids = [item.id for item in items]
-    founders_by_company: dict[str, list[YCFounderPublic]] = {}
-    if company_ids:
-        founders = await yc_uc.get_founders_for_company_ids(company_ids)
-        for f in founders:
-            key = str(f.company_id)
-            founders_by_company.setdefault(key, []).append(
-                YCFounderPublic(
-                    name=f.name or "",
-                    twitter_url=f.twitter_url,
-                    linkedin_url=f.linkedin_url,
-                )
-            )
+@router.get("/companies/changes", response_model=YCCompanyChangesPublic)
+@limiter.limit("2/second")
+async def list_company_changes(
+    request: Request,
+    session: SessionDep,
+    current_user: CurrentUser,
+    yc_uc: YCDirectoryUseCaseDep,
+    since: int | None = None,
+    limit: int = CHANGES_PAGE_SIZE,
+) -> YCCompanyChangesPublic:
+    """Companies added, updated or removed after directory version `since`, oldest change first.
 
+    Each company appears once, with its latest change; added and updated ones
+    come with their current data. Without `since`, only the current version is
+    returned: take it before loading the directory from /yc/companies, then
+    poll with it. Ask again with the returned `version` while `has_more`. A
+    `since` the change log no longer covers gets a 410; reload the directory.
+    """
+    if not _is_paid(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="The YC change feed requires a paid plan",
+        )
+    try:
+        page = await yc_uc.list_company_changes(
+            since=max(0, since) if since is not None else None,
+            limit=min(max(1, limit), CHANGES_PAGE_SIZE),
+        )
+    except YCChangeLogExpiredError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e)) from e
+
+    companies = [company for _, company in page.changes if company is not None]
+    founders_by_company = await _founders_by_company(yc_uc, companies)
     data = [
-        YCCompanyPublic(
-            yc_id=item.yc_id,
-            name=item.name,
-            slug=item.slug,
-            batch=item.batch,
-            batch_code=item.batch_code,
-            year=item.year,
-            status=item.status,
-            industry=item.industry,
-            website=item.website,
-            all_locations=item.all_locations,
-            one_liner=item.one_liner,
-            team_size=item.team_size,
-            small_logo_thumb_url=item.small_logo_thumb_url,
-            url=item.url,
-            is_hiring=item.is_hiring,
-            nonprofit=item.nonprofit,
-            top_company=item.top_company,
-            tags=item.tags,
-            industries=item.industries or [],
-            regions=item.regions or [],
-            founders=founders_by_company.get(str(item.id), []),
+        YCCompanyChangePublic(
+            version=change.version,
+            yc_id=change.yc_id,
+            kind=change.kind,
+            company=_company_public(company, founders_by_company) if company is not None else None,
         )
-        for item in items
+        for change, company in page.changes
     ]
 
-    if current_user.plan == "pay_per_use" and data and _is_paid(current_user):
+    await _charge_page(session, current_user, bool(data))
+
+    return YCCompanyChangesPublic(data=data, version=page.version, has_more=page.has_more)
+
+
+@router.get("/founders/{founder_id}/companies", response_model=YCCompaniesPublic)
+@limiter.limit("2/second")
+async def list_founder_companies(
+    request: Request,
+    session: SessionDep,
+    current_user: CurrentUser,
+    yc_uc: YCDirectoryUseCaseDep,
+    founder_id: uuid.UUID,
+) -> YCCompaniesPublic:
+    """Every listed company of a founder (the `id` of a company's founder), in directory order."""
+    try:
+        items = await yc_uc.list_founder_companies(founder_id)
+    except YCFounderNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    count = len(items)
+    if not _is_paid(current_user):
+        items = items[:FREE_TIER_LIMIT]
+    founders_by_company = await _founders_by_company(yc_uc, items)
+    data = [_company_public(item, founders_by_company) for item in items]
+
+    await _charge_page(session, current_user, bool(data))
+
+    return YCCompaniesPublic(data=data, count=count)
+
+
+async def _founders_by_company(
+    yc_uc: YCDirectoryUseCase,
+    companies: list[YCCompany],
+) -> dict[str, list[YCFounderPublic]]:
+    founders_by_company: dict[str, list[YCFounderPublic]] = {}
+    if not companies:
+        return founders_by_company
+    founders = await yc_uc.get_founders_for_company_ids([c.id for c in companies])
+    for company_id, f in founders:
+        founders_by_company.setdefault(str(company_id), []).append(
+            YCFounderPublic(
+                id=f.id,
+                name=f.name or "",
+                twitter_url=f.twitter_url,
+                linkedin_url=f.linkedin_url,
+            )
+        )
+    return founders_by_company
+
+
+def _company_public(item: YCCompany, founders_by_company: dict[str, list[YCFounderPublic]]) -> YCCompanyPublic:
+    return YCCompanyPublic(
+        yc_id=item.yc_id,
+        name=item.name,
+        slug=item.slug,
+        batch=item.batch,
+        batch_code=item.batch_code,
+        year=item.year,
+        status=item.status,
+        industry=item.industry,
+        website=item.website,
+        all_locations=item.all_locations,
+        one_liner=item.one_liner,
+        team_size=item.team_size,
+        small_logo_thumb_url=item.small_logo_thumb_url,
+        url=item.url,
+        is_hiring=item.is_hiring,
+        nonprofit=item.nonprofit,
+        top_company=item.top_company,
+        tags=item.tags,
+        industries=item.industries or [],
+        regions=item.regions or [],
+        founders=founders_by_company.get(str(item.id), []),
+    )
+
+
+async def _charge_page(session: AsyncSession, current_user: User, non_empty: bool) -> None:
+    if current_user.plan == "pay_per_use" and non_empty and _is_paid(current_user):
         current_user.balance_cents = max(0, current_user.balance_cents - 10)
         session.add(current_user)
         await session.commit()
 
-    return YCCompaniesPublic(data=data, count=count)
-
 
 @router.get("/meta", response_model=YCSearchMeta)
 @limiter.limit("2/second")
@@ -132,3 +270,26 @@ async def get_meta(
         statuses=meta["statuses"],
         industries=meta["industries"],
     )
+
+
+@router.get("/facets", response_model=YCFacetsPublic)
+@limiter.limit("2/second")
+async def get_facets(
+    request: Request,
+    current_user: CurrentUser,
+    yc_uc: YCDirectoryUseCaseDep,
+    filters: SearchFiltersDep,
+) -> YCFacetsPublic:
+    """How many companies /yc/companies would list, with the same filters, for
+    each status, industry, year, batch and flag value.
+
+    A facet's counts ignore its own filter: `statuses` with `status_filter` set
+    still counts every status. Cached until the next sync.
+    """
+    facets = await yc_uc.get_facets(filters)
+    return YCFacetsPublic(
+        **{
+            name: [YCFacetCountPublic(value=value, count=count) for value, count in pairs]
+            for name, pairs in facets.items()
+        }
+    )
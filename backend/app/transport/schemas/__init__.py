@@ -20,8 +20,17 @@ from app.transport.schemas.yc import (
     YCFounderPublic,
     YCCompanyPublic,
     YCCompaniesPublic,
+    YCCompanyChangePublic,
+    YCCompanyChangesPublic,
     YCSearchMeta,
+    YCFacetCountPublic,
+    YCFacetsPublic,
     YCSyncStatePublic,
+    YCSyncStageMemoryPublic,
+    YCSyncAllocationSitePublic,
+    YCSyncMemoryProfilePublic,
+    YCSyncRunPublic,
+    YCSyncRunsPublic,
 )
 from app.transport.schemas.admin import (
     PrivateUserCreate,
@@ -48,8 +57,17 @@ __all__ = [
     "YCFounderPublic",
     "YCCompanyPublic",
     "YCCompaniesPublic",
+    "YCCompanyChangePublic",
+    "YCCompanyChangesPublic",
     "YCSearchMeta",
+    "YCFacetCountPublic",
+    "YCFacetsPublic",
     "YCSyncStatePublic",
+    "YCSyncStageMemoryPublic",
+    "YCSyncAllocationSitePublic",
+    "YCSyncMemoryProfilePublic",
+    "YCSyncRunPublic",
+    "YCSyncRunsPublic",
     "PrivateUserCreate",
     "AdminDashboardStats",
     "BalanceUpdate",
@@ -1,9 +1,11 @@
+import uuid
 from datetime import datetime
 
 from sqlmodel import SQLModel
 
 
 class YCFounderPublic(SQLModel):
+    id: uuid.UUID
     name: str
     twitter_url: str | None = None
     linkedin_url: str | None = None
@@ -35,7 +37,27 @@ class YCCompanyPublic(SQLModel):
 
 class YCCompaniesPublic(SQLModel):
     data: list[YCCompanyPublic]
-    count: int
+    # None for cursor pages unless include_count was set
+    count: int | None
+    # The count is the query planner's estimate (large searches) rather than exact
+    count_estimated: bool = False
+    # Pass as `cursor` for the next page; None on the last page and in offset mode
+    next_cursor: str | None = None
+
+
+class YCCompanyChangePublic(SQLModel):
+    version: int
+    yc_id: int
+    # "added" | "updated" | "removed"; removed ones come without a company
+    kind: str
+    company: YCCompanyPublic | None = None
+
+
+class YCCompanyChangesPublic(SQLModel):
+    data: list[YCCompanyChangePublic]
+    # Pass as `since` next time
+    version: int
+    has_more: bool
 
 
 class YCSearchMeta(SQLModel):
@@ -45,10 +67,85 @@ class YCSearchMeta(SQLModel):
     industries: list[str]
 
 
+class YCFacetCountPublic(SQLModel):
+    value: str | int | bool
+    # Companies the list would have with this value chosen, all other filters unchanged
+    count: int
+
+
+class YCFacetsPublic(SQLModel):
+    statuses: list[YCFacetCountPublic]
+    industries: list[YCFacetCountPublic]
+    years: list[YCFacetCountPublic]
+    batches: list[YCFacetCountPublic]
+    is_hiring: list[YCFacetCountPublic]
+    nonprofit: list[YCFacetCountPublic]
+    top_company: list[YCFacetCountPublic]
+
+
 class YCSyncStatePublic(SQLModel):
     last_started_at: datetime | None
     last_finished_at: datetime | None
     last_success_at: datetime | None
     last_error: str | None
     last_item_count: int | None
+    last_inserted_count: int | None = None
+    last_changed_count: int | None = None
+    last_unchanged_count: int | None = None
+    last_disappeared_count: int | None = None
+    last_full_sync_at: datetime | None = None
+    status: str | None = None
+    progress_done: int | None = None
+    progress_total: int | None = None
+    last_founders_failed_count: int | None = None
+    run_id: uuid.UUID | None = None
+    run_phase: str | None = None
+    run_cursor: str | None = None
+
+
+class YCSyncStageMemoryPublic(SQLModel):
+    stage: str
+    checkpoints: int
+    rss_mb: float
+    traced_mb: float
+    peak_traced_mb: float
+
+
+class YCSyncAllocationSitePublic(SQLModel):
+    site: str
+    size_kb: float
+    count: int
+
+
+class YCSyncMemoryProfilePublic(SQLModel):
+    stages: list[YCSyncStageMemoryPublic]
+    top_sites_stage: str | None
+    top_sites: list[YCSyncAllocationSitePublic]
+
+
+class YCSyncRunPublic(SQLModel):
+    id: uuid.UUID
+    run_id: uuid.UUID | None
+    resumed: bool
+    status: str
+    error: str | None
+    started_at: datetime
+    finished_at: datetime
+    download_seconds: float
+    parse_seconds: float
+    company_upsert_seconds: float
+    founder_crawl_seconds: float
+    pages_fetched: int
+    pages_not_modified: int
+    pages_failed: int
+    bytes_downloaded: int
+    companies_parsed: int
+    founders_parsed: int
+    company_rows_written: int
+    founder_rows_written: int
+    memory_profile: YCSyncMemoryProfilePublic | None = None
+
+
+class YCSyncRunsPublic(SQLModel):
+    data: list[YCSyncRunPublic]
 
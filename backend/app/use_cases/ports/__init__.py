@@ -5,10 +5,12 @@ from app.use_cases.ports.refresh_store import IRefreshTokenStore
 from app.use_cases.ports.token_service import ITokenService
 from app.use_cases.ports.unit_of_work import IUnitOfWork
 from app.use_cases.ports.user_repository import IUserRepository
+from app.use_cases.ports.yc_count_cache import IYCCountCache
 from app.use_cases.ports.yc_directory_repository import (
     IYCDirectoryRepository,
     YCSearchFilters,
 )
+from app.use_cases.ports.yc_sync_queue import IYCSyncQueue
 
 __all__ = [
     "IEmailSender",
@@ -16,6 +18,8 @@ __all__ = [
     "ITokenService",
     "IUnitOfWork",
     "IUserRepository",
+    "IYCCountCache",
     "IYCDirectoryRepository",
+    "IYCSyncQueue",
     "YCSearchFilters",
 ]
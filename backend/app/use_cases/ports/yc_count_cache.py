@@ -0,0 +1,33 @@
+"""Port: cache of YC company list counts and facets. Implemented in infrastructure/redis."""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class YCCompanyCount:
+    count: int
+    # False for planner estimates
+    exact: bool
+
+
+class IYCCountCache(ABC):
+    """Counts and facet counts of filtered company lists. Keys include the
+    directory version, so entries never go stale; they are only left behind
+    for expiry."""
+
+    @abstractmethod
+    async def get(self, key: str) -> YCCompanyCount | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, count: YCCompanyCount) -> None:
+        ...
+
+    @abstractmethod
+    async def get_facets(self, key: str) -> dict[str, list[tuple[Any, int]]] | None:
+        ...
+
+    @abstractmethod
+    async def set_facets(self, key: str, facets: dict[str, list[tuple[Any, int]]]) -> None:
+        ...
@@ -7,7 +7,9 @@ from typing import Any
 from uuid import UUID
 
 from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_change import YCCompanyChange
 from app.domain.entities.db.yc_founder import YCFounder
+from app.domain.entities.db.yc_sync_run import YCSyncRun
 from app.domain.entities.db.yc_sync_state import YCSyncState
 
 
@@ -21,6 +23,31 @@ class YCSearchFilters:
     is_hiring: bool | None = None
     nonprofit: bool | None = None
     top_company: bool | None = None
+    # Match `q` to names and slugs by trigram similarity of at least this,
+    # instead of full-text search
+    fuzzy_threshold: float | None = None
+
+
+@dataclass
+class YCCompanyPage:
+    """A page of the company list. `next_cursor` continues after it, if there is more."""
+
+    items: list[YCCompany]
+    next_cursor: str | None
+
+
+@dataclass
+class YCCompanyChanges:
+    """A page of the change log: the latest change per company, oldest first.
+
+    `company` is the current company for added and updated ones. `version` is
+    the `since` to ask for next; once `has_more` is False it is the directory
+    version.
+    """
+
+    changes: list[tuple[YCCompanyChange, YCCompany | None]]
+    version: int
+    has_more: bool
 
 
 class IYCDirectoryRepository(ABC):
@@ -29,7 +56,20 @@ class IYCDirectoryRepository(ABC):
         ...
 
     @abstractmethod
-    async def sync_from_source(self) -> int:
+    async def abandon_sync_run(self) -> YCSyncState | None:
+        """Drop the checkpoint of an unfinished sync run so the next sync starts
+        from scratch. Returns the updated state, or None if no run is unfinished."""
+        ...
+
+    @abstractmethod
+    async def rollback_directory_snapshot(self) -> bool:
+        """Swap the directory tables replaced by the last shadow-table sync back
+        in. False if there is no usable previous snapshot."""
+        ...
+
+    @abstractmethod
+    async def list_sync_runs(self, limit: int) -> list[YCSyncRun]:
+        """Most recent sync attempts first."""
         ...
 
     @abstractmethod
@@ -38,13 +78,61 @@ class IYCDirectoryRepository(ABC):
         filters: YCSearchFilters,
         skip: int,
         limit: int,
-    ) -> tuple[list[YCCompany], int]:
+    ) -> list[YCCompany]:
+        ...
+
+    @abstractmethod
+    async def list_companies_page(
+        self,
+        filters: YCSearchFilters,
+        cursor: str | None,
+        limit: int,
+    ) -> YCCompanyPage | None:
+        """The page after `cursor` (the first page if None), ordered like `list_companies`.
+
+        None if `cursor` is not one this list handed out.
+        """
         ...
 
     @abstractmethod
-    async def get_founders_for_company_ids(self, company_ids: list[UUID]) -> list[YCFounder]:
+    async def count_companies(self, filters: YCSearchFilters) -> int:
+        ...
+
+    @abstractmethod
+    async def estimate_company_count(self, filters: YCSearchFilters) -> int:
+        """The query planner's estimate of `count_companies`, without running it."""
+        ...
+
+    @abstractmethod
+    async def get_directory_version(self) -> int:
+        """Changes with every write to the directory (see yc/changes.py)."""
+        ...
+
+    @abstractmethod
+    async def list_company_changes(self, since: int | None, limit: int) -> YCCompanyChanges | None:
+        """Changes after directory version `since`, or just the current version
+        if `since` is None. None if the change log no longer covers `since`."""
+        ...
+
+    @abstractmethod
+    async def get_founders_for_company_ids(self, company_ids: list[UUID]) -> list[tuple[UUID, YCFounder]]:
+        """(company id, founder) pairs, each company's founders in page order."""
+        ...
+
+    @abstractmethod
+    async def list_founder_companies(self, founder_id: UUID) -> list[YCCompany] | None:
+        """The listed companies of a founder, newest batch first; None if there is no such founder."""
         ...
 
     @abstractmethod
     async def get_meta(self) -> dict[str, Any]:
         ...
+
+    @abstractmethod
+    async def get_facets(self, filters: YCSearchFilters) -> dict[str, list[tuple[Any, int]]]:
+        """(value, companies) pairs of each `get_meta` list and boolean flag, ordered by value.
+
+        A facet's counts apply every filter but its own, so each is what the
+        list would count with that value chosen instead.
+        """
+        ...
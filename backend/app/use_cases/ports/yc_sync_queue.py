@@ -0,0 +1,17 @@
+"""Port: YC directory sync job queue. Implemented in infrastructure/redis."""
+from abc import ABC, abstractmethod
+
+
+class IYCSyncQueue(ABC):
+    """Hands sync jobs to the out-of-process sync worker."""
+
+    @abstractmethod
+    async def enqueue(self, reason: str, *, skip_if_running: bool = False) -> bool:
+        """Queue a sync job. Returns False if one is already waiting to start,
+        or (with `skip_if_running`) if a sync is in progress."""
+        ...
+
+    @abstractmethod
+    async def is_running(self) -> bool:
+        """Whether a worker currently holds the sync lock."""
+        ...
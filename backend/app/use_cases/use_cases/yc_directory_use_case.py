@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -7,47 +10,162 @@ from uuid import UUID
 
 from app.domain.entities.db.yc_company import YCCompany
 from app.domain.entities.db.yc_founder import YCFounder
+from app.domain.entities.db.yc_sync_run import YCSyncRun
 from app.domain.entities.db.yc_sync_state import YCSyncState
+from app.domain.exceptions import (
+    YCChangeLogExpiredError,
+    YCDirectorySnapshotNotFoundError,
+    YCFounderNotFoundError,
+    YCInvalidCursorError,
+    YCSyncInProgressError,
+    YCSyncRunNotFoundError,
+)
 from app.use_cases.ports.yc_directory_repository import (
     IYCDirectoryRepository,
+    YCCompanyChanges,
+    YCCompanyPage,
     YCSearchFilters,
 )
+from app.use_cases.ports.yc_count_cache import IYCCountCache, YCCompanyCount
+from app.use_cases.ports.yc_sync_queue import IYCSyncQueue
 
 
 class YCDirectoryUseCase:
     def __init__(
         self,
         repo: IYCDirectoryRepository,
+        sync_queue: IYCSyncQueue,
         auto_sync_interval: timedelta,
+        count_cache: IYCCountCache,
+        exact_count_limit: int,
     ) -> None:
         self._repo = repo
+        self._sync_queue = sync_queue
         self._auto_sync_interval = auto_sync_interval
+        self._count_cache = count_cache
+        self._exact_count_limit = exact_count_limit
 
     async def ensure_auto_sync(self) -> None:
         now = datetime.utcnow()
         state = await self._repo.get_sync_state()
         if not state or not state.last_success_at:
-            await self._repo.sync_from_source()
+            await self._sync_queue.enqueue("auto", skip_if_running=True)
             return
         if now - state.last_success_at >= self._auto_sync_interval:
-            await self._repo.sync_from_source()
+            await self._sync_queue.enqueue("auto", skip_if_running=True)
+
+    async def request_sync(self) -> bool:
+        """Queue a sync for the sync worker; False if one is already queued."""
+        return await self._sync_queue.enqueue("admin")
+
+    async def resume_sync(self) -> bool:
+        """Queue a job that continues the unfinished sync run from its checkpoint.
+
+        Every sync resumes an unfinished run; this only checks that there is one
+        and that it is not running. False if a job is already queued.
+        """
+        state = await self._repo.get_sync_state()
+        if not state or state.run_phase is None:
+            raise YCSyncRunNotFoundError("No unfinished YC sync run to resume")
+        if await self._sync_queue.is_running():
+            raise YCSyncInProgressError("The YC sync run is still in progress")
+        return await self._sync_queue.enqueue("resume")
 
-    async def sync_from_source(self) -> int:
-        return await self._repo.sync_from_source()
+    async def abandon_sync(self) -> YCSyncState:
+        """Discard the unfinished run's checkpoint; the next sync starts over."""
+        if await self._sync_queue.is_running():
+            raise YCSyncInProgressError("A YC sync is in progress")
+        state = await self._repo.abandon_sync_run()
+        if state is None:
+            raise YCSyncRunNotFoundError("No unfinished YC sync run to abandon")
+        return state
+
+    async def rollback_directory(self) -> None:
+        """Restore the directory as it was before the last shadow-table sync."""
+        if await self._sync_queue.is_running():
+            raise YCSyncInProgressError("A YC sync is in progress")
+        if not await self._repo.rollback_directory_snapshot():
+            raise YCDirectorySnapshotNotFoundError("No previous YC directory snapshot to roll back to")
 
     async def list_companies(
         self,
         filters: YCSearchFilters,
         skip: int,
         limit: int,
-    ) -> tuple[list[YCCompany], int]:
+    ) -> list[YCCompany]:
         return await self._repo.list_companies(filters=filters, skip=skip, limit=limit)
 
-    async def get_founders_for_company_ids(self, company_ids: list[UUID]) -> list[YCFounder]:
+    async def count_companies(self, filters: YCSearchFilters) -> YCCompanyCount:
+        """How many companies match `filters`, cached until the directory changes.
+
+        Searches the planner expects to match more than `exact_count_limit`
+        companies are not counted; they get the estimate.
+        """
+        key = await self._cache_key(filters)
+        count = await self._count_cache.get(key)
+        if count is not None:
+            return count
+        if filters.q:
+            estimate = await self._repo.estimate_company_count(filters)
+            if estimate > self._exact_count_limit:
+                count = YCCompanyCount(count=estimate, exact=False)
+        if count is None:
+            count = YCCompanyCount(count=await self._repo.count_companies(filters), exact=True)
+        await self._count_cache.set(key, count)
+        return count
+
+    async def list_companies_page(
+        self,
+        filters: YCSearchFilters,
+        cursor: str | None,
+        limit: int,
+    ) -> YCCompanyPage:
+        page = await self._repo.list_companies_page(filters=filters, cursor=cursor, limit=limit)
+        if page is None:
+            raise YCInvalidCursorError("Invalid cursor; start again from the first page")
+        return page
+
+    async def list_company_changes(self, since: int | None, limit: int) -> YCCompanyChanges:
+        changes = await self._repo.list_company_changes(since=since, limit=limit)
+        if changes is None:
+            raise YCChangeLogExpiredError(
+                f"The YC change log no longer covers version {since}; reload the directory"
+            )
+        return changes
+
+    async def get_founders_for_company_ids(self, company_ids: list[UUID]) -> list[tuple[UUID, YCFounder]]:
         return await self._repo.get_founders_for_company_ids(company_ids)
 
+    async def list_founder_companies(self, founder_id: UUID) -> list[YCCompany]:
+        companies = await self._repo.list_founder_companies(founder_id)
+        if companies is None:
+            raise YCFounderNotFoundError("YC founder not found")
+        return companies
+
     async def get_meta(self) -> dict[str, Any]:
         return await self._repo.get_meta()
 
+    async def get_facets(self, filters: YCSearchFilters) -> dict[str, list[tuple[Any, int]]]:
+        """Companies per filter value under the other filters, cached until the directory changes."""
+        key = await self._cache_key(filters)
+        facets = await self._count_cache.get_facets(key)
+        if facets is None:
+            facets = await self._repo.get_facets(filters)
+            await self._count_cache.set_facets(key, facets)
+        return facets
+
+    async def _cache_key(self, filters: YCSearchFilters) -> str:
+        return f"{await self._repo.get_directory_version()}:{_filters_key(filters)}"
+
     async def get_sync_state(self) -> YCSyncState | None:
         return await self._repo.get_sync_state()
+
+    async def get_sync_runs(self, limit: int) -> list[YCSyncRun]:
+        return await self._repo.list_sync_runs(limit)
+
+
+def _filters_key(filters: YCSearchFilters) -> str:
+    """Digest of `filters`; the same for searches that differ only in case and spacing."""
+    fields = asdict(filters)
+    fields["q"] = " ".join((filters.q or "").lower().split()) or None
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:32]
@@ -0,0 +1,108 @@
+"""Local stand-in for the YC feed host and ycombinator.com company pages.
+
+Serves the `*.json` files in `--feed-dir` at `/feeds/<name>` and a seeded
+synthetic page (see `benchmarks.synthetic.synthetic_company_page`) for every
+`/companies/<slug>`, with ETags so re-syncs see 304s. Each page is generated
+from `--seed` and the slug alone, so the same slug always gets the same page.
+
+Runs in its own process so page generation does not compete with the sync's
+event loop; the bound port is printed as the first line on stdout.
+
+    python -m benchmarks.stub_source --feed-dir /tmp/feeds --page-kb 30
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_company_page
+
+
+def _handler(feed_dir: Path, page_kb: int, seed: int, latency: float) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            kind, _, name = self.path.lstrip("/").partition("/")
+            if kind == "feeds" and "/" not in name and (path := feed_dir / name).is_file():
+                etag = f'"{path.stat().st_mtime_ns}-{path.stat().st_size}"'
+                self._send(etag, "application/json", path.read_bytes)
+            elif kind == "companies" and name:
+                rng = random.Random(f"{seed}:{name}")
+                etag = f'"{seed}-{name}"'
+                self._send(
+                    etag,
+                    "text/html",
+                    lambda: synthetic_company_page(rng, name, founders=rng.randint(0, 4), filler_kb=page_kb).encode(),
+                )
+            else:
+                self.send_error(404)
+
+        def _send(self, etag: str, content_type: str, body: Callable[[], bytes]) -> None:
+            if latency:
+                time.sleep(latency)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            payload = body()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+@contextmanager
+def stub_source(feed_dir: Path, page_kb: int = 30, seed: int = 0, latency: float = 0.0) -> Iterator[str]:
+    """Run the stub source in a subprocess; yields its base URL."""
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.stub_source",
+            "--feed-dir", str(feed_dir),
+            "--page-kb", str(page_kb),
+            "--seed", str(seed),
+            "--latency", str(latency),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert proc.stdout is not None
+        port = int(proc.stdout.readline())
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feed-dir", type=Path, required=True)
+    parser.add_argument("--page-kb", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), _handler(args.feed_dir, args.page_kb, args.seed, args.latency))
+    server.daemon_threads = True
+    sys.stdout.write(f"{server.server_address[1]}\n")
+    sys.stdout.flush()
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
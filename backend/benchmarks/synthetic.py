@@ -0,0 +1,100 @@
+"""Seeded generators for synthetic YC directory data."""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+_STATUSES = ["Active", "Active", "Active", "Acquired", "Inactive", "Public"]
+_INDUSTRIES = ["B2B", "Consumer", "Fintech", "Healthcare", "Industrials", "Education"]
+_TAGS = ["AI", "SaaS", "Developer Tools", "Marketplace", "Climate", "Robotics", "Security"]
+_WORDS = (
+    "platform data teams build ship faster secure cloud api workflow automate "
+    "customers revenue infrastructure open source analytics realtime"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def synthetic_company(rng: random.Random, yc_id: int, site: str = "https://www.ycombinator.com") -> dict[str, Any]:
+    year = rng.randint(2005, 2025)
+    season = rng.choice(["Winter", "Summer"])
+    slug = f"synthetic-{yc_id}"
+    return {
+        "id": yc_id,
+        "name": f"Synthetic {yc_id}",
+        "slug": slug,
+        "batch": f"{season} {year}",
+        "status": rng.choice(_STATUSES),
+        "industry": rng.choice(_INDUSTRIES),
+        "subindustry": rng.choice(_INDUSTRIES) + " -> " + rng.choice(_TAGS),
+        "website": f"https://{slug}.example.com",
+        "all_locations": "San Francisco, CA, USA",
+        "one_liner": _sentence(rng, 8),
+        "long_description": " ".join(_sentence(rng, 12) for _ in range(rng.randint(1, 6))),
+        "team_size": rng.randint(1, 500),
+        "small_logo_thumb_url": f"https://cdn.example.com/logos/{slug}.png",
+        "url": f"{site}/companies/{slug}",
+        "isHiring": rng.random() < 0.3,
+        "nonprofit": rng.random() < 0.02,
+        "top_company": rng.random() < 0.05,
+        "industries": rng.sample(_INDUSTRIES, 2),
+        "regions": ["United States of America", "America / Canada"],
+        "tags": rng.sample(_TAGS, rng.randint(0, 3)),
+        "launched_at": rng.randint(1_100_000_000, 1_750_000_000),
+    }
+
+
+def write_feed(path: Path, companies: int, seed: int = 0, site: str = "https://www.ycombinator.com") -> int:
+    """Write an all.json-shaped feed one entry at a time; returns the file size.
+
+    Company page URLs point at `site`, e.g. a local `benchmarks.stub_source`.
+    """
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("[")
+        for i in range(companies):
+            if i:
+                fh.write(",")
+            json.dump(synthetic_company(rng, i + 1, site), fh)
+        fh.write("]")
+    return path.stat().st_size
+
+
+def synthetic_company_page(rng: random.Random, slug: str, founders: int = 2, filler_kb: int = 120) -> str:
+    """A YC company page: founders block between large head/nav and launches/jobs/footer markup."""
+    filler_sentences = max(1, filler_kb * 1024 // 2 // 80)
+
+    def filler(sentences: int) -> str:
+        return "".join(
+            f'<div class="prose"><p>{_sentence(rng, 12)}</p><a href="/companies?tag={rng.choice(_TAGS)}">tag</a></div>'
+            for _ in range(sentences)
+        )
+
+    blocks = []
+    for i in range(founders):
+        name = f"Founder {slug} {i}"
+        handle = f"{slug}-{i}"
+        blocks.append(
+            '<div class="flex flex-row gap-3">'
+            f'<img alt="{name}" src="https://bookface-images.s3.amazonaws.com/avatars/{handle}.jpg?sig={rng.randrange(10**6)}" />'
+            f'<div><h3 class="text-lg font-bold">{name}</h3><div>{"Founder" if i == 0 else "Co-Founder"}</div>'
+            f"<p>{_sentence(rng, 20)}</p>"
+            f'<a href="https://twitter.com/{handle}">x</a>'
+            f'<a href="https://www.linkedin.com/in/{handle}/">li</a>'
+            f'<a href="https://www.ycombinator.com/people/{handle}">yc</a></div></div>'
+        )
+    return (
+        f"<!DOCTYPE html><html><head><title>{slug}</title>"
+        f'<script type="application/json">{json.dumps({"props": _sentence(rng, 200)})}</script>'
+        f"<style>{'.c{color:red}' * 200}</style></head><body>"
+        f"<nav>{filler(filler_sentences // 4)}</nav>"
+        f"<section><h1>{slug}</h1>{filler(filler_sentences // 4)}</section>"
+        f"<section><h3>Active Founders</h3>{''.join(blocks)}</section>"
+        f"<section><h3>Company Launches</h3>{filler(filler_sentences // 4)}</section>"
+        f"<section><h3>Jobs at {slug}</h3>{filler(filler_sentences // 4)}</section>"
+        "<footer>© Y Combinator</footer></body></html>"
+    )
@@ -0,0 +1,159 @@
+"""Rows/sec of the INSERT vs COPY loaders for the YC company and founder tables.
+
+Runs against the configured Postgres, inside a scratch `bench_yc` schema (dropped
+afterwards) so the real directory tables are untouched. For each size it
+measures, per loader:
+
+- companies_initial: loading N new companies into empty tables
+- companies_resync:  reloading the same N companies (all unchanged)
+- founders_initial:  reconciling `--founders-per-company` founders per company
+
+    python -m benchmarks.yc_bulk_load --sizes 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import random
+import sys
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.config import settings
+from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_change import YCCompanyChange
+from app.domain.entities.db.yc_company_founder import YCCompanyFounder
+from app.domain.entities.db.yc_founder import YCFounder
+from app.infrastructure.yc.bulk_load import (
+    copy_companies,
+    copy_founders,
+    prepare_founder_stage,
+)
+from app.infrastructure.yc.metrics import SyncRunMetrics
+from app.infrastructure.yc.rows import founder_rows
+from app.infrastructure.yc.sync import (
+    BATCH_SIZE,
+    _reconcile_founders,
+    _upsert_companies,
+)
+from benchmarks.synthetic import synthetic_company
+
+SCHEMA = "bench_yc"
+FOUNDER_CHUNK = 50
+TABLES = [YCCompany.__table__, YCFounder.__table__, YCCompanyFounder.__table__, YCCompanyChange.__table__]
+
+
+async def _feed(companies: int, seed: int) -> AsyncIterator[list[dict[str, Any]]]:
+    rng = random.Random(seed)
+    batch: list[dict[str, Any]] = []
+    for i in range(companies):
+        batch.append(synthetic_company(rng, i + 1))
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _founders(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": f"Founder {rng.randrange(10**9)}",
+            "role": "Founder",
+            "bio": "Previously built things.",
+            "yc_profile_url": None,
+            "twitter_url": None,
+            "linkedin_url": None,
+            "avatar_url": "https://cdn.example.com/avatars/a.jpg",
+        }
+        for _ in range(count)
+    ]
+
+
+async def _reset_schema(engine: Any) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(
+            lambda c: YCCompany.metadata.create_all(c, tables=TABLES)  # type: ignore[arg-type]
+        )
+
+
+async def _run(session_factory: Any, loader: str, companies: int, founders_per_company: int, seed: int) -> dict[str, Any]:
+    if loader == "copy":
+        load = copy_companies
+    else:
+        load = functools.partial(_upsert_companies, run_metrics=SyncRunMetrics())
+    result: dict[str, Any] = {"loader": loader, "companies": companies}
+
+    async with session_factory() as session:
+        start = time.perf_counter()
+        await load(session, _feed(companies, seed))
+        elapsed = time.perf_counter() - start
+        result["companies_initial_rows_per_sec"] = round(companies / elapsed)
+
+        start = time.perf_counter()
+        diff = await load(session, _feed(companies, seed))
+        elapsed = time.perf_counter() - start
+        assert diff.unchanged == companies, diff
+        result["companies_resync_rows_per_sec"] = round(companies / elapsed)
+
+        ids = [row[0] for row in (await session.execute(text("SELECT id FROM yccompany"))).all()]
+        rng = random.Random(seed)
+        if loader == "copy":
+            await prepare_founder_stage(session)
+        written = 0
+        start = time.perf_counter()
+        for i in range(0, len(ids), FOUNDER_CHUNK):
+            fresh = {cid: founder_rows(cid, _founders(founders_per_company, rng)) for cid in ids[i : i + FOUNDER_CHUNK]}
+            if loader == "copy":
+                writes = await copy_founders(session, [f for rows in fresh.values() for f in rows])
+            else:
+                writes = await _reconcile_founders(session, fresh)
+            await session.commit()
+            written += writes.total
+        elapsed = time.perf_counter() - start
+        result["founder_rows"] = written
+        result["founders_initial_rows_per_sec"] = round(written / elapsed) if elapsed else None
+    return result
+
+
+async def main_async(args: argparse.Namespace) -> list[dict[str, Any]]:
+    engine = create_async_engine(
+        str(settings.SQLALCHEMY_DATABASE_URI),
+        connect_args={"options": f"-c search_path={SCHEMA}"},
+    )
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    results = []
+    try:
+        for companies in args.sizes:
+            for loader in args.loaders:
+                await _reset_schema(engine)
+                results.append(await _run(session_factory, loader, companies, args.founders_per_company, args.seed))
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--loaders", nargs="+", choices=["insert", "copy"], default=["insert", "copy"])
+    parser.add_argument("--founders-per-company", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    results = asyncio.run(main_async(args))
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
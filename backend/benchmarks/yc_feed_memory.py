@@ -0,0 +1,109 @@
+"""Peak RSS of buffered vs streaming all.json ingestion.
+
+Generates a synthetic feed, then ingests it once per mode in a fresh subprocess
+(so ru_maxrss is not shared) through the same `feed_batches` + `CompanyDiffer`
+path the sync uses, minus the database writes.
+
+    python -m benchmarks.yc_feed_memory --companies 200000
+
+Requires the usual backend settings in the environment (the sync module imports
+`app.core.config`).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _ingest(feed: Path, streaming: bool, batch_size: int) -> int:
+    import httpx
+
+    from app.infrastructure.yc.feed import feed_batches
+    from app.infrastructure.yc.rows import CompanyDiffer, company_row
+
+    async def body() -> AsyncIterator[bytes]:
+        with feed.open("rb") as fh:
+            while chunk := fh.read(CHUNK_SIZE):
+                yield chunk
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    differ = CompanyDiffer({})
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        async with client.stream("GET", "https://feed.invalid/all.json") as resp:
+            async for batch in feed_batches(resp, streaming=streaming, batch_size=batch_size):
+                differ.writes(company_row(raw) for raw in batch)
+    return differ.finish().total
+
+
+def _child(args: argparse.Namespace) -> None:
+    import app.infrastructure.yc.sync  # noqa: F401  (import cost is part of the baseline)
+
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    total = asyncio.run(_ingest(Path(args.feed), args.mode == "streaming", args.batch_size))
+    result = {
+        "mode": args.mode,
+        "companies": total,
+        "seconds": round(time.perf_counter() - start, 3),
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "ingest_rss_mb": round(_peak_rss_mb() - baseline, 1),
+    }
+    sys.stdout.write(json.dumps(result) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=["buffered", "streaming"])
+    parser.add_argument("--feed", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.feed:
+        _child(args)
+        return
+
+    from benchmarks.synthetic import write_feed
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed = Path(tmp) / "all.json"
+        size = write_feed(feed, args.companies, seed=args.seed)
+        results = []
+        for mode in [args.mode] if args.mode else ["buffered", "streaming"]:
+            out = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.yc_feed_memory",
+                    "--mode", mode,
+                    "--feed", str(feed),
+                    "--batch-size", str(args.batch_size),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    report = {"feed_mb": round(size / 1024 / 1024, 1), "results": results}
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
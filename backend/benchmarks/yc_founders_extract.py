@@ -0,0 +1,89 @@
+"""Fast-path vs full-page founders extraction over a corpus of company pages.
+
+The corpus is the HTML fixtures in `tests/utils/yc_founders_html.py`, every
+`*.html` file under `--corpus-dir` (e.g. saved ycombinator.com company pages)
+and `--synthetic` seeded synthetic pages. Each page is parsed by both engines;
+any difference in output fails the run (exit status 1) before timings are
+reported.
+
+    python -m benchmarks.yc_founders_extract --corpus-dir ./yc_pages --synthetic 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from app.infrastructure.yc.founders_parser import (
+    founders_section,
+    parse_founders_html,
+    parse_founders_html_full,
+)
+from benchmarks.synthetic import synthetic_company_page
+from tests.utils import yc_founders_html
+
+
+def _corpus(corpus_dir: Path | None, synthetic: int, seed: int) -> list[tuple[str, str]]:
+    pages = [
+        (f"fixture:{name}", value)
+        for name, value in vars(yc_founders_html).items()
+        if name.isupper() and isinstance(value, str)
+    ]
+    if corpus_dir is not None:
+        pages += [(str(path), path.read_text(encoding="utf-8", errors="replace")) for path in sorted(corpus_dir.rglob("*.html"))]
+    rng = random.Random(seed)
+    pages += [
+        (f"synthetic:{i}", synthetic_company_page(rng, f"company-{i}", founders=rng.randint(0, 4)))
+        for i in range(synthetic)
+    ]
+    return pages
+
+
+def _time(parse: Callable[[str], list[dict[str, Any]]], pages: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            parse(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus-dir", type=Path, default=None)
+    parser.add_argument("--synthetic", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = _corpus(args.corpus_dir, args.synthetic, args.seed)
+    mismatches = [name for name, html in corpus if parse_founders_html(html) != parse_founders_html_full(html)]
+    if mismatches:
+        sys.stderr.write(f"Output differs from the full parse for {len(mismatches)} page(s):\n")
+        sys.stderr.write("".join(f"  {name}\n" for name in mismatches))
+        sys.exit(1)
+
+    pages = [html for _, html in corpus]
+    full = _time(parse_founders_html_full, pages, args.repeat)
+    fast = _time(parse_founders_html, pages, args.repeat)
+    report = {
+        "pages": len(pages),
+        "megabytes": round(sum(len(html) for html in pages) / 1e6, 2),
+        "founders": sum(len(parse_founders_html(html)) for html in pages),
+        "fast_path_misses": sum(1 for html in pages if founders_section(html) is None),
+        "parity": True,
+        "full_pages_per_sec": round(len(pages) / full, 1),
+        "fast_pages_per_sec": round(len(pages) / fast, 1),
+        "speedup": round(full / fast, 2),
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
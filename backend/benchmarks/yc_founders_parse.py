@@ -0,0 +1,95 @@
+"""Founders/sec of founders-page parsing, inline vs a process pool per worker count.
+
+Parses a seeded corpus of synthetic company pages through the same
+`parse_inline` / `FoundersParsePool.parse` calls the founders crawl uses, with
+as many concurrent callers as the crawl's parse stage would run.
+
+    python -m benchmarks.yc_founders_parse --pages 2000 --processes 0 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.infrastructure.yc.parse_pool import FoundersParsePool, parse_inline
+from benchmarks.synthetic import synthetic_company_page
+
+
+async def _parse_all(
+    pages: list[str],
+    parse: Callable[[str], Awaitable[list[dict[str, Any]]]],
+    concurrency: int,
+) -> int:
+    source = iter(pages)
+    founders = 0
+
+    async def worker() -> None:
+        nonlocal founders
+        for html in source:
+            parsed = await parse(html)
+            founders += len(parsed)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return founders
+
+
+def _measure(pages: list[str], processes: int, chunk_size: int) -> dict[str, Any]:
+    if processes == 0:
+        start = time.perf_counter()
+        founders = asyncio.run(_parse_all(pages, parse_inline, 1))
+        elapsed = time.perf_counter() - start
+    else:
+        with FoundersParsePool(processes, chunk_size) as pool:
+            # Warm the workers up so process start-up is not part of the measurement.
+            asyncio.run(_parse_all(pages[: pool.concurrency], pool.parse, pool.concurrency))
+            start = time.perf_counter()
+            founders = asyncio.run(_parse_all(pages, pool.parse, pool.concurrency))
+            elapsed = time.perf_counter() - start
+    return {
+        "processes": processes,
+        "chunk_size": chunk_size if processes else None,
+        "pages": len(pages),
+        "founders": founders,
+        "seconds": round(elapsed, 3),
+        "pages_per_sec": round(len(pages) / elapsed, 1),
+        "founders_per_sec": round(founders / elapsed, 1),
+    }
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--page-kb", type=int, default=120)
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=sorted({0, 1, 2, 4, cpus} | {n for n in (8, 16) if n <= cpus}),
+        help="worker counts to measure; 0 parses inline on the event loop",
+    )
+    parser.add_argument("--chunk-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pages = [
+        synthetic_company_page(rng, f"company-{i}", founders=rng.randint(1, 4), filler_kb=args.page_kb)
+        for i in range(args.pages)
+    ]
+    results = {
+        "cpu_count": cpus,
+        "runs": [_measure(pages, processes, args.chunk_size) for processes in args.processes],
+    }
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Latency of fuzzy company search with and without the trigram indexes.
+
+Runs against the configured Postgres (which needs the pg_trgm extension),
+inside a scratch `bench_yc_search` schema that is dropped afterwards. For each
+size, N synthetic companies with generated names are loaded. Then a set of
+queries, each one of those names with a single typo, is run three ways:
+
+- like_scan:     the substring LIKE over name, one_liner and long_description
+                 that `q` used before full-text search (a sequential scan)
+- fuzzy_scan:    `/yc/companies?fuzzy=true` before the trigram indexes exist
+- fuzzy_indexed: the same, with ix_yccompany_name_trgm / ix_yccompany_slug_trgm
+
+Each reports p50/p95/max latency, the share of queries whose company is on
+the first page of results, and the indexes the query plan uses.
+
+    python -m benchmarks.yc_search --sizes 10000 100000 --queries 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.config import settings
+from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_change import YCCompanyChange
+from app.infrastructure.persistence.postgres.repositories.yc_directory_repository import (
+    YCDirectoryRepository,
+    _apply_filters,
+)
+from app.infrastructure.yc.metrics import SyncRunMetrics
+from app.infrastructure.yc.sync import BATCH_SIZE, _upsert_companies
+from app.use_cases.ports.yc_directory_repository import YCSearchFilters
+from benchmarks.synthetic import synthetic_company
+
+SCHEMA = "bench_yc_search"
+PAGE_SIZE = 10
+TABLES = [YCCompany.__table__, YCCompanyChange.__table__]
+TRIGRAM_INDEXES = [
+    "CREATE INDEX ix_yccompany_name_trgm ON yccompany USING gin (name gin_trgm_ops)",
+    "CREATE INDEX ix_yccompany_slug_trgm ON yccompany USING gin (slug gin_trgm_ops)",
+]
+# What `q` ran before full-text search.
+LIKE_SCAN = text(
+    """
+    SELECT name, count(*) OVER () FROM yccompany
+    WHERE removed_at IS NULL
+      AND (lower(name) LIKE :pattern OR lower(one_liner) LIKE :pattern OR lower(long_description) LIKE :pattern)
+    ORDER BY batch_code DESC, name
+    LIMIT :limit
+    """
+)
+_SYLLABLES = "ba bel cor da fen gri hal jo ka lum mer nov or pel qua ri sol tav ul ven wix yo zen".split()
+_SUFFIXES = ["", "", " Labs", " AI", " Health", " Robotics", " Pay", " Cloud"]
+
+
+def _name(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize() + rng.choice(_SUFFIXES)
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    i = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(["substitute", "delete", "transpose"])
+    if edit == "substitute":
+        return word[:i] + rng.choice("aeiourstn") + word[i + 1 :]
+    if edit == "delete":
+        return word[:i] + word[i + 1 :]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+
+
+async def _feed(companies: int, seed: int) -> AsyncIterator[list[dict[str, Any]]]:
+    rng = random.Random(seed)
+    batch: list[dict[str, Any]] = []
+    for i in range(companies):
+        raw = synthetic_company(rng, i + 1)
+        raw["name"] = _name(rng)
+        raw["slug"] = f"{raw['name'].lower().replace(' ', '-')}-{i + 1}"
+        batch.append(raw)
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _reset_schema(engine: Any) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(
+            lambda c: YCCompany.metadata.create_all(c, tables=TABLES)  # type: ignore[arg-type]
+        )
+
+
+async def _like_scan(session: AsyncSession, q: str, _threshold: float) -> list[str]:
+    result = await session.execute(LIKE_SCAN, {"pattern": f"%{q.lower()}%", "limit": PAGE_SIZE})
+    return [row[0] for row in result.all()]
+
+
+async def _fuzzy(session: AsyncSession, q: str, threshold: float) -> list[str]:
+    filters = YCSearchFilters(q=q, fuzzy_threshold=threshold)
+    items = await YCDirectoryRepository(session).list_companies(filters, 0, PAGE_SIZE)
+    return [item.name for item in items]
+
+
+async def _plan_indexes(session: AsyncSession, statement: Any, params: dict[str, Any]) -> list[str]:
+    plan = (await session.execute(text(f"EXPLAIN (FORMAT JSON) {statement}"), params)).scalar_one()
+    names: set[str] = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            names.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return sorted(names)
+
+
+async def _scenario(
+    session: AsyncSession,
+    name: str,
+    search: Callable[[AsyncSession, str, float], Awaitable[list[str]]],
+    queries: list[tuple[str, str]],
+    threshold: float,
+) -> dict[str, Any]:
+    timings = []
+    found = 0
+    for q, expected in queries:
+        start = time.perf_counter()
+        names = await search(session, q, threshold)
+        timings.append(time.perf_counter() - start)
+        found += expected in names
+    q = queries[0][0]
+    if name == "like_scan":
+        indexes = await _plan_indexes(session, LIKE_SCAN.text, {"pattern": f"%{q.lower()}%", "limit": PAGE_SIZE})
+    else:
+        await session.execute(text("SELECT set_config('pg_trgm.similarity_threshold', :t, true)"), {"t": str(threshold)})
+        stmt = _apply_filters(select(YCCompany.id), YCSearchFilters(q=q, fuzzy_threshold=threshold))
+        compiled = stmt.compile(dialect=postgresql.psycopg.dialect(), compile_kwargs={"literal_binds": True})
+        indexes = await _plan_indexes(session, str(compiled).replace("%%", "%"), {})
+    timings.sort()
+    return {
+        "scenario": name,
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+        "max_ms": round(timings[-1] * 1000, 2),
+        "found_share": round(found / len(queries), 3),
+        "plan_indexes": indexes,
+    }
+
+
+async def _run(session_factory: Any, companies: int, args: argparse.Namespace) -> list[dict[str, Any]]:
+    async with session_factory() as session:
+        await _upsert_companies(session, _feed(companies, args.seed), SyncRunMetrics())
+        await session.execute(text("ANALYZE yccompany"))
+        names = list((await session.execute(select(YCCompany.name))).scalars().all())
+        rng = random.Random(args.seed)
+        queries = []
+        for name in rng.sample(names, min(args.queries, len(names))):
+            # Only the name's first word is mistyped, so every query is one edit away.
+            first, _, rest = name.partition(" ")
+            queries.append((" ".join(filter(None, [_typo(rng, first), rest])), name))
+
+        scenarios = [
+            await _scenario(session, "like_scan", _like_scan, queries, args.threshold),
+            await _scenario(session, "fuzzy_scan", _fuzzy, queries, args.threshold),
+        ]
+        await session.commit()
+        for ddl in TRIGRAM_INDEXES:
+            await session.execute(text(ddl))
+        await session.execute(text("ANALYZE yccompany"))
+        await session.commit()
+        scenarios.append(await _scenario(session, "fuzzy_indexed", _fuzzy, queries, args.threshold))
+        await session.commit()
+    return [{"companies": companies, "queries": len(queries), **scenario} for scenario in scenarios]
+
+
+async def main_async(args: argparse.Namespace) -> list[dict[str, Any]]:
+    engine = create_async_engine(
+        str(settings.SQLALCHEMY_DATABASE_URI),
+        # pg_trgm's functions and operators live where the extension was created.
+        connect_args={"options": f"-c search_path={SCHEMA},public"},
+    )
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    results: list[dict[str, Any]] = []
+    try:
+        for companies in args.sizes:
+            await _reset_schema(engine)
+            results += await _run(session_factory, companies, args)
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=settings.YC_SEARCH_FUZZY_THRESHOLD)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    results = asyncio.run(main_async(args))
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
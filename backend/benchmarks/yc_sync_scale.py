@@ -0,0 +1,236 @@
+"""End-to-end `sync_yc_directory` at synthetic directory sizes.
+
+For each size, a seeded feed of N companies is written and served, together
+with a synthetic page per company, by `benchmarks.stub_source` in its own
+process. The sync then runs twice in a fresh subprocess (so ru_maxrss is per
+size), against a scratch `bench_yc` schema that is dropped afterwards:
+
+- initial: empty tables, every feed entry and page is new
+- resync:  the same feed and pages again (304s, unchanged rows)
+
+Each run reports wall time, peak RSS and its growth over the pre-sync
+baseline, DB rows written per second (from the run's `YCSyncRun` row, which
+also supplies the per-phase seconds and page counts), and event-loop lag:
+how late a 50 ms sleep on the sync's loop wakes up, as p50/p99/max.
+
+The sync reads its usual settings (loader, streaming, concurrency, ...) from
+the environment; the ones that shape performance are copied into the report.
+
+    python -m benchmarks.yc_sync_scale --sizes 5000 50000 --output yc_sync_scale.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.config import settings
+from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_change import YCCompanyChange
+from app.domain.entities.db.yc_company_founder import YCCompanyFounder
+from app.domain.entities.db.yc_founder import YCFounder
+from app.domain.entities.db.yc_sync_run import YCSyncRun
+from app.domain.entities.db.yc_sync_state import YCSyncState
+from benchmarks.stub_source import stub_source
+from benchmarks.synthetic import write_feed
+
+SCHEMA = "bench_yc"
+LAG_INTERVAL = 0.05
+REPORTED_SETTINGS = (
+    "YC_SYNC_LOADER",
+    "YC_SYNC_STREAMING",
+    "YC_FOUNDERS_FETCH_CONCURRENCY",
+    "YC_FOUNDERS_FETCH_INITIAL_CONCURRENCY",
+    "YC_FOUNDERS_PARSE_CONCURRENCY",
+    "YC_FOUNDERS_PARSE_PROCESSES",
+    "YC_FOUNDERS_WRITE_BATCH_SIZE",
+)
+TABLES = [
+    YCCompany.__table__,
+    YCFounder.__table__,
+    YCCompanyFounder.__table__,
+    YCCompanyChange.__table__,
+    YCSyncState.__table__,
+    YCSyncRun.__table__,
+]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _LoopLag:
+    """Samples how late the event loop wakes a task from a fixed sleep."""
+
+    def __init__(self, interval: float = LAG_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+
+    async def run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(time.perf_counter() - start - self.interval)
+
+    def summary(self) -> dict[str, float | None]:
+        if not self.samples:
+            return {"p50_ms": None, "p99_ms": None, "max_ms": None}
+        ordered = sorted(self.samples)
+        return {
+            "p50_ms": round(statistics.median(ordered) * 1000, 2),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+async def _reset_schema(engine: Any) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(lambda c: YCCompany.metadata.create_all(c, tables=TABLES))  # type: ignore[arg-type]
+
+
+async def _sync_runs(feed_url: str, companies: int, cache_dir: str) -> list[dict[str, Any]]:
+    # Imported here so the RSS baseline includes the sync's own imports.
+    import app.infrastructure.yc.sync as sync
+    from app.infrastructure.yc.http_cache import HTTPConditionalCache
+
+    sync.YC_ALL_URL = feed_url
+    engine = create_async_engine(
+        str(settings.SQLALCHEMY_DATABASE_URI),
+        connect_args={"options": f"-c search_path={SCHEMA}"},
+    )
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    results = []
+    try:
+        await _reset_schema(engine)
+        baseline = _peak_rss_mb()
+        for scenario in ("initial", "resync"):
+            lag = _LoopLag()
+            lag_task = asyncio.create_task(lag.run())
+            start = time.perf_counter()
+            async with session_factory() as session:
+                await sync.sync_yc_directory(session, cache=HTTPConditionalCache(cache_dir))
+            elapsed = time.perf_counter() - start
+            lag_task.cancel()
+
+            async with session_factory() as session:
+                run = (await session.execute(select(YCSyncRun).order_by(YCSyncRun.started_at.desc()).limit(1))).scalar_one()
+            rows = run.company_rows_written + run.founder_rows_written
+            results.append(
+                {
+                    "companies": companies,
+                    "scenario": scenario,
+                    "status": run.status,
+                    "wall_seconds": round(elapsed, 3),
+                    "peak_rss_mb": round(_peak_rss_mb(), 1),
+                    "rss_growth_mb": round(_peak_rss_mb() - baseline, 1),
+                    "rows_written": rows,
+                    "rows_per_sec": round(rows / elapsed, 1),
+                    "companies_per_sec": round(companies / elapsed, 1),
+                    "pages_fetched": run.pages_fetched,
+                    "pages_not_modified": run.pages_not_modified,
+                    "pages_failed": run.pages_failed,
+                    "megabytes_downloaded": round(run.bytes_downloaded / 1e6, 1),
+                    "phase_seconds": {
+                        "download": round(run.download_seconds, 3),
+                        "parse": round(run.parse_seconds, 3),
+                        "company_upsert": round(run.company_upsert_seconds, 3),
+                        "founder_crawl": round(run.founder_crawl_seconds, 3),
+                    },
+                    "loop_lag": lag.summary(),
+                }
+            )
+    finally:
+        await engine.dispose()
+    return results
+
+
+async def _drop_schema() -> None:
+    engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    finally:
+        await engine.dispose()
+
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--page-kb", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the stub adds to every response")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="also write the report to this file")
+    parser.add_argument("--companies", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--feed-url", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.feed_url:
+        results = asyncio.run(_sync_runs(args.feed_url, args.companies, args.cache_dir))
+        sys.stdout.write(json.dumps(results) + "\n")
+        return
+
+    runs: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_dir = Path(tmp) / "feeds"
+        feed_dir.mkdir()
+        try:
+            with stub_source(feed_dir, page_kb=args.page_kb, seed=args.seed, latency=args.latency) as base_url:
+                for companies in args.sizes:
+                    write_feed(feed_dir / f"all-{companies}.json", companies, seed=args.seed, site=base_url)
+                    out = subprocess.run(
+                        [
+                            sys.executable, "-m", "benchmarks.yc_sync_scale",
+                            "--companies", str(companies),
+                            "--feed-url", f"{base_url}/feeds/all-{companies}.json",
+                            "--cache-dir", str(Path(tmp) / f"http-cache-{companies}"),
+                        ],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                    )
+                    runs += json.loads(out.stdout.strip().splitlines()[-1])
+        finally:
+            asyncio.run(_drop_schema())
+
+    report = {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "page_kb": args.page_kb,
+        "stub_latency_seconds": args.latency,
+        "settings": {name: getattr(settings, name) for name in REPORTED_SETTINGS},
+        "runs": runs,
+    }
+    rendered = json.dumps(report, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(rendered, encoding="utf-8")
+    sys.stdout.write(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.core.config.config import settings
+from app.domain.entities.db.user import User
+from app.domain.entities.db.yc_company import YCCompany
+from app.domain.entities.db.yc_company_change import YCCompanyChange
+from app.domain.entities.db.yc_company_founder import YCCompanyFounder
+from app.domain.entities.db.yc_founder import YCFounder
+from app.domain.entities.db.yc_sync_state import YCSyncState
+from app.transport.http.rate_limit import limiter
+from tests.conftest import fake_yc_count_cache
+
+
+def _company(yc_id: int, name: str) -> YCCompany:
+    return YCCompany(
+        yc_id=yc_id,
+        name=name,
+        slug=name.lower(),
+        batch="Winter 2024",
+        batch_code="W2024",
+        year=2024,
+        status="Active",
+        url=f"https://www.ycombinator.com/companies/{name.lower()}",
+    )
+
+
+def test_company_changes_serve_the_latest_change_per_company(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    url = f"{settings.API_V1_STR}/yc/companies/changes"
+    r = client.get(url, headers=normal_user_token_headers)
+    assert r.status_code == 403
+
+    superuser = db.exec(select(User).where(User.email == settings.FIRST_SUPERUSER)).one()
+    plan = superuser.plan
+    superuser.plan = "pro"
+    db.add(superuser)
+    db.commit()
+    kept = _company(990001, "Changefeedkept")
+    gone = _company(990002, "Changefeedgone")
+    # The route allows 2 requests per second.
+    limiter.enabled = False
+    try:
+        since = client.get(url, headers=superuser_token_headers).json()["version"]
+
+        now = datetime.utcnow()
+        gone.removed_at = now
+        db.add_all([kept, gone])
+        db.commit()
+        for company, kind in ((kept, "added"), (gone, "added"), (kept, "updated"), (gone, "removed")):
+            db.add(YCCompanyChange(yc_id=company.yc_id, company_id=company.id, kind=kind, changed_at=now))
+            db.commit()
+
+        first = client.get(url, params={"since": since, "limit": 1}, headers=superuser_token_headers).json()
+        assert first["has_more"] is True
+        [change] = first["data"]
+        assert (change["yc_id"], change["kind"]) == (kept.yc_id, "updated")
+        assert change["company"]["name"] == "Changefeedkept"
+
+        second = client.get(
+            url, params={"since": first["version"]}, headers=superuser_token_headers
+        ).json()
+        assert second["has_more"] is False
+        assert [(c["yc_id"], c["kind"], c["company"]) for c in second["data"]] == [(gone.yc_id, "removed", None)]
+        assert second["version"] == second["data"][0]["version"]
+
+        listed = client.get(
+            f"{settings.API_V1_STR}/yc/companies", params={"q": "changefeed"}, headers=superuser_token_headers
+        ).json()
+        assert [c["name"] for c in listed["data"]] == ["Changefeedkept"]
+
+        state = db.exec(select(YCSyncState).where(YCSyncState.source == "yc_directory")).first()
+        if state is None:
+            state = YCSyncState(source="yc_directory")
+        floor = state.change_log_floor
+        state.change_log_floor = second["version"]
+        db.add(state)
+        db.commit()
+        try:
+            r = client.get(url, params={"since": since}, headers=superuser_token_headers)
+            assert r.status_code == 410
+        finally:
+            state.change_log_floor = floor
+            db.add(state)
+            db.commit()
+    finally:
+        limiter.enabled = True
+        db.execute(text("DELETE FROM yccompanychange WHERE yc_id IN (990001, 990002)"))
+        db.execute(text("DELETE FROM yccompany WHERE yc_id IN (990001, 990002)"))
+        superuser.plan = plan
+        db.add(superuser)
+        db.commit()
+
+
+def test_company_search_ranks_name_matches_first(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    described = _company(990021, "Quietco")
+    described.long_description = "Payroll for rocketry suppliers."
+    tagline = _company(990022, "Anotherco")
+    tagline.one_liner = "Rocketry telemetry"
+    named = _company(990023, "Zrocketry Labs")
+    db.add_all([described, tagline, named])
+    db.commit()
+    url = f"{settings.API_V1_STR}/yc/companies"
+    limiter.enabled = False
+    try:
+        body = client.get(url, params={"q": "rocketry"}, headers=superuser_token_headers).json()
+        assert [c["name"] for c in body["data"]] == ["Anotherco", "Quietco"]
+
+        # Every word must match, as a prefix of a word in the company's text.
+        body = client.get(url, params={"q": "Zrocket"}, headers=superuser_token_headers).json()
+        assert [c["name"] for c in body["data"]] == ["Zrocketry Labs"]
+        body = client.get(url, params={"q": "rocketry pay"}, headers=superuser_token_headers).json()
+        assert [c["name"] for c in body["data"]] == ["Quietco"]
+
+        named.name = "Rocketry Labs"
+        db.add(named)
+        db.commit()
+        # Counts are cached until a sync changes the directory, which this edit does not.
+        fake_yc_count_cache.counts.clear()
+        body = client.get(url, params={"q": "rocketry"}, headers=superuser_token_headers).json()
+        assert [c["name"] for c in body["data"]] == ["Rocketry Labs", "Anotherco", "Quietco"]
+        assert body["count"] == 3
+    finally:
+        limiter.enabled = True
+        db.execute(text("DELETE FROM yccompany WHERE yc_id IN (990021, 990022, 990023)"))
+        db.commit()
+
+
+def test_fuzzy_company_search_tolerates_typos(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    if db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first() is None:
+        pytest.skip("pg_trgm is not installed in the test database")
+    db.add_all(
+        [
+            _company(990031, "Zephyrine"),
+            _company(990032, "Zephyrin"),
+            # Similarity 0.29, under the default threshold
+            _company(990033, "Zephyrine Robotics"),
+        ]
+    )
+    db.commit()
+    url = f"{settings.API_V1_STR}/yc/companies"
+    limiter.enabled = False
+    try:
+        body = client.get(url, params={"q": "zephyrn"}, headers=superuser_token_headers).json()
+        assert body["data"] == []
+
+        body = client.get(url, params={"q": "zephyrn", "fuzzy": True}, headers=superuser_token_headers).json()
+        assert [c["name"] for c in body["data"]] == ["Zephyrin", "Zephyrine"]
+    finally:
+        limiter.enabled = True
+        db.execute(text("DELETE FROM yccompany WHERE yc_id IN (990031, 990032, 990033)"))
+        db.commit()
+
+
+def test_company_cursor_pages_walk_the_list_once(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    superuser = db.exec(select(User).where(User.email == settings.FIRST_SUPERUSER)).one()
+    plan = superuser.plan
+    superuser.plan = "pro"
+    db.add(superuser)
+    companies = []
+    for i, (name, batch_code) in enumerate(
+        [("Keyseta", "W2099"), ("Keysetb", "W2099"), ("Keysetb", "W2099"), ("Keysetc", "S2099"), ("Keysetd", "W2098")]
+    ):
+        company = _company(990041 + i, name)
+        company.batch, company.batch_code = "Keyset batch", batch_code
+        company.one_liner = "keyset" if name == "Keysetd" else None
+        companies.append(company)
+    db.add_all(companies)
+    db.commit()
+    url = f"{settings.API_V1_STR}/yc/companies"
+    limiter.enabled = False
+    try:
+        def walk(params: dict[str, object]) -> list[str]:
+            seen, cursor = [], ""
+            while cursor is not None:
+                r = client.get(url, params={**params, "cursor": cursor, "limit": 2}, headers=superuser_token_headers)
+                assert r.status_code == 200
+                body = r.json()
+                assert body["count"] is None
+                seen += [c["yc_id"] for c in body["data"]]
+                cursor = body["next_cursor"]
+            return seen
+
+        listed = client.get(url, params={"batch": "Keyset batch"}, headers=superuser_token_headers).json()
+        assert listed["count"] == 5
+        assert walk({"batch": "Keyset batch"}) == [c["yc_id"] for c in listed["data"]]
+        ranked = client.get(url, params={"q": "keyset"}, headers=superuser_token_headers).json()
+        assert ranked["data"][0]["name"] == "Keysetd"
+        assert walk({"q": "keyset"}) == [c["yc_id"] for c in ranked["data"]]
+
+        body = client.get(
+            url, params={"batch": "Keyset batch", "cursor": "", "include_count": True}, headers=superuser_token_headers
+        ).json()
+        assert body["count"] == 5
+        r = client.get(url, params={"cursor": "bm90LWEtY3Vyc29y"}, headers=superuser_token_headers)
+        assert r.status_code == 400
+        # A cursor from a search does not fit the unranked list.
+        cursor = client.get(url, params={"q": "keyset", "cursor": "", "limit": 1}, headers=superuser_token_headers)
+        r = client.get(url, params={"cursor": cursor.json()["next_cursor"]}, headers=superuser_token_headers)
+        assert r.status_code == 400
+    finally:
+        limiter.enabled = True
+        db.execute(text("DELETE FROM yccompany WHERE yc_id BETWEEN 990041 AND 990045"))
+        superuser.plan = plan
+        db.add(superuser)
+        db.commit()
+
+
+def test_company_counts_are_cached_per_directory_version(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = _company(990051, "Countcachea")
+    first.batch = "Count batch"
+    db.add(first)
+    db.commit()
+    url = f"{settings.API_V1_STR}/yc/companies"
+    params = {"batch": "Count batch"}
+    limiter.enabled = False
+    try:
+        body = client.get(url, params=params, headers=superuser_token_headers).json()
+        assert (body["count"], body["count_estimated"]) == (1, False)
+
+        second = _company(990052, "Countcacheb")
+        second.batch = "Count batch"
+        db.add(second)
+        db.commit()
+        body = client.get(url, params=params, headers=superuser_token_headers).json()
+        assert len(body["data"]) == 2
+        assert body["count"] == 1
+
+        # Any logged change is a new directory version.
+        db.add(YCCompanyChange(yc_id=second.yc_id, company_id=second.id, kind="added", changed_at=datetime.utcnow()))
+        db.commit()
+        body = client.get(url, params=params, headers=superuser_token_headers).json()
+        assert body["count"] == 2
+
+        # Searches expected to match more than YC_COUNT_EXACT_LIMIT companies get the planner's estimate.
+        monkeypatch.setattr(settings, "YC_COUNT_EXACT_LIMIT", -1)
+        body = client.get(url, params={"q": "countcache"}, headers=superuser_token_headers).json()
+        assert body["count_estimated"] is True
+        assert len(body["data"]) == 2
+    finally:
+        limiter.enabled = True
+        db.execute(text("DELETE FROM yccompanychange WHERE yc_id IN (990051, 990052)"))
+        db.execute(text("DELETE FROM yccompany WHERE yc_id IN (990051, 990052)"))
+        db.commit()
+
+
+def test_founder_companies_list_every_company_of_a_founder(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    older = _company(990011, "Foundertwoolder")
+    newer = _company(990012, "Foundertwonewer")
+    newer.batch, newer.batch_code, newer.year = "Winter 2025", "W2025", 2025
+    founder = YCFounder(identity_key=uuid.uuid4().hex, name="Serial Founder")
+    db.add_all([older, newer, founder])
+    db.commit()
+    for company in (older, newer):
+        db.add(YCCompanyFounder(company_id=company.id, founder_key=uuid.uuid4().hex, founder_id=founder.id, sort_order=0))
+    db.commit()
+    limiter.enabled = False
+    try:
+        r = client.get(f"{settings.API_V1_STR}/yc/founders/{founder.id}/companies", headers=superuser_token_headers)
+        assert r.status_code == 200
+        body = r.json()
+        assert body["count"] == 2
+        assert [c["name"] for c in body["data"]] == ["Foundertwonewer", "Foundertwoolder"]
+        assert [f["id"] for f in body["data"][0]["founders"]] == [str(founder.id)]
+
+        r = client.get(f"{settings.API_V1_STR}/yc/founders/{uuid.uuid4()}/companies", headers=superuser_token_headers)
+        assert r.status_code == 404
+    finally:
+        limiter.enabled = True
+        db.execute(text("DELETE FROM yccompany WHERE yc_id IN (990011, 990012)"))
+        db.execute(text("DELETE FROM ycfounder WHERE id = :id"), {"id": founder.id})
+        db.commit()
+
+
+def test_facets_count_each_value_under_the_other_filters(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+) -> None:
+    hiring = _company(990061, "Facetcoa")
+    hiring.industry, hiring.is_hiring = "Fintech", True
+    inactive = _company(990062, "Facetcob")
+    inactive.industry, inactive.status = "Fintech", "Inactive"
+    unlisted_industry = _company(990063, "Facetcoc")
+    no_batch = _company(990064, "Facetcod")
+    no_batch.batch, no_batch.batch_code, no_batch.year = "", "", 0
+    db.add_all([hiring, inactive, unlisted_industry, no_batch])
+    db.commit()
+    url = f"{settings.API_V1_STR}/yc/facets"
+    limiter.enabled = False
+    try:
+        r = client.get(url, params={"q": "facetco", "status_filter": "Active"}, headers=superuser_token_headers)
+        assert r.status_code == 200
+        body = r.json()
+        # The status facet ignores status_filter; the others apply it.
+        assert body["statuses"] == [{"value": "Active", "count": 3}, {"value": "Inactive", "count": 1}]
+        assert body["industries"] == [{"value": "Fintech", "count": 1}]
+        # Like /yc/meta, no year 0 or empty batch for companies without a batch.
+        assert body["years"] == [{"value": 2024, "count": 2}]
+        assert body["batches"] == [{"value": "Winter 2024", "count": 2}]
+        assert body["is_hiring"] == [{"value": False, "count": 2}, {"value": True, "count": 1}]
+
+        body = client.get(url, params={"q": "facetco", "is_hiring": True}, headers=superuser_token_headers).json()
+        assert body["statuses"] == [{"value": "Active", "count": 1}, {"value": "Inactive", "count": 0}]
+        assert body["is_hiring"] == [{"value": False, "count": 3}, {"value": True, "count": 1}]
+
+        # Cached until the directory version changes.
+        db.add(YCCompanyChange(yc_id=inactive.yc_id, company_id=inactive.id, kind="updated", changed_at=datetime.utcnow()))
+        inactive.status = "Active"
+        db.add(inactive)
+        db.commit()
+        body = client.get(url, params={"q": "facetco", "status_filter": "Active"}, headers=superuser_token_headers).json()
+        assert body["statuses"] == [{"value": "Active", "count": 4}]
+    finally:
+        limiter.enabled = True
+        fake_yc_count_cache.facets.clear()
+        db.execute(text("DELETE FROM yccompanychange WHERE yc_id IN (990061, 990062, 990063, 990064)"))
+        db.execute(text("DELETE FROM yccompany WHERE yc_id IN (990061, 990062, 990063, 990064)"))
+        db.commit()
@@ -0,0 +1,188 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.core.config.config import settings
+from app.domain.entities.db.yc_sync_run import YCSyncRun
+from app.domain.entities.db.yc_sync_state import YCSyncState
+from app.infrastructure.persistence.postgres.repositories import yc_directory_repository
+from tests.conftest import fake_yc_sync_queue
+
+
+def test_admin_sync_only_enqueues(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    fake_yc_sync_queue.jobs.clear()
+    r = client.post(f"{settings.API_V1_STR}/admin/sync", headers=superuser_token_headers)
+    assert r.status_code == 200
+    assert r.json() == {"message": "YC sync queued"}
+    assert fake_yc_sync_queue.jobs == ["admin"]
+
+    r = client.post(f"{settings.API_V1_STR}/admin/sync", headers=superuser_token_headers)
+    assert r.json() == {"message": "YC sync already queued"}
+    assert fake_yc_sync_queue.jobs == ["admin"]
+    fake_yc_sync_queue.jobs.clear()
+
+
+def test_admin_sync_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    fake_yc_sync_queue.jobs.clear()
+    r = client.post(f"{settings.API_V1_STR}/admin/sync", headers=normal_user_token_headers)
+    assert r.status_code == 403
+    assert fake_yc_sync_queue.jobs == []
+
+
+def _set_checkpoint(db: Session, run_phase: str | None) -> None:
+    state = db.exec(select(YCSyncState).where(YCSyncState.source == "yc_directory")).first()
+    if state is None:
+        state = YCSyncState(source="yc_directory")
+    state.run_id = uuid.uuid4() if run_phase else None
+    state.run_phase = run_phase
+    state.run_cursor = "1:42" if run_phase == "founders" else None
+    state.status = "failed" if run_phase else "succeeded"
+    db.add(state)
+    db.commit()
+    db.refresh(state)
+
+
+def test_admin_resume_queues_a_job_for_an_unfinished_run(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    fake_yc_sync_queue.jobs.clear()
+    _set_checkpoint(db, None)
+    r = client.post(f"{settings.API_V1_STR}/admin/sync/resume", headers=superuser_token_headers)
+    assert r.status_code == 404
+    assert fake_yc_sync_queue.jobs == []
+
+    _set_checkpoint(db, "founders")
+    r = client.post(f"{settings.API_V1_STR}/admin/sync/resume", headers=superuser_token_headers)
+    assert r.json() == {"message": "YC sync resume queued"}
+    assert fake_yc_sync_queue.jobs == ["resume"]
+    fake_yc_sync_queue.jobs.clear()
+
+
+def test_admin_abandon_clears_the_checkpoint_unless_running(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    _set_checkpoint(db, "founders")
+    fake_yc_sync_queue.running = True
+    try:
+        r = client.post(f"{settings.API_V1_STR}/admin/sync/abandon", headers=superuser_token_headers)
+        assert r.status_code == 409
+    finally:
+        fake_yc_sync_queue.running = False
+
+    r = client.post(f"{settings.API_V1_STR}/admin/sync/abandon", headers=superuser_token_headers)
+    assert r.status_code == 200
+    assert r.json()["status"] == "abandoned"
+    assert r.json()["run_phase"] is None
+    assert r.json()["run_cursor"] is None
+
+    r = client.post(f"{settings.API_V1_STR}/admin/sync/abandon", headers=superuser_token_headers)
+    assert r.status_code == 404
+
+    r = client.get(f"{settings.API_V1_STR}/admin/sync-state", headers=superuser_token_headers)
+    assert r.status_code == 200
+    assert r.json()["status"] == "abandoned"
+
+
+def test_admin_sync_runs_lists_recent_attempts(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    now = datetime.utcnow()
+    run = YCSyncRun(
+        status="succeeded",
+        started_at=now - timedelta(minutes=5),
+        finished_at=now,
+        pages_fetched=12,
+        founder_crawl_seconds=3.5,
+        memory_profile={
+            "stages": [{"stage": "parse", "checkpoints": 4, "rss_mb": 310.5, "traced_mb": 120.0, "peak_traced_mb": 180.2}],
+            "top_sites_stage": "parse",
+            "top_sites": [{"site": "app/infrastructure/yc/feed.py:137", "size_kb": 90000.0, "count": 5000}],
+        },
+    )
+    db.add(run)
+    db.commit()
+    try:
+        r = client.get(f"{settings.API_V1_STR}/admin/sync-runs?limit=200", headers=superuser_token_headers)
+        assert r.status_code == 200
+        runs = r.json()["data"]
+        started = [item["started_at"] for item in runs]
+        assert started == sorted(started, reverse=True)
+        [listed] = [item for item in runs if item["id"] == str(run.id)]
+        assert listed["pages_fetched"] == 12
+        assert listed["founder_crawl_seconds"] == 3.5
+        assert listed["memory_profile"]["stages"][0]["peak_traced_mb"] == 180.2
+        assert listed["memory_profile"]["top_sites"][0]["site"] == "app/infrastructure/yc/feed.py:137"
+    finally:
+        db.delete(run)
+        db.commit()
+
+
+def _change_log_floor(db: Session) -> int:
+    floor = db.scalar(text("SELECT change_log_floor FROM ycsyncstate WHERE source = 'yc_directory'"))
+    db.commit()
+    return int(floor)
+
+
+def test_admin_rollback_swaps_the_previous_directory_snapshot_back(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = f"{settings.API_V1_STR}/admin/sync/rollback"
+    _set_checkpoint(db, None)
+    db.execute(text("DROP SCHEMA IF EXISTS yc_previous CASCADE"))
+    db.commit()
+    floor = _change_log_floor(db)
+    r = client.post(url, headers=superuser_token_headers)
+    assert r.status_code == 404
+    assert _change_log_floor(db) == floor
+
+    db.execute(text("CREATE SCHEMA yc_previous"))
+    for table in ("yccompany", "ycfounder", "yccompanyfounder", "yccompanychange"):
+        db.execute(text(f"CREATE TABLE yc_previous.{table} (LIKE public.{table} INCLUDING ALL)"))
+    companies = db.scalar(text("SELECT count(*) FROM yccompany"))
+    db.commit()
+
+    fake_yc_sync_queue.running = True
+    try:
+        r = client.post(url, headers=superuser_token_headers)
+        assert r.status_code == 409
+    finally:
+        fake_yc_sync_queue.running = False
+    assert _change_log_floor(db) == floor
+
+    async def fail_reset(_session: Any) -> None:
+        raise RuntimeError("floor not raised")
+
+    # A swap whose floor cannot be raised is not kept.
+    monkeypatch.setattr(yc_directory_repository, "reset_change_log", fail_reset)
+    with pytest.raises(RuntimeError):
+        client.post(url, headers=superuser_token_headers)
+    monkeypatch.undo()
+    assert db.scalar(text("SELECT count(*) FROM yccompany")) == companies
+    assert _change_log_floor(db) == floor
+
+    try:
+        r = client.post(url, headers=superuser_token_headers)
+        assert r.status_code == 200
+        # The swap and the raised change log floor land in the same commit.
+        assert db.scalar(text("SELECT count(*) FROM yccompany")) == 0
+        assert _change_log_floor(db) > floor
+        db.commit()
+    finally:
+        # Rolling back again restores the original tables.
+        r = client.post(url, headers=superuser_token_headers)
+        assert r.status_code == 200
+    assert db.scalar(text("SELECT count(*) FROM yccompany")) == companies
+    db.execute(text("DROP SCHEMA yc_previous CASCADE"))
+    db.commit()
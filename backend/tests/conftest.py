@@ -8,24 +8,40 @@ from app.core.config.config import settings
 from app.core.config.db import engine, init_db
 from app.main import app
 from app.domain.entities.db.user import User
-from app.transport.http.deps import get_redis_repo
+from app.transport.http.deps import get_redis_repo, get_yc_count_cache, get_yc_sync_queue
 from tests.utils.fake_refresh_store import FakeRefreshStore
+from tests.utils.fake_yc_count_cache import FakeYCCountCache
+from tests.utils.fake_yc_sync_queue import FakeYCSyncQueue
 from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
 
 _fake_refresh_store = FakeRefreshStore()
+fake_yc_sync_queue = FakeYCSyncQueue()
+fake_yc_count_cache = FakeYCCountCache()
 
 
 def _get_fake_redis_repo():
     return _fake_refresh_store
 
 
+def _get_fake_yc_sync_queue():
+    return fake_yc_sync_queue
+
+
+def _get_fake_yc_count_cache():
+    return fake_yc_count_cache
+
+
 @pytest.fixture(scope="session", autouse=True)
 def override_redis() -> Generator[None, None, None]:
     """Replace Redis with in-memory fake to avoid event loop conflicts with TestClient."""
     app.dependency_overrides[get_redis_repo] = _get_fake_redis_repo
+    app.dependency_overrides[get_yc_sync_queue] = _get_fake_yc_sync_queue
+    app.dependency_overrides[get_yc_count_cache] = _get_fake_yc_count_cache
     yield
     app.dependency_overrides.pop(get_redis_repo, None)
+    app.dependency_overrides.pop(get_yc_sync_queue, None)
+    app.dependency_overrides.pop(get_yc_count_cache, None)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -0,0 +1,117 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.infrastructure.yc.crawl_policy import (
+    AIMDConfig,
+    AIMDLimiter,
+    CrawlPolicy,
+    ErrorBudgetExhausted,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+URL = "https://www.ycombinator.com/companies/nango"
+
+
+def _get(policy: CrawlPolicy, handler) -> httpx.Response:
+    async def run() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await policy.get(client, URL)
+
+    return asyncio.run(run())
+
+
+def test_parse_retry_after() -> None:
+    now = datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Tue, 17 Feb 2026 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("Tue, 17 Feb 2026 11:00:00 GMT", now=now) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_throttled_request_is_retried_after_retry_after_and_limit_backs_off() -> None:
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, text="ok")])
+    policy = CrawlPolicy(limiter=AIMDConfig(initial=8, maximum=8), retry=RetryPolicy(base_delay=0))
+
+    resp = _get(policy, lambda _request: next(responses))
+
+    assert resp.status_code == 200
+    assert policy.retries == 1
+    assert policy.errors == 1
+    assert policy.limiter(URL).limit < 8
+
+
+def test_gives_up_after_max_attempts_and_returns_last_response() -> None:
+    calls = 0
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    policy = CrawlPolicy(retry=RetryPolicy(max_attempts=3, base_delay=0))
+    assert _get(policy, handler).status_code == 503
+    assert calls == 3
+
+
+def test_retry_after_beyond_max_delay_is_not_waited_for() -> None:
+    calls = 0
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    policy = CrawlPolicy(retry=RetryPolicy(max_delay=60))
+    assert _get(policy, handler).status_code == 429
+    assert calls == 1
+
+
+def test_non_retryable_status_is_returned_immediately() -> None:
+    policy = CrawlPolicy()
+    assert _get(policy, lambda _request: httpx.Response(404)).status_code == 404
+    assert policy.errors == 0
+
+
+def test_transport_errors_spend_the_error_budget() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    policy = CrawlPolicy(retry=RetryPolicy(max_attempts=10, base_delay=0), error_budget=3)
+    with pytest.raises(ErrorBudgetExhausted):
+        _get(policy, handler)
+    assert policy.errors == 4
+
+
+def test_limiter_grows_on_fast_successes_and_bounds_in_flight_requests() -> None:
+    limiter = AIMDLimiter(AIMDConfig(initial=2, maximum=6, target_latency=1.0))
+    in_flight = peak = 0
+
+    async def request() -> None:
+        nonlocal in_flight, peak
+        async with limiter.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            limiter.on_success(0.01)
+
+    async def run() -> None:
+        await asyncio.gather(*(request() for _ in range(200)))
+
+    asyncio.run(run())
+    assert limiter.limit == 6
+    assert limiter.increases == 4
+    assert 2 < peak <= 6
+
+
+def test_limiter_halves_on_slow_responses_once_per_cooldown() -> None:
+    limiter = AIMDLimiter(AIMDConfig(initial=8, maximum=8, target_latency=1.0, smoothing=1.0))
+    limiter.on_success(5.0)
+    limiter.on_success(5.0)
+    assert int(limiter.limit) == 4
+    assert limiter.decreases == 1
@@ -0,0 +1,118 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.infrastructure.yc.feed import (
+    BatchFeed,
+    JSONArrayStream,
+    batch_feed_entries,
+    fetch_batch_feeds,
+    iter_batches,
+    iter_json_array,
+)
+from app.infrastructure.yc.http_cache import HTTPConditionalCache
+from app.infrastructure.yc.sync import batch_feed_url
+from tests.utils.stub_http_server import StubRoute, stub_http_server
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _decode(data: bytes, size: int) -> list[object]:
+    stream = JSONArrayStream()
+    out: list[object] = []
+    for chunk in _chunks(data, size):
+        out.extend(stream.feed(chunk))
+    out.extend(stream.close())
+    return out
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 10_000])
+def test_json_array_stream_matches_json_loads(chunk_size: int) -> None:
+    items = [
+        {"id": i, "name": f"Café {i} ✓", "tags": ["a", "b"], "nested": {"x": [1, 2.5, None]}}
+        for i in range(50)
+    ] + [12345, "tail, with ] bracket", True]
+    data = json.dumps(items, indent=2, ensure_ascii=False).encode("utf-8")
+
+    assert _decode(data, chunk_size) == items
+
+
+def test_json_array_stream_handles_empty_array() -> None:
+    assert _decode(b" [ ] ", 1) == []
+
+
+@pytest.mark.parametrize("data", [b'[{"id": 1},', b'{"id": 1}', b"[1 2]", b"[1,]", b"[1] 2"])
+def test_json_array_stream_rejects_malformed_input(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        _decode(data, 2)
+
+
+def test_iter_batches_yields_fixed_size_batches() -> None:
+    data = json.dumps([{"id": i} for i in range(7)]).encode()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in _chunks(data, 5):
+            yield chunk
+
+    async def collect() -> list[list[object]]:
+        return [batch async for batch in iter_batches(iter_json_array(chunks()), 3)]
+
+    batches = asyncio.run(collect())
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert batches[-1] == [{"id": 6}]
+
+
+def test_batch_feed_url_slugs_the_batch_name() -> None:
+    assert batch_feed_url("Winter 2024").endswith("/batches/winter-2024.json")
+    assert batch_feed_url("Fall  2025").endswith("/batches/fall-2025.json")
+
+
+def test_fetch_batch_feeds_only_returns_bodies_of_changed_batches(tmp_path: Path) -> None:
+    cache = HTTPConditionalCache(tmp_path)
+    routes = {
+        "/w24.json": StubRoute(body=b'[{"id": 1}]', etag='"w24"'),
+        "/s24.json": StubRoute(body=b'[{"id": 2}, {"id": 3}]', etag='"s24"'),
+    }
+
+    async def fetch(urls: dict[str, str]) -> dict[str, BatchFeed]:
+        async with httpx.AsyncClient() as client:
+            feeds = await fetch_batch_feeds(client, cache, urls, concurrency=2)
+        for feed in feeds:
+            if feed.response is not None:
+                await cache.store(feed.url, feed.response, feed.digest)
+        return {feed.batch: feed for feed in feeds}
+
+    with stub_http_server(routes) as server:
+        urls = {"W24": server.url("/w24.json"), "S24": server.url("/s24.json")}
+        first = asyncio.run(fetch(urls))
+        # Redeployed with a new validator but the same content, and a real change.
+        routes["/w24.json"] = StubRoute(body=b'[{"id": 1}]', etag='"w24-redeploy"')
+        routes["/s24.json"] = StubRoute(body=b'[{"id": 2}]', etag='"s24-2"')
+        second = asyncio.run(fetch(urls))
+        third = asyncio.run(fetch(urls))
+
+    assert all(feed.body is not None for feed in first.values())
+    assert second["W24"].body is None and second["W24"].response is not None
+    assert second["S24"].body == b'[{"id": 2}]'
+    assert all(feed.body is None and feed.response is None for feed in third.values())
+
+    async def entries() -> list[list[dict[str, object]]]:
+        return [batch async for batch in batch_feed_entries(first.values(), 1)]
+
+    assert sorted(e[0]["id"] for e in asyncio.run(entries())) == [1, 2, 3]
+
+
+def test_fetch_batch_feeds_raises_for_a_missing_batch(tmp_path: Path) -> None:
+    async def fetch(url: str) -> None:
+        async with httpx.AsyncClient() as client:
+            await fetch_batch_feeds(client, HTTPConditionalCache(tmp_path), {"X99": url}, concurrency=1)
+
+    with stub_http_server({}) as server, pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch(server.url("/x99.json")))
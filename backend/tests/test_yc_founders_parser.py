@@ -1,4 +1,9 @@
-from app.infrastructure.yc.sync import FoundersHTMLParser
+from app.infrastructure.yc.founders_parser import (
+    FoundersHTMLParser,
+    founders_section,
+    parse_founders_html,
+    parse_founders_html_full,
+)
 from tests.utils.yc_founders_html import NANGO_FOUNDERS_HTML
 
 
@@ -20,3 +25,32 @@ def test_founders_html_parser_extracts_founders() -> None:
     assert founders[1]["linkedin_url"] is None
     assert founders[1]["role"] == "Co-Founder"
 
+
+
+def test_fast_path_matches_full_parse() -> None:
+    page = "<html><head><title>x</title></head><body>" + "<p>filler</p>" * 500 + NANGO_FOUNDERS_HTML
+    page += "<h3>Jobs at <span>Nango</span></h3>" + "<p>jobs</p>" * 500 + "</body></html>"
+
+    section = founders_section(page)
+    assert section is not None
+    assert section.startswith("Active Founders")
+    assert "filler" not in section
+    assert "jobs" not in section
+    assert parse_founders_html(page) == parse_founders_html_full(page)
+
+
+def test_fast_path_ignores_marker_inside_script() -> None:
+    script = '<script>var t = "<h3>Active Founders</h3><img alt=\'Ghost\' src=\'/avatars/g.jpg\'>";</script>'
+    page = "<html><head>" + script + "</head><body>" + NANGO_FOUNDERS_HTML + "</body></html>"
+
+    founders = parse_founders_html(page)
+    assert [f["name"] for f in founders] == ["Alice Founder", "Bob Builder"]
+    assert founders == parse_founders_html_full(page)
+
+
+def test_falls_back_to_full_parse_when_fast_path_finds_nothing() -> None:
+    # The parser strips the non-breaking space from the text node; the string search does not.
+    page = NANGO_FOUNDERS_HTML.replace("<h3>Active Founders", "<h3>&nbsp;Active Founders")
+
+    assert founders_section(page) is None
+    assert [f["name"] for f in parse_founders_html(page)] == ["Alice Founder", "Bob Builder"]
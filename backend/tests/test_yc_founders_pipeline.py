@@ -0,0 +1,127 @@
+import asyncio
+import uuid
+from typing import Any
+
+import pytest
+
+from app.infrastructure.yc.founders_pipeline import (
+    PipelineConfig,
+    StopCrawl,
+    run_founders_pipeline,
+)
+
+
+def _companies(n: int) -> list[tuple[uuid.UUID, str]]:
+    return [(uuid.uuid4(), f"https://example.com/{i}") for i in range(n)]
+
+
+def _run(companies, fetch, write, **config: Any):
+    async def parse(company_id: uuid.UUID, html: str) -> list[dict[str, Any]]:
+        return [{"company_id": company_id, "name": html}]
+
+    return asyncio.run(
+        run_founders_pipeline(companies, fetch=fetch, parse=parse, write=write, config=PipelineConfig(**config))
+    )
+
+
+def test_pipeline_writes_every_company_in_size_bounded_batches() -> None:
+    companies = _companies(23)
+    batches: list[dict[uuid.UUID, list[dict[str, Any]]]] = []
+
+    async def fetch(_company_id: uuid.UUID, url: str) -> str:
+        await asyncio.sleep(0.001)
+        return url
+
+    async def write(batch: dict[uuid.UUID, list[dict[str, Any]]]) -> None:
+        batches.append(batch)
+
+    stats = _run(companies, fetch, write, fetch_concurrency=4, write_batch_size=10, write_interval=60)
+
+    assert [len(b) for b in batches] == [10, 10, 3]
+    written = {cid: founders for b in batches for cid, founders in b.items()}
+    assert {cid: founders[0]["name"] for cid, founders in written.items()} == dict(companies)
+    assert stats.fetch.items == stats.parse.items == stats.write.items == 23
+    assert stats.batches == 3
+
+
+def test_slow_page_does_not_stall_other_fetch_slots() -> None:
+    companies = _companies(20)
+    slow_id = companies[0][0]
+
+    async def fetch(company_id: uuid.UUID, url: str) -> str:
+        await asyncio.sleep(0.5 if company_id == slow_id else 0.01)
+        return url
+
+    async def write(_batch: dict[uuid.UUID, list[dict[str, Any]]]) -> None:
+        return None
+
+    stats = _run(companies, fetch, write, fetch_concurrency=4)
+    # Chunked gather would take 5 chunks, one of them 0.5s; the pipeline overlaps the slow page.
+    assert stats.elapsed < 0.5 + 0.2
+
+
+def test_write_batches_flush_on_interval() -> None:
+    companies = _companies(3)
+    flushed_at: list[int] = []
+
+    async def fetch(_company_id: uuid.UUID, url: str) -> str:
+        if url.endswith("/2"):
+            await asyncio.sleep(0.3)
+        return url
+
+    async def write(batch: dict[uuid.UUID, list[dict[str, Any]]]) -> None:
+        flushed_at.append(len(batch))
+
+    _run(companies, fetch, write, fetch_concurrency=3, write_batch_size=50, write_interval=0.05)
+    assert flushed_at == [2, 1]
+
+
+def test_failed_fetch_is_written_as_its_error_and_counted() -> None:
+    companies = _companies(3)
+    failing = companies[1][0]
+    written: dict[uuid.UUID, Any] = {}
+
+    async def fetch(company_id: uuid.UUID, url: str) -> str:
+        if company_id == failing:
+            raise RuntimeError("boom")
+        return url
+
+    async def write(batch: dict[uuid.UUID, Any]) -> None:
+        written.update(batch)
+
+    stats = _run(companies, fetch, write)
+    assert isinstance(written[failing], RuntimeError)
+    assert len(written) == 3
+    assert stats.fetch.errors == 1
+
+
+def test_stop_crawl_drains_fetched_companies_then_raises() -> None:
+    companies = _companies(100)
+    stop_at = companies[10][0]
+    written: dict[uuid.UUID, Any] = {}
+
+    async def fetch(company_id: uuid.UUID, url: str) -> str:
+        await asyncio.sleep(0.001)
+        if company_id == stop_at:
+            raise StopCrawl("budget")
+        return url
+
+    async def write(batch: dict[uuid.UUID, Any]) -> None:
+        written.update(batch)
+
+    with pytest.raises(StopCrawl, match="budget"):
+        _run(companies, fetch, write, fetch_concurrency=2)
+    assert isinstance(written[stop_at], StopCrawl)
+    assert 11 <= len(written) <= 13
+    assert all(isinstance(v, list) for cid, v in written.items() if cid != stop_at)
+
+
+def test_write_error_cancels_pipeline() -> None:
+    async def fetch(_company_id: uuid.UUID, url: str) -> str:
+        return url
+
+    async def write(_batch: dict[uuid.UUID, list[dict[str, Any]]]) -> None:
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError, match="db down"):
+        _run(_companies(500), fetch, write, write_batch_size=5, queue_size=4)
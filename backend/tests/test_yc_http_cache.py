@@ -0,0 +1,123 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from app.infrastructure.yc.crawl_policy import CrawlPolicy, RetryPolicy
+from app.infrastructure.yc.http_cache import HTTPConditionalCache
+from app.infrastructure.yc.metrics import SyncRunMetrics
+from app.infrastructure.yc.parse_pool import parse_inline
+from app.infrastructure.yc.sync import (
+    FetchedPage,
+    _fetch_founders_page,
+    _parse_founders_page,
+)
+from tests.utils.stub_http_server import StubRoute, stub_http_server
+from tests.utils.yc_founders_html import NANGO_FOUNDERS_HTML
+
+
+def _fetch(cache: HTTPConditionalCache, url: str) -> FetchedPage:
+    async def run() -> FetchedPage:
+        async with httpx.AsyncClient() as client:
+            policy = CrawlPolicy(retry=RetryPolicy(base_delay=0))
+            return await _fetch_founders_page(client, cache, policy, url, SyncRunMetrics())
+
+    return asyncio.run(run())
+
+
+def _parse(cache: HTTPConditionalCache, page: FetchedPage) -> list[dict[str, Any]]:
+    return asyncio.run(_parse_founders_page(cache, page, parse_inline))
+
+
+def test_founders_page_304_hands_on_the_cached_founders(tmp_path: Path) -> None:
+    routes = {
+        "/company": StubRoute(
+            body=NANGO_FOUNDERS_HTML.encode(),
+            content_type="text/html",
+            etag='"v1"',
+        )
+    }
+    with stub_http_server(routes) as server:
+        url = server.url("/company")
+        cache = HTTPConditionalCache(tmp_path)
+
+        page = _fetch(cache, url)
+        assert page.response is not None and page.founders is None
+        # Validators are stored by the parse stage, not the fetch.
+        assert asyncio.run(cache.get(url)) is None
+        founders = _parse(cache, page)
+        assert [f["name"] for f in founders] == ["Alice Founder", "Bob Builder"]
+
+        # A fresh cache instance over the same directory reuses persisted validators.
+        cache = HTTPConditionalCache(tmp_path)
+        page = _fetch(cache, url)
+        assert page.response is None
+        assert page.founders == founders
+        assert _parse(cache, page) == founders
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert server.requests[-1][1]["if-none-match"] == '"v1"'
+
+        routes["/company"] = StubRoute(body=b"<html></html>", content_type="text/html", etag='"v2"')
+        page = _fetch(cache, url)
+        assert page.response is not None
+        assert _parse(cache, page) == []
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert server.full_responses("/company") == 2
+
+
+def test_founders_page_that_fails_to_parse_is_fetched_in_full_again(tmp_path: Path) -> None:
+    routes = {"/company": StubRoute(body=b"<html></html>", content_type="text/html", etag='"v1"')}
+    with stub_http_server(routes) as server:
+        url = server.url("/company")
+        cache = HTTPConditionalCache(tmp_path)
+
+        async def broken(_html: str) -> list[dict[str, Any]]:
+            raise ValueError("unparseable")
+
+        page = _fetch(cache, url)
+        with pytest.raises(ValueError):
+            asyncio.run(_parse_founders_page(cache, page, broken))
+
+        page = _fetch(cache, url)
+        assert page.response is not None
+        assert "if-none-match" not in server.requests[-1][1]
+
+
+def test_entry_validators_become_request_headers(tmp_path: Path) -> None:
+    cache = HTTPConditionalCache(tmp_path)
+    url = "https://example.com/all.json"
+    last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    asyncio.run(cache.store(url, httpx.Response(200, headers={"Last-Modified": last_modified})))
+
+    entry = asyncio.run(cache.get(url))
+    assert entry is not None and entry.payload is None
+    assert cache.request_headers(entry) == {"If-Modified-Since": last_modified}
+    assert cache.not_modified_entry(entry, httpx.Response(200)) is None
+    assert cache.not_modified_entry(entry, httpx.Response(304)) is entry
+    # A 304 without a stored entry cannot be served.
+    assert cache.not_modified_entry(None, httpx.Response(304)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_responses_without_validators_are_not_cached(tmp_path: Path) -> None:
+    cache = HTTPConditionalCache(tmp_path)
+    url = "https://example.com/plain"
+    asyncio.run(cache.store(url, httpx.Response(200), payload=[]))
+
+    entry = asyncio.run(cache.get(url))
+    assert entry is None
+    assert cache.request_headers(entry) == {}
+    assert cache.misses == 1
+
+
+def test_failed_entry_write_leaves_no_temp_file(tmp_path: Path) -> None:
+    resp = httpx.Response(200, headers={"ETag": '"v1"'})
+    cache = HTTPConditionalCache(tmp_path)
+
+    # A payload json cannot encode fails the write after the temp file exists.
+    with pytest.raises(TypeError):
+        asyncio.run(cache.store("https://example.com/company", resp, payload=object()))
+
+    assert list(tmp_path.iterdir()) == []
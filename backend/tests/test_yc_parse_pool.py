@@ -0,0 +1,18 @@
+import asyncio
+
+from app.infrastructure.yc.founders_parser import parse_founders_html
+from app.infrastructure.yc.parse_pool import FoundersParsePool
+from tests.utils.yc_founders_html import NANGO_FOUNDERS_HTML
+
+
+def test_parse_pool_matches_inline_parsing_and_chunks_submissions() -> None:
+    pages = [NANGO_FOUNDERS_HTML, "<html></html>"] * 5
+
+    async def run(pool: FoundersParsePool) -> list[list[dict[str, object]]]:
+        return await asyncio.gather(*(pool.parse(html) for html in pages))
+
+    with FoundersParsePool(processes=2, chunk_size=4) as pool:
+        results = asyncio.run(run(pool))
+
+    assert results == [parse_founders_html(html) for html in pages]
+    assert pool.submitted_chunks == 3
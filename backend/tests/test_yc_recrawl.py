@@ -0,0 +1,82 @@
+import uuid
+from datetime import datetime, timedelta
+
+from app.infrastructure.yc.recrawl import (
+    ACTIVE,
+    LONG_TAIL,
+    NEW,
+    PAST_SLA,
+    CrawlCandidate,
+    RecrawlPolicy,
+    crawl_key,
+    plan_recrawl,
+    recrawl_interval,
+)
+
+NOW = datetime(2026, 3, 1)
+POLICY = RecrawlPolicy(
+    budget=3,
+    sla=timedelta(days=30),
+    active_interval=timedelta(days=3),
+    long_tail_interval=timedelta(days=21),
+    recent_years=3,
+)
+
+
+def _company(
+    yc_id: int,
+    *,
+    age_days: float | None,
+    status: str = "Acquired",
+    year: int = 2008,
+    failed: bool = False,
+    unchanged_crawls: int = 0,
+) -> CrawlCandidate:
+    return CrawlCandidate(
+        company_id=uuid.uuid4(),
+        url=f"https://example.com/{yc_id}",
+        yc_id=yc_id,
+        status=status,
+        year=year,
+        crawled_at=NOW - timedelta(days=age_days) if age_days is not None else None,
+        failed_at=NOW if failed else None,
+        unchanged_crawls=unchanged_crawls,
+    )
+
+
+def test_active_interval_backs_off_while_founders_do_not_change() -> None:
+    active = _company(1, age_days=1, status="Active")
+    assert recrawl_interval(POLICY, active, NOW) == timedelta(days=3)
+    assert recrawl_interval(POLICY, _company(1, age_days=1, year=2025, unchanged_crawls=2), NOW) == timedelta(days=12)
+    assert recrawl_interval(POLICY, _company(1, age_days=1, status="Active", unchanged_crawls=9), NOW) == timedelta(
+        days=21
+    )
+    assert recrawl_interval(POLICY, _company(1, age_days=1), NOW) == timedelta(days=21)
+
+
+def test_tiers_put_new_and_failed_first_and_skip_companies_not_due() -> None:
+    assert crawl_key(POLICY, _company(1, age_days=None), NOW)[0] == NEW  # type: ignore[index]
+    assert crawl_key(POLICY, _company(2, age_days=1, failed=True), NOW)[0] == NEW  # type: ignore[index]
+    assert crawl_key(POLICY, _company(3, age_days=45), NOW)[0] == PAST_SLA  # type: ignore[index]
+    assert crawl_key(POLICY, _company(4, age_days=4, status="Active"), NOW)[0] == ACTIVE  # type: ignore[index]
+    assert crawl_key(POLICY, _company(5, age_days=22), NOW)[0] == LONG_TAIL  # type: ignore[index]
+    assert crawl_key(POLICY, _company(6, age_days=2, status="Active"), NOW) is None
+    assert crawl_key(POLICY, _company(7, age_days=10), NOW) is None
+
+
+def test_plan_spends_the_budget_by_tier_and_resumes_after_the_cursor() -> None:
+    companies = [
+        _company(10, age_days=22),  # long tail
+        _company(11, age_days=5, status="Active"),  # active
+        _company(12, age_days=40),  # past SLA
+        _company(13, age_days=None),  # new
+        _company(14, age_days=8, status="Active"),  # active, staler
+        _company(15, age_days=1),  # not due
+    ]
+    plan = plan_recrawl(POLICY, companies, NOW)
+    assert [c.yc_id for c, _ in plan.companies] == [13, 12, 14]
+    assert plan.deferred == 2
+    assert plan.summary()["due_long_tail"] == 1
+
+    resumed = plan_recrawl(POLICY, companies, NOW, after=plan.companies[1][1], spent=2)
+    assert [c.yc_id for c, _ in resumed.companies] == [14]
@@ -0,0 +1,66 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.infrastructure.yc.replay import (
+    RecordingTransport,
+    ReplayFaults,
+    ReplayTransport,
+)
+from tests.utils.stub_http_server import StubRoute, stub_http_server
+from tests.utils.yc_founders_html import NANGO_FOUNDERS_HTML
+
+
+async def _get_all(transport: httpx.AsyncBaseTransport, urls: list[str], **kwargs: object) -> list[httpx.Response]:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return [await client.get(url, **kwargs) for url in urls]  # type: ignore[arg-type]
+
+
+def test_recorded_responses_replay_offline(tmp_path: Path) -> None:
+    archive = tmp_path / "source.zip"
+    routes = {
+        "/all.json": StubRoute(body=b'[{"id": 1}]', etag='"f1"'),
+        "/c/1": StubRoute(body=NANGO_FOUNDERS_HTML.encode(), content_type="text/html", etag='"p1"'),
+    }
+    with stub_http_server(routes) as server:
+        urls = [server.url("/all.json"), server.url("/c/1")]
+        recorder = RecordingTransport(archive)
+        # Validators are dropped while recording, so full bodies are archived.
+        recorded = asyncio.run(_get_all(recorder, urls, headers={"If-None-Match": '"p1"'}))
+    assert [r.status_code for r in recorded] == [200, 200]
+    assert archive.exists() and recorder.recorded == 2
+
+    replay = ReplayTransport(archive)
+    replayed = asyncio.run(_get_all(replay, [*urls, urls[0] + "?missing"]))
+    assert [r.status_code for r in replayed] == [200, 200, 404]
+    assert replayed[0].content == b'[{"id": 1}]'
+    assert replayed[1].text == NANGO_FOUNDERS_HTML
+    assert replayed[1].headers["etag"] == '"p1"'
+
+    revalidated = asyncio.run(_get_all(ReplayTransport(archive), urls[1:], headers={"If-None-Match": '"p1"'}))
+    assert revalidated[0].status_code == 304
+    assert replay.summary() == {"served": 2, "missing": 1, "injected_errors": 0, "injected_timeouts": 0}
+
+
+def test_replay_faults_are_seeded_and_spare_exempt_hosts(tmp_path: Path) -> None:
+    archive = tmp_path / "source.zip"
+    with stub_http_server({"/page": StubRoute(body=b"ok", content_type="text/html")}) as server:
+        url = server.url("/page")
+        asyncio.run(_get_all(RecordingTransport(archive), [url]))
+
+    def statuses(faults: ReplayFaults) -> list[int]:
+        return [r.status_code for r in asyncio.run(_get_all(ReplayTransport(archive, faults), [url] * 20))]
+
+    faults = ReplayFaults(error_rate=0.5, error_statuses=(429, 503), retry_after=3, seed=7)
+    first = statuses(faults)
+    assert first == statuses(faults)
+    assert set(first) == {200, 429, 503}
+    assert statuses(ReplayFaults(error_rate=1.0, exempt_hosts=frozenset({"127.0.0.1"}))) == [200] * 20
+
+    transport = ReplayTransport(archive, ReplayFaults(error_rate=1.0, retry_after=3))
+    assert asyncio.run(_get_all(transport, [url]))[0].headers["Retry-After"] == "3"
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(_get_all(ReplayTransport(archive, ReplayFaults(timeout_rate=1.0)), [url]))
@@ -0,0 +1,140 @@
+import uuid
+
+from app.infrastructure.yc.rows import (
+    CompanyDiffer,
+    company_row,
+    diff_founders,
+    founder_identity_key,
+    founder_key,
+    founder_rows,
+    founders_hash,
+)
+
+
+def _raw(yc_id: int, **overrides: object) -> dict[str, object]:
+    raw: dict[str, object] = {
+        "id": yc_id,
+        "name": f"Company {yc_id}",
+        "slug": f"company-{yc_id}",
+        "batch": "Winter 2024",
+        "status": "Active",
+        "url": f"https://www.ycombinator.com/companies/company-{yc_id}",
+        "tags": ["B2B"],
+    }
+    raw.update(overrides)
+    return raw
+
+
+def test_company_row_hash_is_stable_and_content_sensitive() -> None:
+    a = company_row(_raw(1))
+    b = company_row(_raw(1))
+    c = company_row(_raw(1, one_liner="Now with AI"))
+
+    assert a["batch_code"] == "W2024"
+    assert a["year"] == 2024
+    assert a["content_hash"] == b["content_hash"]
+    assert a["content_hash"] != c["content_hash"]
+
+
+def test_differ_partitions_rows_across_batches() -> None:
+    unchanged = company_row(_raw(1))
+    changed = company_row(_raw(2, status="Acquired"))
+    inserted = company_row(_raw(3))
+    existing = {
+        1: unchanged["content_hash"],
+        2: company_row(_raw(2))["content_hash"],
+        4: "gone",
+        5: None,
+    }
+    differ = CompanyDiffer(existing)
+
+    first = differ.writes([unchanged, changed])
+    second = differ.writes([inserted, company_row(_raw(5))])
+    diff = differ.finish()
+
+    assert [r["yc_id"] for r in first] == [2]
+    assert [r["yc_id"] for r in second] == [3, 5]
+    assert (diff.inserted, diff.changed, diff.unchanged, diff.disappeared) == (1, 2, 1, 1)
+    assert diff.total == 4
+
+
+def test_differ_only_counts_disappeared_companies_within_scope() -> None:
+    differ = CompanyDiffer({1: "a", 2: "b", 3: "c"})
+    differ.writes([company_row(_raw(1))])
+
+    assert differ.missing(within={1, 2}) == [2]
+    assert differ.finish(within={1, 2}).disappeared == 1
+
+
+def test_differ_ignores_duplicate_feed_entries() -> None:
+    row = company_row(_raw(1))
+    differ = CompanyDiffer({})
+
+    assert len(differ.writes([row])) == 1
+    assert differ.writes([dict(row)]) == []
+    assert differ.finish().inserted == 1
+
+
+def test_founder_rows_assign_keys_and_drop_duplicates() -> None:
+    company_id = uuid.uuid4()
+    rows = founder_rows(
+        company_id,
+        [
+            {"name": "Alice", "avatar_url": "https://x/avatars/a.jpg?sig=1"},
+            {"name": " alice ", "twitter_url": "https://x.com/alice"},
+            {"name": "Bob", "yc_profile_url": "https://www.ycombinator.com/people/bob"},
+        ],
+    )
+
+    assert [r["name"] for r in rows] == ["Alice", "Bob"]
+    assert [r["sort_order"] for r in rows] == [0, 1]
+    assert rows[0]["avatar_url"] == "https://x/avatars/a.jpg"
+    assert rows[0]["founder_key"] == founder_key("Alice", None)
+    assert rows[1]["founder_key"] != founder_key("Bob", None)
+
+
+def test_diff_founders_only_touches_differences() -> None:
+    company_id = uuid.uuid4()
+    stored = founder_rows(
+        company_id,
+        [{"name": "Alice", "role": "Founder"}, {"name": "Bob"}, {"name": "Carol"}],
+    )
+    existing = {row["founder_key"]: {**row, "id": uuid.uuid4()} for row in stored}
+    desired = founder_rows(
+        company_id,
+        [{"name": "Alice", "role": "Founder"}, {"name": "Bob", "bio": "New bio"}, {"name": "Dave"}],
+    )
+
+    inserts, updates, deletes = diff_founders(existing, desired)
+
+    assert [r["name"] for r in inserts] == ["Dave"]
+    assert [r["name"] for r in updates] == ["Bob"]
+    assert deletes == [founder_key("Carol", None)]
+    assert diff_founders(existing, stored) == ([], [], [])
+
+
+def test_founder_identity_matches_across_companies_by_profile_or_handle() -> None:
+    a, b = uuid.uuid4(), uuid.uuid4()
+
+    assert founder_identity_key(
+        a, "Alice", "https://www.ycombinator.com/people/alice/", None, None
+    ) == founder_identity_key(b, "Someone Else", "http://ycombinator.com/people/alice?ref=1", None, None)
+    assert founder_identity_key(
+        a, "Alice Smith", None, "https://twitter.com/alice", None
+    ) == founder_identity_key(b, " alice smith ", None, "https://x.com/Alice/", None)
+    assert founder_identity_key(
+        a, "Alice Smith", None, "https://x.com/other", "https://www.linkedin.com/in/alice-smith"
+    ) == founder_identity_key(b, "Alice Smith", None, None, "https://linkedin.com/in/alice-smith/")
+    # Neither a profile nor a handle: the same name at two companies stays two founders.
+    assert founder_identity_key(a, "Alice", None, None, None) != founder_identity_key(b, "Alice", None, None, None)
+    assert founder_identity_key(a, "Alice", None, None, None) == founder_identity_key(a, "alice", None, None, None)
+
+
+def test_founders_hash_ignores_the_company_and_identity() -> None:
+    founders = [{"name": "Alice", "twitter_url": "https://x.com/alice"}]
+    a = founder_rows(uuid.uuid4(), founders)
+    b = founder_rows(uuid.uuid4(), founders)
+
+    assert a[0]["identity_key"] == b[0]["identity_key"]
+    assert founders_hash(a) == founders_hash(b)
+    assert founders_hash(a) != founders_hash(founder_rows(uuid.uuid4(), [{"name": "Alice"}]))
@@ -0,0 +1,20 @@
+from app.infrastructure.yc.shadow import _retarget_index, _retarget_references
+
+
+def test_index_definitions_are_retargeted_to_the_shadow_schema() -> None:
+    assert _retarget_index(
+        "CREATE INDEX ix_yccompany_name ON public.yccompany USING btree (name)", "yccompany", "yc_shadow"
+    ) == "CREATE INDEX IF NOT EXISTS ix_yccompany_name ON yc_shadow.yccompany USING btree (name)"
+    assert _retarget_index(
+        "CREATE UNIQUE INDEX ix_yccompany_yc_id ON yccompany USING btree (yc_id)", "yccompany", "yc_shadow"
+    ) == "CREATE UNIQUE INDEX IF NOT EXISTS ix_yccompany_yc_id ON yc_shadow.yccompany USING btree (yc_id)"
+
+
+def test_foreign_keys_reference_the_shadow_parent_table() -> None:
+    definition = "FOREIGN KEY (company_id) REFERENCES yccompany(id) ON DELETE CASCADE"
+    assert _retarget_references(definition, "yc_shadow") == (
+        "FOREIGN KEY (company_id) REFERENCES yc_shadow.yccompany(id) ON DELETE CASCADE"
+    )
+    assert _retarget_references(definition.replace("yccompany", "public.yccompany"), "yc_shadow") == (
+        "FOREIGN KEY (company_id) REFERENCES yc_shadow.yccompany(id) ON DELETE CASCADE"
+    )
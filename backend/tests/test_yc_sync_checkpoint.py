@@ -0,0 +1,25 @@
+import uuid
+
+from app.infrastructure.yc.recrawl import NEW, PAST_SLA
+from app.infrastructure.yc.sync import _CrawlWatermark, _decode_cursor, _encode_cursor
+
+
+def test_cursor_round_trips_and_orders_retried_companies_first() -> None:
+    retried, stale = (NEW, 1_700_000_000, 900), (PAST_SLA, 1_600_000_000, 5)
+    assert _decode_cursor(_encode_cursor(retried)) == retried
+    assert _decode_cursor(_encode_cursor(stale)) == stale
+    assert _decode_cursor(None) is None
+    # A checkpoint from before the re-crawl schedule restarts the plan.
+    assert _decode_cursor("1:42") is None
+    assert retried < stale
+
+
+def test_watermark_only_advances_past_contiguously_written_companies() -> None:
+    order = [(uuid.uuid4(), (PAST_SLA, 0, yc_id)) for yc_id in (1, 2, 3, 4)]
+    ids = [company_id for company_id, _ in order]
+    watermark = _CrawlWatermark(order, cursor="0:0:7")
+
+    assert watermark.advance([ids[1]]) == "0:0:7"
+    assert watermark.advance([ids[0], ids[3]]) == "1:0:2"
+    assert watermark.advance([]) == "1:0:2"
+    assert watermark.advance([ids[2]]) == "1:0:4"
@@ -0,0 +1,92 @@
+import asyncio
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from prometheus_client import REGISTRY
+
+from app.infrastructure.yc.memory_profile import MemoryProfiler
+from app.infrastructure.yc.metrics import SyncRunMetrics
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def _slow_chunks() -> AsyncIterator[bytes]:
+    for chunk in (b"[1,", b"2]"):
+        await asyncio.sleep(0.02)
+        yield chunk
+
+
+def test_phases_exclude_nested_download_and_parse_time() -> None:
+    run = SyncRunMetrics()
+    bytes_before = _sample("yc_sync_downloaded_bytes_total", source="feed")
+
+    async def consume() -> list[bytes]:
+        received = []
+        with run.phase("company_upsert", exclude=("download", "parse")):
+            async for chunk in run.parsed_batches(run.metered_download(_slow_chunks(), "feed")):
+                received.append(chunk)
+                time.sleep(0.03)
+        return received
+
+    assert asyncio.run(consume()) == [b"[1,", b"2]"]
+    assert run.bytes_downloaded == 5
+    assert _sample("yc_sync_downloaded_bytes_total", source="feed") - bytes_before == 5
+    assert 0.04 <= run.phase_seconds["download"] < 0.1
+    assert run.phase_seconds["parse"] < 0.01
+    assert 0.06 <= run.phase_seconds["company_upsert"] < 0.1
+
+
+def test_counters_and_run_outcome_are_exported() -> None:
+    run = SyncRunMetrics()
+    fetched = _sample("yc_sync_founders_pages_total", result="fetched")
+    failed = _sample("yc_sync_founders_pages_total", result="failed")
+    founder_rows = _sample("yc_sync_rows_written_total", table="ycfounder")
+    companies = _sample("yc_sync_founders_per_company_count")
+    runs = _sample("yc_sync_runs_total", status="succeeded")
+
+    run.record_page(not_modified=False)
+    run.record_page(not_modified=True)
+    run.record_failed_pages(2)
+    run.record_founders(3)
+    run.record_rows("ycfounder", 4)
+    run.finish("succeeded")
+
+    assert (run.pages_fetched, run.pages_not_modified, run.pages_failed) == (1, 1, 2)
+    assert (run.companies_parsed, run.founders_parsed, run.founder_rows_written) == (1, 3, 4)
+    assert _sample("yc_sync_founders_pages_total", result="fetched") - fetched == 1
+    assert _sample("yc_sync_founders_pages_total", result="failed") - failed == 2
+    assert _sample("yc_sync_rows_written_total", table="ycfounder") - founder_rows == 4
+    assert _sample("yc_sync_founders_per_company_count") - companies == 1
+    assert _sample("yc_sync_runs_total", status="succeeded") - runs == 1
+    assert _sample("yc_sync_phase_duration_seconds_count", phase="founder_crawl") >= 1
+
+
+def test_memory_profile_keeps_top_sites_of_the_traced_high_point() -> None:
+    assert not tracemalloc.is_tracing()
+    run = SyncRunMetrics(memory=MemoryProfiler(top=3))
+    run.memory.start()
+    rows = [bytearray(64 * 1024) for _ in range(32)]
+    run.checkpoint("company_rows")
+    del rows
+    run.checkpoint("company_upsert")
+    run.checkpoint("company_upsert")
+    run.finish("succeeded")
+    assert not tracemalloc.is_tracing()
+    run.checkpoint("finished")
+
+    profile = run.memory.summary()
+    stages = {s["stage"]: s for s in profile["stages"]}
+    assert list(stages) == ["start", "company_rows", "company_upsert"]
+    assert stages["company_upsert"]["checkpoints"] == 2
+    assert stages["company_rows"]["traced_mb"] >= 2
+    assert stages["company_rows"]["rss_mb"] > 0
+    assert stages["company_upsert"]["peak_traced_mb"] >= 2 > stages["company_upsert"]["traced_mb"]
+    assert profile["top_sites_stage"] == "company_rows"
+    top = profile["top_sites"][0]
+    assert top["site"].startswith("tests/test_yc_sync_metrics.py:")
+    assert top["size_kb"] >= 2048
+    assert top["count"] >= 32
+
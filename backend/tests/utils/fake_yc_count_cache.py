@@ -0,0 +1,22 @@
+"""In-memory fake for IYCCountCache."""
+from typing import Any
+
+from app.use_cases.ports.yc_count_cache import IYCCountCache, YCCompanyCount
+
+
+class FakeYCCountCache(IYCCountCache):
+    def __init__(self) -> None:
+        self.counts: dict[str, YCCompanyCount] = {}
+        self.facets: dict[str, dict[str, list[tuple[Any, int]]]] = {}
+
+    async def get(self, key: str) -> YCCompanyCount | None:
+        return self.counts.get(key)
+
+    async def set(self, key: str, count: YCCompanyCount) -> None:
+        self.counts[key] = count
+
+    async def get_facets(self, key: str) -> dict[str, list[tuple[Any, int]]] | None:
+        return self.facets.get(key)
+
+    async def set_facets(self, key: str, facets: dict[str, list[tuple[Any, int]]]) -> None:
+        self.facets[key] = facets
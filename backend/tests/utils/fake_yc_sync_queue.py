@@ -0,0 +1,17 @@
+"""In-memory fake for IYCSyncQueue. Records queued jobs instead of talking to Redis."""
+from app.use_cases.ports.yc_sync_queue import IYCSyncQueue
+
+
+class FakeYCSyncQueue(IYCSyncQueue):
+    def __init__(self) -> None:
+        self.jobs: list[str] = []
+        self.running = False
+
+    async def enqueue(self, reason: str, *, skip_if_running: bool = False) -> bool:
+        if self.jobs or (skip_if_running and self.running):
+            return False
+        self.jobs.append(reason)
+        return True
+
+    async def is_running(self) -> bool:
+        return self.running
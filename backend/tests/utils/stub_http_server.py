@@ -0,0 +1,86 @@
+"""Local stub HTTP server for exercising the YC sync fetcher without network access."""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class StubRoute:
+    body: bytes
+    content_type: str = "application/json"
+    etag: str | None = None
+    last_modified: str | None = None
+    status: int = 200
+
+
+@dataclass
+class StubServer:
+    base_url: str
+    routes: dict[str, StubRoute]
+    requests: list[tuple[str, dict[str, str]]] = field(default_factory=list)
+    statuses: list[tuple[str, int]] = field(default_factory=list)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def full_responses(self, path: str) -> int:
+        return sum(1 for p, status in self.statuses if p == path and status == 200)
+
+
+def _is_not_modified(route: StubRoute, headers: dict[str, str]) -> bool:
+    if route.etag and headers.get("if-none-match") == route.etag:
+        return True
+    if route.last_modified and headers.get("if-modified-since") == route.last_modified:
+        return True
+    return False
+
+
+@contextmanager
+def stub_http_server(routes: dict[str, StubRoute]) -> Iterator[StubServer]:
+    """Serve `routes` on 127.0.0.1 with ETag / Last-Modified conditional handling."""
+    server_state: StubServer | None = None
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            assert server_state is not None
+            headers = {k.lower(): v for k, v in self.headers.items()}
+            server_state.requests.append((self.path, headers))
+            route = server_state.routes.get(self.path)
+            if route is None:
+                server_state.statuses.append((self.path, 404))
+                self.send_response(404)
+                self.end_headers()
+                return
+            if _is_not_modified(route, headers):
+                server_state.statuses.append((self.path, 304))
+                self.send_response(304)
+                self.end_headers()
+                return
+            server_state.statuses.append((self.path, route.status))
+            self.send_response(route.status)
+            self.send_header("Content-Type", route.content_type)
+            self.send_header("Content-Length", str(len(route.body)))
+            if route.etag:
+                self.send_header("ETag", route.etag)
+            if route.last_modified:
+                self.send_header("Last-Modified", route.last_modified)
+            self.end_headers()
+            self.wfile.write(route.body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            return
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    host, port = httpd.server_address[:2]
+    server_state = StubServer(base_url=f"http://{host}:{port}", routes=routes)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server_state
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
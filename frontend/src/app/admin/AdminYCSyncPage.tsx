@@ -2,11 +2,12 @@ import { useEffect } from "react"
 import { Link } from "@tanstack/react-router"
 import { toast } from "sonner"
 import { useYCSync } from "@/delivery"
+import type { YCSyncMemoryProfile, YCSyncRun } from "@/domain/yc/types/yc"
 
 const adminYCSyncLoadedRef = { current: false }
 
 export function AdminYCSyncPage() {
-  const { syncState, loading, syncNow, reload } = useYCSync()
+  const { syncState, runs, loading, syncNow, reload } = useYCSync()
 
   useEffect(() => {
     if (adminYCSyncLoadedRef.current) return
@@ -162,9 +163,124 @@ export function AdminYCSyncPage() {
             )}
           </section>
         )}
+
+        {runs.length > 0 && (
+          <section className="rounded-2xl border bg-card text-card-foreground shadow-lg p-6 space-y-4">
+            <h2 className="text-xl font-semibold flex items-center gap-2">
+              <span>🕒</span> Recent runs
+            </h2>
+
+            <div className="space-y-3">
+              {runs.map((run) => (
+                <SyncRunCard key={run.id} run={run} />
+              ))}
+            </div>
+          </section>
+        )}
       </div>
     </main>
   )
 }
 
+function SyncRunCard({ run }: { run: YCSyncRun }) {
+  const phases = [
+    ["Download", run.download_seconds],
+    ["Parse", run.parse_seconds],
+    ["Company upsert", run.company_upsert_seconds],
+    ["Founder crawl", run.founder_crawl_seconds],
+  ] as const
+
+  return (
+    <div className="rounded-lg border bg-background/50 p-4 space-y-2">
+      <div className="flex flex-wrap items-center justify-between gap-2">
+        <p className="text-sm font-medium">
+          {new Date(run.started_at).toLocaleString()}
+          {run.resumed && (
+            <span className="ml-2 text-xs text-muted-foreground">(resumed)</span>
+          )}
+        </p>
+        <span
+          className={`text-xs font-medium uppercase tracking-wide ${
+            run.status === "succeeded" ? "text-green-600" : "text-destructive"
+          }`}
+        >
+          {run.status}
+        </span>
+      </div>
+
+      <p className="text-xs text-muted-foreground">
+        {phases.map(([name, seconds]) => `${name} ${seconds.toFixed(1)}s`).join(" · ")}
+      </p>
+      <p className="text-xs text-muted-foreground">
+        {run.pages_fetched} pages fetched, {run.pages_not_modified} not modified,{" "}
+        {run.pages_failed} failed · {run.company_rows_written} company rows,{" "}
+        {run.founder_rows_written} founder rows written
+      </p>
+
+      {run.error && (
+        <p className="text-xs text-destructive font-mono">{run.error}</p>
+      )}
+
+      {run.memory_profile && <MemoryProfile profile={run.memory_profile} />}
+    </div>
+  )
+}
+
+function MemoryProfile({ profile }: { profile: YCSyncMemoryProfile }) {
+  return (
+    <details className="text-xs">
+      <summary className="cursor-pointer text-muted-foreground">
+        Memory profile
+      </summary>
+
+      <div className="mt-2 grid grid-cols-1 lg:grid-cols-2 gap-4">
+        <table className="w-full">
+          <thead className="text-muted-foreground text-left">
+            <tr>
+              <th className="font-medium py-1">Stage</th>
+              <th className="font-medium py-1 text-right">RSS MB</th>
+              <th className="font-medium py-1 text-right">Traced MB</th>
+              <th className="font-medium py-1 text-right">Peak traced MB</th>
+            </tr>
+          </thead>
+          <tbody>
+            {profile.stages.map((stage) => (
+              <tr key={stage.stage} className="border-t">
+                <td className="py-1">
+                  {stage.stage}
+                  {stage.checkpoints > 1 && (
+                    <span className="text-muted-foreground"> ×{stage.checkpoints}</span>
+                  )}
+                </td>
+                <td className="py-1 text-right">{stage.rss_mb.toFixed(1)}</td>
+                <td className="py-1 text-right">{stage.traced_mb.toFixed(1)}</td>
+                <td className="py-1 text-right">{stage.peak_traced_mb.toFixed(1)}</td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+
+        <div className="space-y-1">
+          <p className="text-muted-foreground">
+            Top allocation sites
+            {profile.top_sites_stage && ` (at ${profile.top_sites_stage})`}
+          </p>
+          <ul className="font-mono space-y-0.5">
+            {profile.top_sites.map((site) => (
+              <li key={site.site} className="flex justify-between gap-2">
+                <span className="truncate" title={site.site}>
+                  {site.site}
+                </span>
+                <span className="shrink-0">
+                  {site.size_kb.toFixed(1)} KB / {site.count}
+                </span>
+              </li>
+            ))}
+          </ul>
+        </div>
+      </div>
+    </details>
+  )
+}
+
 export default AdminYCSyncPage
@@ -3,7 +3,7 @@ import type { YCCompany } from "@/domain/yc/types/yc"
 import type { YCCompanyFilters } from "@/infrastructure/ycApi"
 import { buildCompaniesCsv, buildCompaniesJson, downloadBlob } from "@/pkg/ycExport"
 import { CompanyRowSkeleton } from "@/pkg/components"
-import { useCurrentUser, useYCCompanies, useYCMeta } from "@/delivery"
+import { useCurrentUser, useYCCompanies, useYCFacets, useYCMeta } from "@/delivery"
 import {
   YCCompaniesPageHeader,
   YCFiltersSection,
@@ -31,6 +31,7 @@ export function YCCompaniesPage() {
   }, [companiesLength, refetchProfile])
 
   const { meta } = useYCMeta()
+  const { facets } = useYCFacets(filters, filterOpen && isPaid)
 
   const setFilter = useCallback(<K extends keyof YCCompanyFilters>(key: K, value: YCCompanyFilters[K]) => {
     setFilters((prev) => ({ ...prev, [key]: value === "" || value === undefined ? undefined : value }))
@@ -73,7 +74,7 @@ export function YCCompaniesPage() {
         />
 
         {filterOpen && meta && isPaid && (
-          <YCFiltersSection filters={filters} meta={meta} onFilter={setFilter} onApply={applyFilters} />
+          <YCFiltersSection filters={filters} meta={meta} facets={facets} onFilter={setFilter} onApply={applyFilters} />
         )}
 
         <section className="space-y-4">
@@ -81,7 +82,11 @@ export function YCCompaniesPage() {
             <h2 className="text-2xl font-semibold">Companies</h2>
             {companies && (
               <span className="text-sm text-muted-foreground">
-                Total: <span className="font-semibold">{companies.count}</span>
+                Total:{" "}
+                <span className="font-semibold">
+                  {companies.count_estimated ? "~" : ""}
+                  {companies.count}
+                </span>
                 {!isPaid && <span className="ml-2">(free: first page, {pageSize} per page)</span>}
               </span>
             )}
@@ -145,7 +150,13 @@ export function YCCompaniesPage() {
             />
           )}
 
-          {modalCompany && <YCCompanyModal company={modalCompany} onClose={() => setModalCompany(null)} />}
+          {modalCompany && (
+            <YCCompanyModal
+              company={modalCompany}
+              onClose={() => setModalCompany(null)}
+              onSelectCompany={setModalCompany}
+            />
+          )}
         </section>
       </div>
     </main>
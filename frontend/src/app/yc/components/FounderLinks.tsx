@@ -9,17 +9,32 @@ export function FounderLinks({
   prefix,
   rowHeight,
   nameWidth,
+  onSelect,
 }: {
   founders: YCFounder[]
   prefix: string
   rowHeight?: string
   nameWidth?: string
+  onSelect?: (founder: YCFounder) => void
 }) {
   return (
     <>
       {founders.map((f, i) => (
         <div key={`${prefix}-${i}`} className={`flex items-center gap-3 text-sm ${rowHeight ?? ""}`}>
-          <span className={`text-muted-foreground truncate ${nameWidth ?? "w-32"}`}>{f.name}</span>
+          {onSelect ? (
+            <button
+              type="button"
+              className={`text-left text-primary hover:underline truncate ${nameWidth ?? "w-32"}`}
+              onClick={(e) => {
+                e.stopPropagation()
+                onSelect(f)
+              }}
+            >
+              {f.name}
+            </button>
+          ) : (
+            <span className={`text-muted-foreground truncate ${nameWidth ?? "w-32"}`}>{f.name}</span>
+          )}
           <span className="w-5 flex justify-center" onClick={(e) => e.stopPropagation()}>
             {f.linkedin_url ? (
               <a href={f.linkedin_url} target="_blank" rel="noopener noreferrer" className={btnClass} aria-label="LinkedIn">
@@ -1,16 +1,23 @@
-import type { YCCompany } from "@/domain/yc/types/yc"
+import { useState } from "react"
+
+import type { YCCompany, YCFounder } from "@/domain/yc/types/yc"
+import { useYCFounderCompanies } from "@/delivery"
 import { CompanyLogo } from "./CompanyLogo"
 import { FounderLinks } from "./FounderLinks"
 
 type Props = {
   company: YCCompany
   onClose: () => void
+  onSelectCompany?: (company: YCCompany) => void
 }
 
 const companySiteUrl = (c: YCCompany) => c.website || c.url || "#"
 
-export function YCCompanyModal({ company, onClose }: Props) {
+export function YCCompanyModal({ company, onClose, onSelectCompany }: Props) {
   const siteUrl = companySiteUrl(company)
+  const [founder, setFounder] = useState<YCFounder | null>(null)
+  const founderCompanies = useYCFounderCompanies(founder?.id ?? null)
+  const otherCompanies = founderCompanies.companies.filter((c) => c.yc_id !== company.yc_id)
   return (
     <div
       className="fixed inset-0 z-50 flex items-center justify-center p-4 bg-black/50"
@@ -125,10 +132,48 @@ export function YCCompanyModal({ company, onClose }: Props) {
           <div className="border-t border-border pt-3">
             <h4 className="text-sm font-medium mb-2">Founders</h4>
             <div className="flex flex-col gap-2">
-              <FounderLinks founders={company.founders} prefix={`modal-${company.yc_id}`} nameWidth="w-40" />
+              <FounderLinks
+                founders={company.founders}
+                prefix={`modal-${company.yc_id}`}
+                nameWidth="w-40"
+                onSelect={(f) => setFounder(founder?.id === f.id ? null : f)}
+              />
             </div>
           </div>
         )}
+
+        {founder && (
+          <div className="border-t border-border pt-3 mt-3">
+            <h4 className="text-sm font-medium mb-2">Other companies by {founder.name}</h4>
+            {founderCompanies.loading ? (
+              <p className="text-sm text-muted-foreground">Loading...</p>
+            ) : founderCompanies.error ? (
+              <p className="text-sm text-destructive">{founderCompanies.error}</p>
+            ) : otherCompanies.length === 0 ? (
+              <p className="text-sm text-muted-foreground">No other YC companies.</p>
+            ) : (
+              <ul className="flex flex-col gap-2">
+                {otherCompanies.map((c) => (
+                  <li key={c.yc_id}>
+                    <button
+                      type="button"
+                      className="flex items-center gap-2 text-sm text-left hover:underline"
+                      onClick={() => {
+                        setFounder(null)
+                        onSelectCompany?.(c)
+                      }}
+                      disabled={!onSelectCompany}
+                    >
+                      <CompanyLogo logoUrl={c.small_logo_thumb_url} name={c.name} size="sm" />
+                      <span>{c.name}</span>
+                      <span className="text-xs text-muted-foreground">{c.batch}</span>
+                    </button>
+                  </li>
+                ))}
+              </ul>
+            )}
+          </div>
+        )}
       </div>
     </div>
   )
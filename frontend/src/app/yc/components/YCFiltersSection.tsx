@@ -1,9 +1,10 @@
 import type { YCCompanyFilters } from "@/infrastructure/ycApi"
-import type { YCSearchMeta } from "@/domain/yc/types/yc"
+import type { YCFacetCount, YCFacets, YCSearchMeta } from "@/domain/yc/types/yc"
 
 type Props = {
   filters: YCCompanyFilters
   meta: YCSearchMeta
+  facets?: YCFacets | null
   onFilter: <K extends keyof YCCompanyFilters>(key: K, value: YCCompanyFilters[K]) => void
   onApply: () => void
 }
@@ -11,7 +12,13 @@ type Props = {
 const inputClass = "w-full rounded-md border bg-background px-3 py-2 text-sm"
 const labelClass = "block text-xs text-muted-foreground uppercase tracking-wide mb-1"
 
-export function YCFiltersSection({ filters, meta, onFilter, onApply }: Props) {
+// `label` with how many companies choosing `value` would list, once the facets are loaded
+function withCount(label: string | number, value: string | number | boolean, counts?: YCFacetCount[]) {
+  if (!counts) return label
+  return `${label} (${counts.find((c) => c.value === value)?.count ?? 0})`
+}
+
+export function YCFiltersSection({ filters, meta, facets, onFilter, onApply }: Props) {
   return (
     <section className="rounded-2xl border bg-card text-card-foreground shadow-lg p-6 space-y-4">
       <h2 className="text-lg font-semibold">Filters</h2>
@@ -31,7 +38,7 @@ export function YCFiltersSection({ filters, meta, onFilter, onApply }: Props) {
           <select className={inputClass} value={filters.batch ?? ""} onChange={(e) => onFilter("batch", e.target.value || undefined)}>
             <option value="">All</option>
             {meta.batches.map((b) => (
-              <option key={b} value={b}>{b}</option>
+              <option key={b} value={b}>{withCount(b, b, facets?.batches)}</option>
             ))}
           </select>
         </div>
@@ -44,7 +51,7 @@ export function YCFiltersSection({ filters, meta, onFilter, onApply }: Props) {
           >
             <option value="">All</option>
             {meta.years.map((y) => (
-              <option key={y} value={y}>{y}</option>
+              <option key={y} value={y}>{withCount(y, y, facets?.years)}</option>
             ))}
           </select>
         </div>
@@ -57,7 +64,7 @@ export function YCFiltersSection({ filters, meta, onFilter, onApply }: Props) {
           >
             <option value="">All</option>
             {meta.statuses.map((s) => (
-              <option key={s} value={s}>{s}</option>
+              <option key={s} value={s}>{withCount(s, s, facets?.statuses)}</option>
             ))}
           </select>
         </div>
@@ -70,22 +77,22 @@ export function YCFiltersSection({ filters, meta, onFilter, onApply }: Props) {
           >
             <option value="">All</option>
             {meta.industries.map((i) => (
-              <option key={i} value={i}>{i}</option>
+              <option key={i} value={i}>{withCount(i, i, facets?.industries)}</option>
             ))}
           </select>
         </div>
         <div className="flex items-end gap-2">
           <label className="flex items-center gap-2 text-sm">
             <input type="checkbox" checked={filters.is_hiring === true} onChange={(e) => onFilter("is_hiring", e.target.checked ? true : undefined)} />
-            Hiring
+            {withCount("Hiring", true, facets?.is_hiring)}
           </label>
           <label className="flex items-center gap-2 text-sm">
             <input type="checkbox" checked={filters.nonprofit === true} onChange={(e) => onFilter("nonprofit", e.target.checked ? true : undefined)} />
-            Nonprofit
+            {withCount("Nonprofit", true, facets?.nonprofit)}
           </label>
           <label className="flex items-center gap-2 text-sm">
             <input type="checkbox" checked={filters.top_company === true} onChange={(e) => onFilter("top_company", e.target.checked ? true : undefined)} />
-            Top
+            {withCount("Top", true, facets?.top_company)}
           </label>
         </div>
       </div>
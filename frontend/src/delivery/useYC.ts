@@ -2,14 +2,20 @@ import { useCallback, useEffect, useState } from "react"
 
 import type {
   YCCompanies,
+  YCCompany,
+  YCFacets,
   YCSearchMeta,
+  YCSyncRun,
   YCSyncState,
 } from "@/domain/yc/types/yc"
 import type { YCCompanyFilters } from "@/infrastructure/ycApi"
 import {
+  getFacets,
   getMeta,
+  getSyncRuns,
   getSyncState,
   listCompanies,
+  listFounderCompanies,
   triggerSync,
 } from "@/use_cases/ycService"
 
@@ -47,7 +53,7 @@ export function useYCCompanies(
   const pageSize = isPaid ? PAID_PAGE_SIZE : FREE_PAGE_SIZE
   const totalPages = companies
     ? isPaid
-      ? Math.max(1, Math.ceil(companies.count / pageSize))
+      ? Math.max(1, Math.ceil((companies.count ?? 0) / pageSize))
       : 1
     : 1
   const canNext = page < totalPages
@@ -92,8 +98,61 @@ export function useYCMeta() {
   return { meta, loading, error, reload: load }
 }
 
+export function useYCFacets(filters: YCCompanyFilters, enabled: boolean) {
+  const [facets, setFacets] = useState<YCFacets | null>(null)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    if (!enabled) return
+    let cancelled = false
+    setError(null)
+    getFacets(filters)
+      .then((data) => {
+        if (!cancelled) setFacets(data)
+      })
+      .catch((e) => {
+        if (!cancelled) setError((e as Error).message)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [enabled, filters.q, filters.fuzzy, filters.batch, filters.year, filters.status_filter, filters.industry, filters.is_hiring, filters.nonprofit, filters.top_company])
+
+  return { facets, error }
+}
+
+export function useYCFounderCompanies(founderId: string | null) {
+  const [companies, setCompanies] = useState<YCCompany[]>([])
+  const [loading, setLoading] = useState(false)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    setCompanies([])
+    if (!founderId) return
+    let cancelled = false
+    setLoading(true)
+    setError(null)
+    listFounderCompanies(founderId)
+      .then((data) => {
+        if (!cancelled) setCompanies(data.data)
+      })
+      .catch((e) => {
+        if (!cancelled) setError((e as Error).message)
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [founderId])
+
+  return { companies, loading, error }
+}
+
 export function useYCSync() {
   const [syncState, setSyncState] = useState<YCSyncState | null>(null)
+  const [runs, setRuns] = useState<YCSyncRun[]>([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
   const [message, setMessage] = useState<string | null>(null)
@@ -102,8 +161,9 @@ export function useYCSync() {
     setLoading(true)
     setError(null)
     try {
-      const data = await getSyncState()
+      const [data, history] = await Promise.all([getSyncState(), getSyncRuns()])
       setSyncState(data)
+      setRuns(history.data)
     } catch (e) {
       setError((e as Error).message)
     } finally {
@@ -125,6 +185,6 @@ export function useYCSync() {
     }
   }
 
-  return { syncState, loading, error, message, syncNow, reload: loadState }
+  return { syncState, runs, loading, error, message, syncNow, reload: loadState }
 }
 
@@ -1,4 +1,5 @@
 export interface YCFounder {
+  id: string
   name: string
   twitter_url?: string | null
   linkedin_url?: string | null
@@ -30,7 +31,11 @@ export interface YCCompany {
 
 export interface YCCompanies {
   data: YCCompany[]
-  count: number
+  // null for cursor pages requested without include_count
+  count: number | null
+  // count is the query planner's estimate, for large searches
+  count_estimated?: boolean
+  next_cursor?: string | null
 }
 
 export interface YCSearchMeta {
@@ -40,6 +45,22 @@ export interface YCSearchMeta {
   industries: string[]
 }
 
+export interface YCFacetCount {
+  value: string | number | boolean
+  // Companies listed with this value chosen, the other filters unchanged
+  count: number
+}
+
+export interface YCFacets {
+  statuses: YCFacetCount[]
+  industries: YCFacetCount[]
+  years: YCFacetCount[]
+  batches: YCFacetCount[]
+  is_hiring: YCFacetCount[]
+  nonprofit: YCFacetCount[]
+  top_company: YCFacetCount[]
+}
+
 export interface YCSyncState {
   last_started_at: string | null
   last_finished_at: string | null
@@ -48,3 +69,50 @@ export interface YCSyncState {
   last_item_count: number | null
 }
 
+export interface YCSyncStageMemory {
+  stage: string
+  checkpoints: number
+  rss_mb: number
+  traced_mb: number
+  peak_traced_mb: number
+}
+
+export interface YCSyncAllocationSite {
+  site: string
+  size_kb: number
+  count: number
+}
+
+export interface YCSyncMemoryProfile {
+  stages: YCSyncStageMemory[]
+  top_sites_stage: string | null
+  top_sites: YCSyncAllocationSite[]
+}
+
+export interface YCSyncRun {
+  id: string
+  run_id: string | null
+  resumed: boolean
+  status: string
+  error: string | null
+  started_at: string
+  finished_at: string
+  download_seconds: number
+  parse_seconds: number
+  company_upsert_seconds: number
+  founder_crawl_seconds: number
+  pages_fetched: number
+  pages_not_modified: number
+  pages_failed: number
+  bytes_downloaded: number
+  companies_parsed: number
+  founders_parsed: number
+  company_rows_written: number
+  founder_rows_written: number
+  memory_profile: YCSyncMemoryProfile | null
+}
+
+export interface YCSyncRuns {
+  data: YCSyncRun[]
+}
+
@@ -1,12 +1,15 @@
 import type {
   YCCompanies,
+  YCFacets,
   YCSearchMeta,
+  YCSyncRuns,
   YCSyncState,
 } from "@/domain/yc/types/yc"
 import { httpRequest } from "@/pkg/httpClient"
 
 export interface YCCompanyFilters {
   q?: string
+  fuzzy?: boolean
   batch?: string
   year?: number
   status_filter?: string
@@ -16,6 +19,9 @@ export interface YCCompanyFilters {
   top_company?: boolean
   skip?: number
   limit?: number
+  // Keyset pagination: "" for the first page, then each page's next_cursor
+  cursor?: string
+  include_count?: boolean
 }
 
 export async function listYCCompanies(
@@ -29,6 +35,26 @@ export async function listYCCompanies(
   })
 }
 
+export async function listYCFounderCompanies(
+  founderId: string,
+): Promise<YCCompanies> {
+  return httpRequest<YCCompanies>({
+    path: `/yc/founders/${founderId}/companies`,
+    method: "GET",
+  })
+}
+
+export async function getYCFacets(
+  filters: YCCompanyFilters = {},
+): Promise<YCFacets> {
+  const { skip: _skip, limit: _limit, cursor: _cursor, include_count: _count, ...query } = filters
+  return httpRequest<YCFacets>({
+    path: "/yc/facets",
+    method: "GET",
+    query: query as Record<string, string | number | boolean | undefined>,
+  })
+}
+
 export async function getYCMeta(): Promise<YCSearchMeta> {
   return httpRequest<YCSearchMeta>({
     path: "/yc/meta",
@@ -43,6 +69,14 @@ export async function getYCSyncState(): Promise<YCSyncState> {
   })
 }
 
+export async function getYCSyncRuns(limit = 20): Promise<YCSyncRuns> {
+  return httpRequest<YCSyncRuns>({
+    path: "/admin/sync-runs",
+    method: "GET",
+    query: { limit },
+  })
+}
+
 export async function syncYCNow(): Promise<{ message: string }> {
   return httpRequest<{ message: string }>({
     path: "/admin/sync",
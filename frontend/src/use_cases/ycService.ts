@@ -1,12 +1,17 @@
 import type {
   YCCompanies,
+  YCFacets,
   YCSearchMeta,
+  YCSyncRuns,
   YCSyncState,
 } from "@/domain/yc/types/yc"
 import {
+  getYCFacets,
   getYCMeta,
+  getYCSyncRuns,
   getYCSyncState,
   listYCCompanies,
+  listYCFounderCompanies,
   syncYCNow,
   type YCCompanyFilters,
 } from "@/infrastructure/ycApi"
@@ -17,6 +22,18 @@ export async function listCompanies(
   return listYCCompanies(filters)
 }
 
+export async function listFounderCompanies(
+  founderId: string,
+): Promise<YCCompanies> {
+  return listYCFounderCompanies(founderId)
+}
+
+export async function getFacets(
+  filters: YCCompanyFilters = {},
+): Promise<YCFacets> {
+  return getYCFacets(filters)
+}
+
 export async function getMeta(): Promise<YCSearchMeta> {
   return getYCMeta()
 }
@@ -25,6 +42,10 @@ export async function getSyncState(): Promise<YCSyncState> {
   return getYCSyncState()
 }
 
+export async function getSyncRuns(limit?: number): Promise<YCSyncRuns> {
+  return getYCSyncRuns(limit)
+}
+
 export async function triggerSync(): Promise<{ message: string }> {
   return syncYCNow()
 }